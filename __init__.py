@@ -11,6 +11,7 @@ bl_info = {
 
 import bpy
 from . import data, operators, ui
+from .profiling import log
 
 
 # ─────────── Register/UnRegister ───────────
@@ -18,13 +19,13 @@ def register():
     data.register()
     operators.register()
     ui.register()
-    print("RENAMER loaded!")
+    log.info("RENAMER loaded")
 
 def unregister():
     ui.unregister()
     operators.unregister()
     data.unregister()
-    print("RENAMER unloaded!")
+    log.info("RENAMER unloaded")
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -0,0 +1,272 @@
+"""
+Headless batch renaming across many .blend files, using the same rules and the
+same rename path (planner + Execute) as the panel.
+
+    blender -b --factory-startup --python batch.py -- --rules rules.json "library/**/*.blend"
+    python batch.py --blender /path/to/blender --workers 8 --rules rules.json --files-from list.txt
+
+The coordinator (plain Python or Blender) spreads the files over a pool of
+worker Blender processes. Each worker opens, renames and saves every file it
+is given exactly once, and the coordinator merges all results into one JSON
+report with a files-per-minute figure.
+
+Rule file:
+    {
+      "targets": ["objects", "materials", "bones"],
+      "match": "SM_*",
+      "rules": [
+        {"op": "strip", "chars": " _"},
+        {"op": "replace", "find": "geo", "replace": "mesh", "mode": "LITERAL", "case_sensitive": false},
+        {"op": "prefix", "text": "SM_"},
+        {"op": "suffix", "text": "_LOD0"},
+        {"op": "case", "mode": "UPPER"},
+        {"op": "sequence", "base": "Prop_", "start": "1", "last": "", "reverse": false},
+        {"op": "mirror"}
+      ]
+    }
+targets are source types (objects, materials, actions, bones, vertex_groups,
+shape_keys, uv_maps); match is an optional glob on the current name; rules
+are chained, each starting from the previous rule's result, and a rule with
+"enabled": false is skipped. Pipeline presets saved from the panel use the
+same "rules" list.
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+SOURCE_TYPES = ("objects", "materials", "actions", "bones", "vertex_groups", "shape_keys", "uv_maps")
+
+
+# ─────────── Rules & Files ───────────
+def load_rules(path):
+    with open(path, encoding="utf-8") as fh:
+        spec = json.load(fh)
+    targets = spec.get("targets") or ["objects"]
+    unknown = set(targets) - set(SOURCE_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown target(s) {', '.join(sorted(unknown))}; expected {', '.join(SOURCE_TYPES)}")
+    _addon_module("planner").check_rules(spec.get("rules", []))
+    spec["targets"] = targets
+    return spec
+
+
+def expand_files(patterns, files_from=None):
+    """Resolve globs (recursive **) and list files into unique, sorted .blend paths."""
+    if files_from:
+        with open(files_from, encoding="utf-8") as fh:
+            patterns = list(patterns) + [line.strip() for line in fh if line.strip()]
+    files = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        files.update(os.path.abspath(f) for f in matches if f.endswith(".blend") and os.path.isfile(f))
+    return sorted(files)
+
+
+def _addon_module(name):
+    """
+    Import an addon submodule. Run as a script, this folder is registered as a
+    bare package first, so __init__ (which needs bpy) is never executed and the
+    coordinator works on plain Python.
+    """
+    package = __package__
+    if not package:
+        package = "renamer_batch"
+        if package not in sys.modules:
+            module = types.ModuleType(package)
+            module.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+            sys.modules[package] = module
+    return importlib.import_module(f"{package}.{name}")
+
+
+# ─────────── Worker (inside Blender) ───────────
+def collect_file_rows(targets, match=""):
+    """Rows for every datablock of the target types in the open file (not just the selection)."""
+    import bpy
+    planner = _addon_module("planner")
+    # The panel's GLOB mode, compiled once for every name of the file
+    matches = _addon_module("utils").compile_pattern(match, "GLOB", True).match if match else None
+    rows = []
+
+    def add(owner, name, source):
+        rows.append(planner.Row(owner.name if owner else "", name, source,
+                                selected=matches is None or matches(name) is not None))
+
+    if "objects" in targets:
+        for obj in bpy.data.objects: add(obj, obj.name, "objects")
+    if "materials" in targets:
+        for mat in bpy.data.materials: add(None, mat.name, "materials")
+    if "actions" in targets:
+        for act in bpy.data.actions: add(None, act.name, "actions")
+
+    # Per-owner namespaces: visit each armature / mesh / key once, through one of its users
+    seen = set()
+    for obj in bpy.data.objects:
+        data = obj.data
+        if obj.type == "ARMATURE" and "bones" in targets and data.as_pointer() not in seen:
+            seen.add(data.as_pointer())
+            for bone in data.bones: add(obj, bone.name, "bones")
+        if obj.type != "MESH":
+            continue
+        if "vertex_groups" in targets:
+            for vg in obj.vertex_groups: add(obj, vg.name, "vertex_groups")
+        if "uv_maps" in targets and ("uv", data.as_pointer()) not in seen:
+            seen.add(("uv", data.as_pointer()))
+            for uv in data.uv_layers: add(obj, uv.name, "uv_maps")
+        key = data.shape_keys
+        if "shape_keys" in targets and key and key.as_pointer() not in seen:
+            seen.add(key.as_pointer())
+            for kb in key.key_blocks: add(obj, kb.name, "shape_keys")
+    return rows
+
+
+def rename_file(path, spec, dry_run=False):
+    """Open, rename and save one file. Returns its result record."""
+    import bpy
+    planner = _addon_module("planner")
+    operators = _addon_module("operators")
+    start = time.perf_counter()
+    result = {"file": path, "rows": 0, "renamed": 0, "messages": [], "error": None}
+    try:
+        bpy.ops.wm.open_mainfile(filepath=path, load_ui=False)
+        rows = collect_file_rows(spec["targets"], spec.get("match", ""))
+        planner.apply_rules(rows, spec.get("rules", []))
+        renamed, messages = operators.apply_renames(rows)
+        result["rows"] = len(rows)
+        result["renamed"] = len(renamed)
+        result["messages"] = [text for _, text in messages]
+        if renamed and not dry_run:
+            bpy.ops.wm.save_mainfile(filepath=path)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def worker_main(args):
+    spec = load_rules(args.rules)
+    results = [rename_file(path, spec, args.dry_run) for path in args.files]
+    with open(args.result, "w", encoding="utf-8") as fh:
+        json.dump(results, fh)
+
+
+# ─────────── Coordinator ───────────
+def find_blender(explicit=None):
+    if explicit:
+        return explicit
+    try:
+        import bpy
+        if bpy.app.binary_path:
+            return bpy.app.binary_path
+    except ImportError:
+        pass
+    return os.environ.get("BLENDER") or shutil.which("blender") or "blender"
+
+
+def run_chunk(blender, rules, files, dry_run, timeout):
+    """Run one worker Blender process over a chunk of files and return its results."""
+    fd, result_path = tempfile.mkstemp(prefix="renamer_", suffix=".json")
+    os.close(fd)
+    cmd = [blender, "-b", "--factory-startup", "--python", os.path.abspath(__file__), "--",
+           "--worker", "--rules", os.path.abspath(rules), "--result", result_path]
+    if dry_run:
+        cmd.append("--dry-run")
+    cmd.extend(files)
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        try:
+            with open(result_path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            tail = (proc.stderr or proc.stdout or "").strip().splitlines()[-5:]
+            error = f"worker exited with {proc.returncode}: {' | '.join(tail)}"
+    except subprocess.TimeoutExpired:
+        error = f"worker timed out after {timeout}s"
+    finally:
+        if os.path.exists(result_path):
+            os.remove(result_path)
+    return [{"file": f, "rows": 0, "renamed": 0, "messages": [], "error": error, "seconds": 0.0} for f in files]
+
+
+def coordinate(args):
+    load_rules(args.rules)  # fail fast on a bad rule file
+    files = expand_files(args.files, args.files_from)
+    if not files:
+        raise SystemExit("No .blend files matched.")
+
+    blender = find_blender(args.blender)
+    workers = max(1, min(args.workers, len(files)))
+    # Small chunks keep the pool balanced; each chunk still amortizes one Blender startup
+    size = args.chunk or max(1, min(16, len(files) // (workers * 4) or 1))
+    chunks = [files[i:i + size] for i in range(0, len(files), size)]
+
+    start = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_chunk, blender, args.rules, chunk, args.dry_run, args.timeout) for chunk in chunks]
+        for future in as_completed(futures):
+            for result in future.result():
+                results.append(result)
+                status = "ERROR " + result["error"] if result["error"] else f"{result['renamed']} renamed"
+                print(f"[{len(results)}/{len(files)}] {result['file']}: {status}", flush=True)
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["file"])
+    failed = sum(1 for r in results if r["error"])
+    report = {
+        "rules": os.path.abspath(args.rules),
+        "blender": blender,
+        "workers": workers,
+        "dry_run": args.dry_run,
+        "files": len(files),
+        "failed": failed,
+        "renamed": sum(r["renamed"] for r in results),
+        "seconds": elapsed,
+        "files_per_minute": len(files) / elapsed * 60 if elapsed else 0.0,
+        "results": results,
+    }
+    with open(args.report, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"{len(files)} files, {failed} failed, {report['renamed']} renamed in {elapsed:.1f}s "
+          f"({report['files_per_minute']:.1f} files/min) → {args.report}")
+    return 1 if failed else 0
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help=".blend files or glob patterns (quote them)")
+    parser.add_argument("--rules", required=True, help="JSON rule file")
+    parser.add_argument("--files-from", help="text file with one path or pattern per line")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parallel Blender processes")
+    parser.add_argument("--chunk", type=int, default=0, help="files per worker process (default: auto)")
+    parser.add_argument("--blender", help="Blender executable (default: this Blender, $BLENDER or PATH)")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds before a worker is killed")
+    parser.add_argument("--report", default="renamer_batch_report.json", help="JSON report path")
+    parser.add_argument("--dry-run", action="store_true", help="plan and report without saving")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    args = parse_args(argv)
+    if args.worker:
+        worker_main(args)
+        return 0
+    return coordinate(args)
+
+
+if __name__ == "__main__":
+    code = main()
+    if code:
+        sys.exit(code)
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark: legacy regex cascade vs. the compiled single-pass mirror engine.
+
+Runs outside Blender (utils.py has no bpy dependency):
+    python benchmarks/bench_mirror.py [count]
+"""
+import importlib.util
+import os
+import re
+import sys
+import timeit
+
+
+# ─────────── Load utils.py without importing the addon package (needs bpy) ───────────
+def _load_utils():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils.py")
+    spec = importlib.util.spec_from_file_location("renamer_utils", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ─────────── Previous implementation, kept only for comparison ───────────
+def legacy_mirror_name(name: str) -> str:
+    long_pairs = [
+        ("Left", "Right"), ("left", "right"), ("LEFT", "RIGHT"),
+        ("Lt", "Rt"), ("lt", "rt"), ("LT", "RT"),
+        ("Lf", "Rf"), ("lf", "rf"), ("LF", "RF"),
+    ]
+    sep_before = r"(^|[^A-Za-z0-9])"
+    sep_after = r"([^A-Za-z0-9]|$)"
+    for idx, (l, r) in enumerate(long_pairs):
+        placeholder = f"__TMP_{idx}__"
+        name = re.sub(sep_before + re.escape(l) + sep_after,
+                      lambda m: m.group(1) + placeholder + m.group(2), name)
+        name = re.sub(sep_before + re.escape(r) + sep_after,
+                      lambda m: m.group(1) + l + m.group(2), name)
+        name = name.replace(placeholder, r)
+    suffix_patterns = [
+        (r"([._])L(\b|$)", r"\1__TMP_R__\2"),
+        (r"([._])R(\b|$)", r"\1L\2"),
+        (r"__TMP_R__", "R"),
+        (r"([._])l(\b|$)", r"\1__TMP_r__\2"),
+        (r"([._])r(\b|$)", r"\1l\2"),
+        (r"__TMP_r__", "r"),
+    ]
+    for pat, rep in suffix_patterns:
+        name = re.sub(pat, rep, name)
+    return name
+
+
+def make_names(count):
+    sides = [".L", ".R", "_l", "_r", "_Left", "_Right", "_Lt", "_Rf", ""]
+    return [f"DEF-bone_{i:05d}{sides[i % len(sides)]}" for i in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    utils = _load_utils()
+    names = make_names(count)
+
+    assert [legacy_mirror_name(n) for n in names] == utils.mirror_names(names)
+
+    legacy = min(timeit.repeat(lambda: [legacy_mirror_name(n) for n in names], number=1, repeat=5))
+    utils.mirror_name.cache_clear()
+    cold = timeit.timeit(lambda: utils.mirror_names(names), number=1)
+    warm = min(timeit.repeat(lambda: utils.mirror_names(names), number=1, repeat=5))
+
+    print(f"{count} names")
+    print(f"  legacy cascade : {legacy * 1000:8.2f} ms")
+    print(f"  single pass    : {cold * 1000:8.2f} ms  ({legacy / cold:5.1f}x)")
+    print(f"  memoized batch : {warm * 1000:8.2f} ms  ({legacy / warm:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,503 @@
+"""
+Minimal stand-in for the `bpy` module, enough to register RENAMER and drive
+populate → transform → execute headless on a plain Python install.
+
+It models what RENAMER touches: property groups with defaults and update
+callbacks, RNA-like collections (add/remove/move/foreach_get/foreach_set),
+named datablock collections that enforce unique names the way Blender does
+(63-byte truncation, .001 suffixes), and a context with a selection.
+
+    import fake_bpy
+    bpy = fake_bpy.install()          # registers bpy, bpy.types, ... in sys.modules
+"""
+import sys
+import types
+
+
+MAX_NAME_BYTES = 63
+
+
+# ─────────── Properties ───────────
+class _Prop:
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.default = kwargs.get("default")
+        self.update = kwargs.get("update")
+        self.type = kwargs.get("type")
+        self.items = kwargs.get("items")
+        if self.default is None and self.kind == "enum" and self.items and not callable(self.items):
+            self.default = self.items[0][0]
+        if self.default is None:
+            self.default = {"string": "", "bool": False, "int": 0, "float": 0.0}.get(kind)
+
+    def make_default(self):
+        if self.kind == "collection":
+            return PropCollection(self.type)
+        if self.kind == "pointer":
+            return self.type()
+        return self.default
+
+    # Used for PointerProperty assigned onto an ID type (e.g. Scene.renamer_props)
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        pointers = obj.__dict__.setdefault("_pointers", {})
+        if id(self) not in pointers:
+            pointers[id(self)] = self.type()
+        return pointers[id(self)]
+
+
+def _prop_factory(kind):
+    return lambda **kwargs: _Prop(kind, **kwargs)
+
+
+def _annotations(cls):
+    result = {}
+    for klass in reversed(cls.__mro__):
+        result.update(getattr(klass, "__annotations__", {}))
+    return {k: v for k, v in result.items() if isinstance(v, _Prop)}
+
+
+class _PropertyOwner:
+    def __init__(self):
+        for name, prop in _annotations(type(self)).items():
+            object.__setattr__(self, name, prop.make_default())
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        prop = _annotations(type(self)).get(name)
+        if prop is not None and prop.update is not None:
+            prop.update(self, context)
+
+
+class PropCollection:
+    """RNA CollectionProperty lookalike."""
+
+    def __init__(self, item_type):
+        self._type = item_type
+        self._items = []
+
+    def add(self):
+        item = self._type()
+        self._items.append(item)
+        return item
+
+    def remove(self, index):
+        del self._items[index]
+
+    def move(self, src, dst):
+        self._items.insert(dst, self._items.pop(src))
+
+    def clear(self):
+        self._items.clear()
+
+    def foreach_get(self, attr, seq):
+        seq[:] = [getattr(item, attr) for item in self._items]
+
+    def foreach_set(self, attr, seq):
+        for item, value in zip(self._items, seq):
+            object.__setattr__(item, attr, value)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __bool__(self):
+        return bool(self._items)
+
+
+# ─────────── Datablocks ───────────
+def _truncate(name):
+    return name.encode("utf-8")[:MAX_NAME_BYTES].decode("utf-8", "ignore")
+
+
+class Named:
+    """Anything with a name that is unique inside its owning NamedCollection."""
+
+    def __init__(self, name):
+        self._owner = None
+        self._name = _truncate(name)
+        self.library = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        value = _truncate(value)
+        if self._owner is not None:
+            value = self._owner._rename(self, value)
+        self._name = value
+
+    def as_pointer(self):
+        return id(self)
+
+    @property
+    def original(self):
+        return self
+
+
+class NamedCollection:
+    """bpy_prop_collection of named items, with Blender's unique-name rule."""
+
+    def __init__(self, factory=None):
+        self._factory = factory
+        self._by_name = {}
+        self._items = []
+
+    def _unique(self, name):
+        if name not in self._by_name:
+            return name
+        base = name
+        num = 1
+        while True:
+            candidate = f"{_truncate(base[:MAX_NAME_BYTES - 4])}.{num:03d}"
+            if candidate not in self._by_name:
+                return candidate
+            num += 1
+
+    def _rename(self, item, name):
+        if name == item._name:
+            return name
+        del self._by_name[item._name]
+        name = self._unique(name)
+        self._by_name[name] = item
+        return name
+
+    def link(self, item):
+        item._name = self._unique(item._name)
+        item._owner = self
+        self._by_name[item._name] = item
+        self._items.append(item)
+        return item
+
+    def new(self, name, *args, **kwargs):
+        return self.link(self._factory(name, *args, **kwargs))
+
+    def get(self, name, default=None):
+        return self._by_name.get(name, default)
+
+    def remove(self, item, do_unlink=True):
+        self._items.remove(item)
+        del self._by_name[item._name]
+        item._owner = None
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._by_name[key]
+        return self._items[key]
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def keys(self):
+        return [item._name for item in self._items]
+
+    def foreach_get(self, attr, seq):
+        values = []
+        for item in self._items:
+            value = getattr(item, attr)
+            values.extend(value if isinstance(value, (list, tuple)) else (value,))
+        seq[:] = values
+
+
+class Bone(Named):
+    def __init__(self, name):
+        super().__init__(name)
+        self.select = False
+        self.parent = None
+        self.head = (0.0, 0.0, 0.0)
+        self.use_deform = True
+
+    @property
+    def head_local(self):
+        return self.head
+
+
+class Armature(Named):
+    def __init__(self, name):
+        super().__init__(name)
+        self.bones = NamedCollection(Bone)
+        self.edit_bones = self.bones
+        self.is_editmode = False
+
+
+class KeyBlock(Named):
+    pass
+
+
+class Key(Named):
+    def __init__(self, name):
+        super().__init__(name)
+        self.key_blocks = NamedCollection(KeyBlock)
+        self.user = None
+
+    @property
+    def reference_key(self):
+        return self.key_blocks[0] if len(self.key_blocks) else None
+
+
+class Mesh(Named):
+    def __init__(self, name):
+        super().__init__(name)
+        self.uv_layers = NamedCollection(Named)
+        self.shape_keys = None
+
+
+class Material(Named):
+    pass
+
+
+class Action(Named):
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = []
+        self.groups = []
+
+
+class MaterialSlot:
+    def __init__(self, material=None):
+        self.material = material
+
+
+class AnimData:
+    def __init__(self, action=None):
+        self.action = action
+
+
+class Object(Named):
+    def __init__(self, name, data=None):
+        super().__init__(name)
+        self.data = data
+        self.type = {Mesh: "MESH", Armature: "ARMATURE"}.get(type(data), "EMPTY")
+        self.mode = "OBJECT"
+        self.vertex_groups = NamedCollection(Named)
+        self.material_slots = []
+        self.animation_data = None
+        self.constraints = []
+        self.modifiers = []
+        self.pose = None
+        self.parent = None
+        self.select = False
+        # Flat, column-major like foreach_get("matrix_world") returns it
+        self.matrix_world = [1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1.0]
+
+    def shape_key_add(self, name="Key"):
+        if self.data.shape_keys is None:
+            self.data.shape_keys = data.shape_keys.new(f"Key_{self.data.name}")
+            self.data.shape_keys.user = self.data
+        return self.data.shape_keys.key_blocks.new(name)
+
+    def shape_key_remove(self, key_block):
+        self.data.shape_keys.key_blocks.remove(key_block)
+
+    def select_get(self):
+        return self.select
+
+    def select_set(self, state):
+        self.select = state
+
+
+class BlendData:
+    def __init__(self):
+        self.objects = NamedCollection(Object)
+        self.meshes = NamedCollection(Mesh)
+        self.armatures = NamedCollection(Armature)
+        self.materials = NamedCollection(Material)
+        self.actions = NamedCollection(Action)
+        self.shape_keys = NamedCollection(Key)
+        self.images = NamedCollection(Named)
+        self.node_groups = NamedCollection(Named)
+        self.collections = NamedCollection(Named)
+
+    def batch_remove(self, ids):
+        for datablock in list(ids):
+            datablock._owner.remove(datablock)
+
+
+# ─────────── Context ───────────
+class Scene(_PropertyOwner):
+    def as_pointer(self):
+        return id(self)
+
+
+class LayerObjects:
+    def __init__(self):
+        self.active = None
+
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = LayerObjects()
+
+
+class Context:
+    def __init__(self):
+        self.scene = Scene()
+        self.view_layer = ViewLayer()
+        self.screen = None
+        self.window_manager = None
+        self.mode = "OBJECT"
+
+    @property
+    def selected_objects(self):
+        return [obj for obj in data.objects if obj.select]
+
+    @property
+    def active_object(self):
+        return self.view_layer.objects.active
+
+
+# ─────────── Module surface ───────────
+class Operator:
+    def __init__(self):
+        self.reports = []
+        for name, prop in _annotations(type(self)).items():
+            setattr(self, name, prop.make_default())
+
+    def report(self, level, message):
+        self.reports.append((set(level), message))
+
+
+class PropertyGroup(_PropertyOwner):
+    def as_pointer(self):
+        return id(self)
+
+
+class _UIBase:
+    pass
+
+
+class _Timers:
+    def __init__(self):
+        self.pending = []
+
+    def register(self, func, first_interval=0.0, persistent=False):
+        self.pending.append(func)
+
+    def is_registered(self, func):
+        return func in self.pending
+
+    def unregister(self, func):
+        self.pending.remove(func)
+
+    def run_all(self):
+        """Fire every pending timer once (headless stand-in for the event loop)."""
+        while self.pending:
+            func = self.pending.pop(0)
+            interval = func()
+            if interval is not None:
+                self.pending.append(func)
+                break
+
+
+class KDTree:
+    """mathutils.kdtree.KDTree lookalike (brute force)."""
+
+    def __init__(self, size):
+        self._points = []
+
+    def insert(self, co, index):
+        self._points.append((tuple(co), index))
+
+    def balance(self):
+        pass
+
+    def find_n(self, co, n):
+        found = [(p, index, sum((a - b) ** 2 for a, b in zip(p, co)) ** 0.5) for p, index in self._points]
+        found.sort(key=lambda hit: hit[2])
+        return found[:n]
+
+
+def _persistent(func):
+    return func
+
+
+def _mode_set(mode="OBJECT"):
+    obj = context.view_layer.objects.active
+    if obj is not None:
+        obj.mode = mode
+    context.mode = {"EDIT": "EDIT_ARMATURE" if obj and obj.type == "ARMATURE" else "EDIT_MESH"}.get(mode, mode)
+    return {'FINISHED'}
+
+
+data = BlendData()
+context = Context()
+
+
+def reset():
+    """Start from an empty file: fresh data and context."""
+    global data, context
+    data = BlendData()
+    context = Context()
+    bpy = sys.modules.get("bpy")
+    if bpy is not None:
+        bpy.data = data
+        bpy.context = context
+    return data, context
+
+
+def install():
+    """Register the fake as `bpy` (and its submodules) in sys.modules and return it."""
+    bpy = types.ModuleType("bpy")
+    bpy_types = types.ModuleType("bpy.types")
+    bpy_props = types.ModuleType("bpy.props")
+    bpy_app = types.ModuleType("bpy.app")
+    bpy_handlers = types.ModuleType("bpy.app.handlers")
+    mathutils = types.ModuleType("mathutils")
+    mathutils.kdtree = types.ModuleType("mathutils.kdtree")
+    mathutils.kdtree.KDTree = KDTree
+
+    for name in ("Operator", "PropertyGroup", "Scene", "Object", "Armature", "Mesh", "Material", "Action", "Key",
+                 "LayerObjects"):
+        setattr(bpy_types, name, globals()[name])
+    for name in ("Panel", "UIList", "Menu", "UI_UL_list"):
+        setattr(bpy_types, name, type(name, (_UIBase,), {}))
+
+    for kind, name in (("string", "StringProperty"), ("bool", "BoolProperty"), ("int", "IntProperty"),
+                       ("float", "FloatProperty"), ("enum", "EnumProperty"),
+                       ("collection", "CollectionProperty"), ("pointer", "PointerProperty")):
+        setattr(bpy_props, name, _prop_factory(kind))
+
+    bpy_handlers.persistent = _persistent
+    bpy_handlers.depsgraph_update_post = []
+    bpy_handlers.load_post = []
+    bpy_handlers.undo_post = []
+    bpy_handlers.redo_post = []
+    bpy_app.handlers = bpy_handlers
+    bpy_app.timers = _Timers()
+    bpy_app.background = True
+    bpy_app.version = (3, 6, 0)
+
+    bpy.types = bpy_types
+    bpy.props = bpy_props
+    bpy.app = bpy_app
+    bpy.data = data
+    bpy.context = context
+    bpy.msgbus = types.SimpleNamespace(subscribe_rna=lambda **kw: None, clear_by_owner=lambda owner: None)
+    bpy.utils = types.SimpleNamespace(register_class=lambda cls: None, unregister_class=lambda cls: None)
+    bpy.ops = types.SimpleNamespace(object=types.SimpleNamespace(mode_set=_mode_set))
+    bpy.path = types.SimpleNamespace(abspath=lambda path: path)
+
+    sys.modules.update({
+        "bpy": bpy,
+        "bpy.types": bpy_types,
+        "bpy.props": bpy_props,
+        "bpy.app": bpy_app,
+        "bpy.app.handlers": bpy_handlers,
+        "mathutils": mathutils,
+        "mathutils.kdtree": mathutils.kdtree,
+    })
+    return bpy
@@ -0,0 +1,237 @@
+"""
+Headless RENAMER driver: loads the addon, builds synthetic scenes and runs
+operators, either against fake_bpy on plain Python or inside Blender
+(`blender -b --python ...`). Running this file does the populate → prefix →
+sequence → execute flow with timings:
+
+    python benchmarks/harness.py [count]
+    blender -b --factory-startup --python benchmarks/harness.py -- [count]
+"""
+import importlib.util
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import fake_bpy  # noqa: E402
+
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = "renamer"
+
+
+def script_args():
+    """Arguments meant for the script (after `--` when run through Blender)."""
+    argv = sys.argv
+    return argv[argv.index("--") + 1:] if "--" in argv else argv[1:]
+
+
+def _import_addon(name):
+    if name in sys.modules:
+        return sys.modules[name], False
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(ADDON_DIR, "__init__.py"), submodule_search_locations=[ADDON_DIR])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[name] = addon
+    spec.loader.exec_module(addon)
+    return addon, True
+
+
+# ─────────── Backends ───────────
+class FakeBackend:
+    """RENAMER on fake_bpy: no Blender needed."""
+    name = "fake"
+
+    def __init__(self):
+        self.bpy = fake_bpy.install()
+        self.addon, fresh = _import_addon(ADDON_NAME)
+        if fresh:
+            self.addon.register()
+
+    @property
+    def version(self):
+        return "fake_bpy"
+
+    def new_file(self):
+        fake_bpy.reset()
+
+    def flush(self):
+        """Run deferred work (timers) the way Blender's event loop would."""
+        self.bpy.app.timers.run_all()
+
+    def run_operator(self, idname, **props):
+        ops = self.addon.operators
+        op_cls = next(cls for cls in ops.classes if cls.bl_idname == idname)
+        op = op_cls()
+        for key, value in props.items():
+            setattr(op, key, value)
+        result = op.execute(self.bpy.context)
+        self.flush()
+        return result
+
+    def build_objects(self, count, select=True):
+        objects = [self.bpy.data.objects.link(fake_bpy.Object(f"Prop_{i:06d}")) for i in range(count)]
+        for obj in objects:
+            obj.select_set(select)
+        return objects
+
+    def build_armature(self, count, sides=(".L", ".R")):
+        arm = self.bpy.data.armatures.link(fake_bpy.Armature("Rig"))
+        for i in range(count):
+            arm.bones.new(bone_name(i, sides))
+        obj = self.bpy.data.objects.link(fake_bpy.Object("Rig", arm))
+        self._make_active(obj)
+        return obj
+
+    def build_mesh(self, vertex_groups=0, shape_keys=0, uv_maps=0):
+        mesh = self.bpy.data.meshes.link(fake_bpy.Mesh("Body"))
+        obj = self.bpy.data.objects.link(fake_bpy.Object("Body", mesh))
+        for i in range(vertex_groups):
+            obj.vertex_groups.new(f"group_{i:06d}")
+        for i in range(shape_keys):
+            obj.shape_key_add(name="Basis" if i == 0 else f"shape_{i:06d}")
+        for i in range(uv_maps):
+            mesh.uv_layers.new(f"UVMap_{i:03d}")
+        self._make_active(obj)
+        return obj
+
+    def _make_active(self, obj):
+        obj.select_set(True)
+        self.bpy.context.view_layer.objects.active = obj
+
+
+class BlenderBackend:
+    """RENAMER inside a real (usually background) Blender session."""
+    name = "blender"
+
+    def __init__(self):
+        import bpy
+        self.bpy = bpy
+        self.addon, fresh = _import_addon(ADDON_NAME)
+        if fresh:
+            self.addon.register()
+
+    @property
+    def version(self):
+        return self.bpy.app.version_string
+
+    def new_file(self):
+        bpy = self.bpy
+        if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        bpy.ops.wm.read_homefile(use_empty=True)
+
+    def flush(self):
+        # Timers do not run without an event loop; run the deferred validation directly
+        scene = self.bpy.context.scene
+        self.addon.operators.validate_items(scene.renamer_props)
+
+    def run_operator(self, idname, **props):
+        module, name = idname.split(".")
+        result = getattr(getattr(self.bpy.ops, module), name)(**props)
+        self.flush()
+        return result
+
+    def build_objects(self, count, select=True):
+        bpy = self.bpy
+        link = bpy.context.scene.collection.objects.link
+        objects = []
+        for i in range(count):
+            obj = bpy.data.objects.new(f"Prop_{i:06d}", None)
+            link(obj)
+            obj.select_set(select)
+            objects.append(obj)
+        return objects
+
+    def build_armature(self, count, sides=(".L", ".R")):
+        bpy = self.bpy
+        arm = bpy.data.armatures.new("Rig")
+        obj = bpy.data.objects.new("Rig", arm)
+        bpy.context.scene.collection.objects.link(obj)
+        self._make_active(obj)
+        bpy.ops.object.mode_set(mode='EDIT')
+        for i in range(count):
+            bone = arm.edit_bones.new(bone_name(i, sides))
+            bone.head = (0.0, i * 0.01, 0.0)
+            bone.tail = (0.0, i * 0.01, 0.1)
+        bpy.ops.object.mode_set(mode='OBJECT')
+        return obj
+
+    def build_mesh(self, vertex_groups=0, shape_keys=0, uv_maps=0):
+        bpy = self.bpy
+        mesh = bpy.data.meshes.new("Body")
+        mesh.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+        obj = bpy.data.objects.new("Body", mesh)
+        bpy.context.scene.collection.objects.link(obj)
+        for i in range(vertex_groups):
+            obj.vertex_groups.new(name=f"group_{i:06d}")
+        for i in range(shape_keys):
+            obj.shape_key_add(name="Basis" if i == 0 else f"shape_{i:06d}")
+        for i in range(uv_maps):
+            mesh.uv_layers.new(name=f"UVMap_{i:03d}")
+        self._make_active(obj)
+        return obj
+
+    def _make_active(self, obj):
+        obj.select_set(True)
+        self.bpy.context.view_layer.objects.active = obj
+
+
+def bone_name(index, sides=(".L", ".R")):
+    return f"DEF-bone_{index // len(sides):06d}{sides[index % len(sides)]}"
+
+
+def load_backend(kind="auto"):
+    """'blender' inside Blender, 'fake' otherwise (or as requested)."""
+    if kind == "auto":
+        try:
+            import bpy  # noqa: F401
+            kind = "fake" if isinstance(sys.modules["bpy"].data, fake_bpy.BlendData) else "blender"
+        except ImportError:
+            kind = "fake"
+    return BlenderBackend() if kind == "blender" else FakeBackend()
+
+
+# ─────────── Flow ───────────
+def timed(label, func, results):
+    start = time.perf_counter()
+    value = func()
+    results[label] = time.perf_counter() - start
+    return value
+
+
+def run_flow(backend, count):
+    """Populate a bone table, prefix + sequence it, execute, and check the result."""
+    ops = backend.addon.operators
+    backend.new_file()
+    arm = backend.build_armature(count)
+    context = backend.bpy.context
+    props = context.scene.renamer_props
+    props.property_type = "BONES"
+
+    results = {}
+    timed("populate", lambda: ops.refresh_table(context.scene, context), results)
+    assert len(ops.read_rows(props)) == count
+
+    props.prefix_text = "X_"
+    timed("prefix", lambda: backend.run_operator("renamer.apply_prefix"), results)
+    props.seq_base, props.seq_start = "bone_", "1"
+    timed("sequence", lambda: backend.run_operator("renamer.apply_sequence"), results)
+    timed("execute", lambda: backend.run_operator("renamer.execute"), results)
+
+    names = [b.name for b in arm.data.bones]
+    assert sorted(names) == sorted(f"bone_{i + 1}" for i in range(count)), names[:5]
+    return results
+
+
+def main():
+    args = script_args()
+    count = int(args[0]) if args else 5000
+    backend = load_backend()
+    print(f"backend: {backend.name} ({backend.version})")
+    for label, seconds in run_flow(backend, count).items():
+        print(f"{label:10s} {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
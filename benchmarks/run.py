@@ -0,0 +1,211 @@
+"""
+Benchmark suite for RENAMER's hot paths at scale, written out as JSON.
+
+    python benchmarks/run.py [--sizes 100,1000,10000,100000] [--repeat 3] [--output bench.json]
+    blender -b --factory-startup --python benchmarks/run.py -- [same options]
+
+Without Blender the addon runs against fake_bpy, which measures RENAMER's own
+Python cost; inside Blender the same cases include real RNA overhead.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import harness  # noqa: E402
+
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+
+# ─────────── Cases ───────────
+# Each case prepares its scene (untimed) and returns the callable to time.
+def case_mirror_name(backend, size):
+    utils = backend.addon.utils
+    names = [harness.bone_name(i) for i in range(size)]
+    utils.mirror_name.cache_clear()
+    return lambda: utils.mirror_names(names)
+
+def case_apply_case(backend, size):
+    apply_case = backend.addon.utils.apply_case
+    names = [harness.bone_name(i) for i in range(size)]
+    return lambda: [apply_case(name, "TITLE") for name in names]
+
+def case_generate_sequence(backend, size):
+    generate_sequence = backend.addon.utils.generate_sequence
+    return lambda: [generate_sequence("bone_", "A", i, ".L") for i in range(size)]
+
+def _table(backend, ptype):
+    props = backend.bpy.context.scene.renamer_props
+    props.property_type = ptype
+    return props
+
+def case_populate_objects(backend, size):
+    backend.new_file()
+    backend.build_objects(size)
+    props = _table(backend, "OBJECTS")
+    return lambda: backend.addon.operators.populate_items(props, backend.bpy.context)
+
+def case_populate_bones(backend, size):
+    backend.new_file()
+    backend.build_armature(size)
+    props = _table(backend, "BONES")
+    return lambda: backend.addon.operators.populate_items(props, backend.bpy.context)
+
+def case_populate_vertex_groups(backend, size):
+    backend.new_file()
+    backend.build_mesh(vertex_groups=size)
+    props = _table(backend, "VERTEX_GROUPS")
+    return lambda: backend.addon.operators.populate_items(props, backend.bpy.context)
+
+def case_repopulate_unchanged(backend, size):
+    populate = case_populate_bones(backend, size)
+    populate()
+    return populate
+
+def case_refresh_table_idle(backend, size):
+    backend.new_file()
+    backend.build_objects(size)
+    ops = backend.addon.operators
+    context = backend.bpy.context
+    _table(backend, "OBJECTS")
+    ops.refresh_table(context.scene, context)
+    # Fingerprint unchanged: what every depsgraph update costs while nothing changes
+    return lambda: ops.refresh_table(context.scene, context)
+
+def _prepared(backend, size, build, ptype):
+    backend.new_file()
+    build(size)
+    context = backend.bpy.context
+    props = _table(backend, ptype)
+    backend.addon.operators.populate_items(props, context)
+    backend.flush()
+    return props
+
+def case_execute_objects(backend, size):
+    props = _prepared(backend, size, backend.build_objects, "OBJECTS")
+    props.prefix_text = "SM_"
+    backend.run_operator("renamer.apply_prefix")
+    return lambda: backend.run_operator("renamer.execute")
+
+def case_execute_bones_mirror(backend, size):
+    # Every bone is renamed to its partner's name: all moves form swap cycles
+    props = _prepared(backend, size, backend.build_armature, "BONES")
+    utils = backend.addon.utils
+    for row in backend.addon.operators.read_rows(props):
+        row.new_name = utils.mirror_name(row.current_name)
+    backend.flush()
+    return lambda: backend.run_operator("renamer.execute")
+
+def case_sequence_by_axis(backend, size):
+    # Numbering left to right reads every world matrix in one foreach_get
+    props = _prepared(backend, size, backend.build_objects, "OBJECTS")
+
+    def run():
+        props.seq_base, props.seq_start, props.seq_order = "Post_", "1", "X"
+        backend.run_operator("renamer.apply_sequence")
+    return run
+
+def _linted(backend, size):
+    backend.new_file()
+    backend.build_objects(size)
+    props = backend.bpy.context.scene.renamer_props
+    backend.run_operator("renamer.lint_rule_defaults")
+    return props
+
+def case_lint_full(backend, size):
+    props = _linted(backend, size)
+    ops = backend.addon.operators
+
+    def run():
+        ops._linter.reset()
+        ops.run_lint(props)
+    return run
+
+def case_lint_incremental(backend, size):
+    # One datablock reported as updated: the re-lint should not grow with the file
+    props = _linted(backend, size)
+    ops = backend.addon.operators
+    ops.run_lint(props)
+    obj = backend.bpy.data.objects[0]
+
+    def run():
+        ops._linter.mark(obj)
+        ops.run_lint(props)
+    return run
+
+def case_delete_objects(backend, size):
+    _prepared(backend, size, backend.build_objects, "OBJECTS")
+    return lambda: backend.run_operator("renamer.delete_item", index=-1)
+
+def case_delete_bones(backend, size):
+    _prepared(backend, size, backend.build_armature, "BONES")
+    return lambda: backend.run_operator("renamer.delete_item", index=-1)
+
+def case_delete_vertex_groups(backend, size):
+    _prepared(backend, size, lambda n: backend.build_mesh(vertex_groups=n), "VERTEX_GROUPS")
+    return lambda: backend.run_operator("renamer.delete_item", index=-1)
+
+
+CASES = {
+    name[len("case_"):]: func
+    for name, func in sorted(globals().items())
+    if name.startswith("case_") and callable(func)
+}
+
+
+# ─────────── Runner ───────────
+def run_case(backend, name, size, repeat):
+    runs = []
+    for _ in range(repeat):
+        func = CASES[name](backend, size)
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return {"case": name, "size": size, "best": min(runs), "runs": runs}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated input sizes")
+    parser.add_argument("--cases", default="", help="comma separated subset of: " + ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best one is reported")
+    parser.add_argument("--backend", choices=("auto", "fake", "blender"), default="auto")
+    parser.add_argument("--output", default="renamer_bench.json", help="JSON results file")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args(harness.script_args())
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    cases = [c for c in args.cases.split(",") if c] or list(CASES)
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        raise SystemExit(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+    backend = harness.load_backend(args.backend)
+    report = {
+        "backend": backend.name,
+        "version": backend.version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": [],
+    }
+    for size in sizes:
+        for name in cases:
+            result = run_case(backend, name, size, args.repeat)
+            report["results"].append(result)
+            print(f"{name:26s} {size:>7d} {result['best'] * 1000:11.2f} ms", flush=True)
+
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
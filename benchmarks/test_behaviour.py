@@ -0,0 +1,201 @@
+"""
+Behaviour checks for the bpy-free core (planner, rename_maps), loaded the way
+the benchmarks load the addon: through fake_bpy.
+
+    python -m pytest -q benchmarks
+"""
+import json
+import sys
+
+import harness
+
+harness.load_backend()
+addon = sys.modules[harness.ADDON_NAME]
+planner = addon.planner
+rename_maps = addon.rename_maps
+Row = planner.Row
+
+
+def apply_steps(names, steps):
+    """Replay plan_renames steps on a set of names, failing on any collision."""
+    names = set(names)
+    for _, old, new in steps:
+        assert old in names and new not in names, (old, new)
+        names.remove(old)
+        names.add(new)
+    return names
+
+
+# ─────────── Rename planning ───────────
+def test_plan_renames_swap_goes_through_a_temp_name():
+    steps, conflicts = planner.plan_renames([(0, "A", "B"), (1, "B", "A")], {"A", "B"})
+    assert conflicts == []
+    assert len(steps) == 3
+    assert any(new.startswith(planner.TEMP_PREFIX) for _, _, new in steps)
+    assert apply_steps({"A", "B"}, steps) == {"A", "B"}
+
+
+def test_plan_renames_chain_needs_no_temp_name():
+    moves = [(0, "A", "B"), (1, "B", "C"), (2, "C", "D")]
+    steps, conflicts = planner.plan_renames(moves, {"A", "B", "C"})
+    assert conflicts == []
+    assert [(old, new) for _, old, new in steps] == [("C", "D"), ("B", "C"), ("A", "B")]
+    assert apply_steps({"A", "B", "C"}, steps) == {"B", "C", "D"}
+
+
+def test_plan_renames_cycle_renames_each_name_at_most_twice():
+    moves = [(0, "A", "B"), (1, "B", "C"), (2, "C", "A"), (3, "X", "Y")]
+    steps, conflicts = planner.plan_renames(moves, {"A", "B", "C", "X"})
+    assert conflicts == []
+    assert len(steps) == 5
+    assert apply_steps({"A", "B", "C", "X"}, steps) == {"A", "B", "C", "Y"}
+
+
+def test_plan_renames_reports_taken_and_duplicate_targets():
+    moves = [(0, "A", "Z"), (1, "B", "C"), (2, "D", "C"), (3, "E", "F")]
+    steps, conflicts = planner.plan_renames(moves, {"A", "B", "D", "Z"})
+    reasons = {key: reason for key, _, _, reason in conflicts}
+    assert reasons == {0: "name taken", 2: "duplicate target", 3: "not found"}
+    assert [(old, new) for _, old, new in steps] == [("B", "C")]
+
+
+# ─────────── Pre-flight ───────────
+def test_find_conflicts_compares_truncated_names():
+    long_a = "x" * planner.MAX_NAME_BYTES + "_a"
+    long_b = "x" * planner.MAX_NAME_BYTES + "_b"
+    problems = planner.find_conflicts([(0, "A", long_a), (1, "B", long_b)], {"A", "B"})
+    # Both truncate to the same 63 bytes: one is too long, the other also collides
+    assert problems[0] == f"longer than {planner.MAX_NAME_BYTES} bytes"
+    assert problems[1] == "duplicate target"
+
+
+def test_truncate_name_never_splits_a_character():
+    name = "a" * (planner.MAX_NAME_BYTES - 1) + "é"
+    stored = planner.truncate_name(name)
+    assert len(stored.encode("utf-8")) <= planner.MAX_NAME_BYTES
+    assert stored == "a" * (planner.MAX_NAME_BYTES - 1)
+
+
+def test_find_conflicts_accepts_free_names():
+    assert planner.find_conflicts([(0, "A", "B"), (1, "B", "C")], {"A", "B"}) == {}
+
+
+# ─────────── Journal and saved edits ───────────
+def test_journal_round_trip():
+    entries = [(("bones", "Armature"), "a", "b"), (("objects",), "Cube", "Box"), (("bones", "Armature"), "c", "d")]
+    payload = planner.pack_journal(entries)
+    assert json.loads(payload)["ns"] == [["bones", "Armature"], ["objects"]]
+    assert planner.unpack_journal(payload) == entries
+    assert planner.unpack_journal("") == []
+
+
+def test_edits_round_trip_keeps_only_edited_rows():
+    rows = [Row("Cube", "a", "objects"), Row("Cube", "b", "objects", "B"),
+            Row("Cube", "c", "objects", selected=False), Row("Cube", "d", "objects", mirror=True)]
+    restored = planner.unpack_edits(planner.pack_edits(rows))
+    assert [idx for idx, _ in restored] == [1, 2, 3]
+    assert [(r.new_name, r.selected, r.mirror) for _, r in restored] == [("B", True, False), ("c", False, False), ("d", True, True)]
+    assert planner.pack_edits(rows[:1]) == ""
+
+
+# ─────────── Row store ───────────
+def test_diff_rows():
+    removed, inserts = planner.diff_rows(["a", "b", "c", "b"], ["a", "x", "c", "b"])
+    assert removed == [3]
+    assert inserts == [(1, "x")]
+
+
+def test_reconcile_keeps_edits_and_regroups_owners():
+    store = planner.RowStore([Row("Cube", "a", "vertex_groups"), Row("Cube", "b", "vertex_groups")])
+    store.rows[1].new_name = "B"
+    store.rows[1].selected = False
+    removed, added = store.reconcile([("Cube", "a", "vertex_groups"), ("Cube" + planner.OWNER_SEP + "Sphere", "b", "vertex_groups"),
+                                      ("Sphere", "c", "vertex_groups")])
+    assert (removed, added) == (0, 1)
+    kept = store.rows[1]
+    assert (kept.current_name, kept.new_name, kept.selected) == ("b", "B", False)
+    assert kept.owners == ["Cube", "Sphere"]
+    assert [r.current_name for r in store.rows] == ["a", "b", "c"]
+
+    store.reconcile([("Sphere", "b", "vertex_groups")])
+    assert [(r.current_name, r.new_name) for r in store.rows] == [("b", "B")]
+
+
+def test_reconcile_updates_the_search_index():
+    store = planner.RowStore([Row("Cube", "arm.L", "bones")])
+    index = store.search_index()
+    store.reconcile([("Cube", "leg.L", "bones")])
+    assert {r.current_name for r in index.search("leg")} == {"leg.L"}
+    assert index.search("arm") == set()
+
+
+# ─────────── Search ───────────
+def search(names, text, mode):
+    index = planner.NameIndex(Row("Armature", name, "bones") for name in names)
+    return sorted(row.current_name for row in index.search(text, mode))
+
+
+NAMES = ["upper_arm.L", "upper_arm.R", "forearm.L", "hand.L", "Spine", "spine.001"]
+
+
+def test_search_text_ignores_case():
+    assert search(NAMES, "ARM", "TEXT") == ["forearm.L", "upper_arm.L", "upper_arm.R"]
+    assert search(NAMES, "sp", "TEXT") == ["Spine", "spine.001"]
+    assert search(NAMES, "", "TEXT") == []
+
+
+def test_search_glob_matches_whole_names():
+    assert search(NAMES, "*.l", "GLOB") == ["forearm.L", "hand.L", "upper_arm.L"]
+    assert search(NAMES, "spine", "GLOB") == ["Spine"]
+    assert search(NAMES, "spine.??1", "GLOB") == ["spine.001"]
+
+
+def test_search_fuzzy_keeps_character_order():
+    assert search(NAMES, "uarl", "FUZZY") == ["upper_arm.L"]
+    assert search(NAMES, "hnd", "FUZZY") == ["hand.L"]
+    assert search(NAMES, "lh", "FUZZY") == []
+
+
+# ─────────── Rename maps ───────────
+def read(tmp_path, filename, text, default_type=""):
+    path = tmp_path / filename
+    path.write_text(text, encoding="utf-8")
+    return list(rename_maps.read_map(str(path), default_type))
+
+
+def test_read_csv_with_header(tmp_path):
+    entries = read(tmp_path, "map.csv", "new,old,source_type\nB,A,objects\nlegL,leg.L,bones\n")
+    assert entries == [("objects", "", "A", "B"), ("bones", "", "leg.L", "legL")]
+
+
+def test_read_csv_without_header(tmp_path):
+    assert read(tmp_path, "map.csv", "A,B\nC,D\n", "materials") == [("materials", "", "A", "B"), ("materials", "", "C", "D")]
+    assert read(tmp_path, "map.csv", "bones,Armature,a,b\n") == [("bones", "Armature", "a", "b")]
+
+
+def test_read_json_forms(tmp_path):
+    assert read(tmp_path, "map.json", '{"A": "B"}', "actions") == [("actions", "", "A", "B")]
+    written = '{"renames": [{"source_type": "uv_maps", "owner": "Cube", "old": "UVMap", "new": "uv0"}]}'
+    assert read(tmp_path, "map.json", written) == [("uv_maps", "Cube", "UVMap", "uv0")]
+
+
+def test_read_jsonl(tmp_path):
+    text = '{"source_type": "objects", "old": "A", "new": "B"}\n\n{"old": "c", "new": "d"}\n'
+    assert read(tmp_path, "map.jsonl", text, "vertex_groups") == [("objects", "", "A", "B"), ("vertex_groups", "", "c", "d")]
+
+
+def test_write_then_read_round_trip(tmp_path):
+    entries = [("bones", "Armature", "a", "b"), ("objects", "", "Cube", "Box")]
+    for ext in rename_maps.FORMATS:
+        path = str(tmp_path / f"out{ext}")
+        assert rename_maps.write_map(path, entries) == len(entries)
+        assert list(rename_maps.read_map(path)) == entries
+
+
+def test_read_rejects_malformed_entries(tmp_path):
+    for filename, text in (("map.csv", "a,b,c\n"), ("map.jsonl", '{"old": "a"}\n'), ("map.txt", "")):
+        try:
+            read(tmp_path, filename, text, "objects")
+        except ValueError:
+            continue
+        raise AssertionError(f"{filename} was accepted")
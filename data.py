@@ -1,26 +1,161 @@
 import bpy
-from bpy.props import StringProperty, BoolProperty, CollectionProperty, PointerProperty, EnumProperty, IntProperty
+from bpy.props import StringProperty, BoolProperty, CollectionProperty, PointerProperty, EnumProperty, IntProperty, FloatProperty
+
+
+# ─────────── Validate on edit ───────────
+def item_update(self, context):
+    from .operators import item_edited
+    item_edited(context.scene.renamer_props, self)
+
+
+# ─────────── Live Find / Replace preview ───────────
+def find_update(self, context):
+    if self.find_live:
+        from .operators import schedule_find_preview
+        schedule_find_preview()
+
+
+# ─────────── Search as you type ───────────
+def search_update(self, context):
+    from .operators import schedule_search
+    schedule_search()
 
 
 # ─────────── Manage Itemss ───────────
 class RENAMER_Item(bpy.types.PropertyGroup):
     current_name: StringProperty()
-    new_name: StringProperty()
-    selected: BoolProperty(default=True)
+    new_name: StringProperty(update=item_update)
+    selected: BoolProperty(default=True, update=item_update)
     mirror: BoolProperty(default=False)
     obj_name: StringProperty(default="")
     source_type: StringProperty(default="")
+    conflict: StringProperty(default="")  # Pre-flight problem, empty when the row is clean
+    index: IntProperty(default=0)  # Position of the mirrored row in the row store
+    partner: IntProperty(default=-1)  # Store index of the .L/.R partner row, -1 if none
+
+
+# ─────────── Pipeline Steps ───────────
+STEP_OPS = [
+    ("strip", "Strip", "Remove leading/trailing characters (whitespace if empty)"),
+    ("replace", "Replace", "Find / replace"),
+    ("case", "Case", "Case conversion"),
+    ("prefix", "Prefix", "Add a prefix"),
+    ("suffix", "Suffix", "Add a suffix"),
+    ("sequence", "Sequence", "Replace the name with a numbered sequence"),
+    ("mirror", "Mirror", "Swap left/right identifiers"),
+]
+
+class RENAMER_PipelineStep(bpy.types.PropertyGroup):
+    op: EnumProperty(name="Step", items=STEP_OPS, default="prefix")
+    enabled: BoolProperty(default=True)
+    text: StringProperty(name="Text", default="")  # prefix/suffix text, strip chars, find pattern, sequence base
+    replace: StringProperty(name="Replace", default="")
+    start: StringProperty(name="Start", default="1")
+    last: StringProperty(name="Last", default="")
+    reverse: BoolProperty(name="Reverse", default=False)
+    case_mode: EnumProperty(
+        name="Case",
+        items=[("UPPER", "UPPER", ""), ("LOWER", "lower", ""), ("TITLE", "Title", "")],
+        default="UPPER"
+    )
+    match_mode: EnumProperty(
+        name="Match",
+        items=[("LITERAL", "Text", ""), ("REGEX", "Regex", ""), ("GLOB", "Glob", "")],
+        default="LITERAL"
+    )
+    case_sensitive: BoolProperty(name="Match Case", default=True)
+
+
+# ─────────── Naming Lint Rules ───────────
+def lint_update(self, context):
+    from .operators import schedule_lint
+    schedule_lint()
+
+LINT_CHECKS = [
+    ("tail", "No Number Tail", "Names must not end in a .001 style duplicate number"),
+    ("prefix", "Prefix", "Names must start with the text"),
+    ("suffix", "Suffix", "Names must end with the text"),
+    ("side", "Side", "Deform bones off the centre line need a .L / .R side"),
+    ("pattern", "Pattern", "Whole names must match the regular expression"),
+]
+
+LINT_SOURCES = [
+    ("ALL", "All", "Every source type"),
+    ("objects", "Objects", ""),
+    ("bones", "Bones", ""),
+    ("vertex_groups", "Vertex Groups", ""),
+    ("shape_keys", "Shape Keys", ""),
+    ("uv_maps", "UV Maps", ""),
+    ("materials", "Materials", ""),
+    ("actions", "Actions", ""),
+]
+
+class RENAMER_LintRule(bpy.types.PropertyGroup):
+    check: EnumProperty(name="Rule", items=LINT_CHECKS, default="tail", update=lint_update)
+    enabled: BoolProperty(default=True, update=lint_update)
+    source_type: EnumProperty(name="Applies To", items=LINT_SOURCES, default="ALL", update=lint_update)
+    text: StringProperty(name="Text", default="", update=lint_update)  # prefix/suffix text or pattern
+
+
+# ─────────── Rename Journal ───────────
+class RENAMER_JournalBatch(bpy.types.PropertyGroup):
+    label: StringProperty(default="")
+    time: StringProperty(default="")
+    count: IntProperty(default=0)
+    payload: StringProperty(default="")  # planner.pack_journal()
+    reverted: BoolProperty(default=False)
+
+
+# ─────────── Pipeline Presets ───────────
+_preset_items = []  # Blender needs the enum item strings kept alive
+
+def pipeline_preset_items(self, context):
+    from .operators import list_pipeline_presets
+    _preset_items[:] = [(name, name, "") for name in list_pipeline_presets()] or [("NONE", "No presets", "")]
+    return _preset_items
 
 
 # ─────────── Calling Populate from Operator.py to register ───────────
 def property_type_update(self, context):
-    from .operators import populate_items_operator
-    populate_items_operator(context)
+    from .operators import schedule_refresh
+    schedule_refresh()
+
+def profiling_update(self, context):
+    from . import profiling
+    profiling.enable(self.profiling_enabled, self.profiling_cprofile)
+
+def validation_update(self, context):
+    from .operators import schedule_validation
+    schedule_validation()
+
+def window_update(self, context):
+    from .operators import sync_window
+    sync_window(self)
+
+def file_filter_update(self, context):
+    # A new filter or datablock type starts over at the first page
+    if self.file_page:
+        self.file_page = 0  # its update schedules the refresh
+    else:
+        property_type_update(self, context)
 
 
 # ─────────── Manage Properties ───────────
 class RENAMER_Properties(bpy.types.PropertyGroup):
+    # The table itself lives in operators.row_store(); items mirrors the rows on screen
     items: CollectionProperty(type=RENAMER_Item)
+    active_index: IntProperty(default=0)
+    window_start: IntProperty(default=0, min=0)
+    window_size: IntProperty(
+        name="Rows Shown",
+        description="Rows mirrored into the panel at a time; larger tables are scrolled in blocks",
+        default=500, min=50, max=5000, update=window_update,
+    )
+    row_count: IntProperty(default=0)
+    # Edited rows outside the window, so undo and file loads can restore them (planner.pack_edits)
+    row_edits: StringProperty(default="")
+    # Bumped whenever rows are added, removed or renamed; invalidates the list filter cache
+    items_version: IntProperty(default=0)
     
     # ─────────── For Prefix | Suffix | Sequence
     prefix_text: StringProperty(name="Prefix", default="")
@@ -29,9 +164,71 @@ class RENAMER_Properties(bpy.types.PropertyGroup):
     seq_base: StringProperty(name="Seq Name", default="")
     seq_start: StringProperty(name="Seq Num", default="1")
     seq_last: StringProperty(name="Seq Last", default="")
+    seq_order: EnumProperty(
+        name="Order",
+        items=[
+            ("TABLE", "Table", "Number in table order"),
+            ("X", "Along X", "By world X position (left to right)"),
+            ("Y", "Along Y", "By world Y position (front to back)"),
+            ("Z", "Along Z", "By world Z position (bottom to top)"),
+            ("NEAREST", "Nearest Chain", "From the first selected item, always on to the closest remaining one"),
+            ("HIERARCHY", "Hierarchy", "Parents before children, one chain at a time (objects and bones)"),
+        ],
+        default="TABLE"
+    )
     
     case_mode: StringProperty(default="NONE")
 
+    # ─────────── For Find / Replace
+    find_text: StringProperty(name="Find", default="", update=find_update)
+    replace_text: StringProperty(name="Replace", default="", update=find_update)
+    find_mode: EnumProperty(
+        name="Match",
+        items=[
+            ("LITERAL", "Text", "Plain text match"),
+            ("REGEX", "Regex", "Regular expression, replacement may use \\1 or \\g<name>"),
+            ("GLOB", "Glob", "Whole-name match with * and ?, each wildcard is a group (\\1, \\2, ...)"),
+        ],
+        default="LITERAL",
+        update=find_update
+    )
+    find_case_sensitive: BoolProperty(name="Match Case", default=True, update=find_update)
+    find_live: BoolProperty(name="Live Preview", description="Update new names while typing", default=False, update=find_update)
+    find_status: StringProperty(default="")
+
+    # ─────────── For Search
+    search_text: StringProperty(
+        name="Search",
+        description="Select the rows whose current name matches (ignores case)",
+        default="", options={'TEXTEDIT_UPDATE'}, update=search_update,
+    )
+    search_mode: EnumProperty(
+        name="Match",
+        items=[
+            ("TEXT", "Text", "Name contains the text"),
+            ("GLOB", "Glob", "Whole-name match with * and ?"),
+            ("FUZZY", "Fuzzy", "Name contains the characters in this order (e.g. 'twst' finds 'twist')"),
+        ],
+        default="TEXT",
+        update=search_update
+    )
+    search_status: StringProperty(default="")
+
+    # ─────────── For Pipeline
+    pipeline: CollectionProperty(type=RENAMER_PipelineStep)
+    pipeline_index: IntProperty(default=0)
+    pipeline_preset: EnumProperty(name="Preset", items=pipeline_preset_items)
+    pipeline_preset_name: StringProperty(name="Preset Name", default="")
+
+    # ─────────── Rename Journal
+    journal: CollectionProperty(type=RENAMER_JournalBatch)
+    journal_index: IntProperty(default=0)
+    journal_limit: IntProperty(
+        name="History Size",
+        description="Number of executed batches kept for revert / re-apply",
+        default=32, min=1, max=1000,
+    )
+
     # ─────────── For Property Dropdown
     property_type: EnumProperty(
         name="Property Type",
@@ -48,23 +245,132 @@ class RENAMER_Properties(bpy.types.PropertyGroup):
         update=property_type_update
     )
 
+    # ─────────── Whole-file mode
+    scope: EnumProperty(
+        name="Source",
+        items=[
+            ("SELECTION", "Selection", "Names on the selected objects"),
+            ("FILE", "Whole File", "Every datablock of one type in the file, a page at a time"),
+        ],
+        default="SELECTION",
+        update=property_type_update
+    )
+    datablock_type: EnumProperty(
+        name="Datablocks",
+        items=[
+            ("MATERIALS", "Materials", ""),
+            ("ACTIONS", "Actions", ""),
+            ("MESHES", "Meshes", ""),
+            ("IMAGES", "Images", ""),
+            ("NODE_GROUPS", "Node Groups", ""),
+            ("COLLECTIONS", "Collections", ""),
+            ("OBJECTS", "Objects", ""),
+        ],
+        default="MATERIALS",
+        update=file_filter_update
+    )
+    file_filter: StringProperty(
+        name="Filter",
+        description="Only list names containing this text (or matching it, with * and ?)",
+        default="",
+        update=file_filter_update
+    )
+    file_page: IntProperty(default=0, min=0, update=property_type_update)
+    file_page_size: IntProperty(name="Page Size", default=100, min=10, max=1000, update=file_filter_update)
+    file_has_more: BoolProperty(default=False)
+
     # ─────────── For Prefix | Suffix | Sequence UI box
     show_extras: BoolProperty(default=False)
     show_prefix: BoolProperty(default=False)
     show_suffix: BoolProperty(default=False)
     show_sequence: BoolProperty(default=False)
+    show_replace: BoolProperty(default=False)
+    show_pipeline: BoolProperty(default=False)
+    show_journal: BoolProperty(default=False)
 
     last_sel_count: IntProperty(default=0)
     has_valid_items: BoolProperty(default=False)
+    conflict_count: IntProperty(default=0)
+
+    # ─────────── Reference repair
+    repair_references: BoolProperty(
+        name="Fix References",
+        description="After renaming bones or vertex groups, update F-curves in every action, drivers, constraints and modifiers that use the old names",
+        default=False,
+    )
+
+    # ─────────── Rename maps
+    map_path: StringProperty(
+        name="Rename Map",
+        description="CSV, JSON or JSON Lines file of old → new names (source_type and owner columns optional)",
+        default="", subtype='FILE_PATH',
+    )
+    show_maps: BoolProperty(default=False)
+
+    # ─────────── Mirror pairs
+    mirror_sync: BoolProperty(
+        name="Sync Mirror Pairs",
+        description="Renaming one side of a left/right pair gives its partner the mirrored name",
+        default=False, update=validation_update,
+    )
+    mirror_unpaired: IntProperty(default=0)
+    mirror_mismatched: IntProperty(default=0)
+
+    # ─────────── Naming lint
+    lint_rules: CollectionProperty(type=RENAMER_LintRule)
+    lint_rule_index: IntProperty(default=0)
+    # The scene is linted (and kept linted) while the box is open
+    show_lint: BoolProperty(default=False, update=lint_update)
+    lint_status: StringProperty(default="")
+
+    # ─────────── Chunked execute / delete
+    chunk_threshold: IntProperty(
+        name="Chunk Threshold",
+        description="Executes and deletes with at least this many steps run in the background with a progress bar",
+        default=2000, min=1,
+    )
+    chunk_budget_ms: IntProperty(
+        name="Chunk Budget",
+        description="Milliseconds of work per UI tick while running in the background",
+        default=16, min=1, max=500,
+    )
+    job_progress: FloatProperty(name="Progress", default=0.0, min=0.0, max=1.0, subtype='FACTOR')
+    job_label: StringProperty(default="")
+
+    # ─────────── Diagnostics
+    profiling_enabled: BoolProperty(
+        name="Collect Stats",
+        description="Time RENAMER's hot paths and count table rebuilds, RNA writes and renames",
+        default=False, update=profiling_update,
+    )
+    profiling_cprofile: BoolProperty(
+        name="cProfile",
+        description="Also run the Python profiler while collecting (slower)",
+        default=False, update=profiling_update,
+    )
+    show_diagnostics: BoolProperty(default=False)
+
+    # ─────────── Table refresh
+    refresh_interval: FloatProperty(
+        name="Refresh Interval",
+        description="Minimum delay in seconds between automatic table refreshes",
+        default=0.1, min=0.0, max=2.0,
+    )
 
 
 # ─────────── Register/UnRegister ───────────
 def register():
     bpy.utils.register_class(RENAMER_Item)
+    bpy.utils.register_class(RENAMER_PipelineStep)
+    bpy.utils.register_class(RENAMER_LintRule)
+    bpy.utils.register_class(RENAMER_JournalBatch)
     bpy.utils.register_class(RENAMER_Properties)
     bpy.types.Scene.renamer_props = PointerProperty(type=RENAMER_Properties)
 
 def unregister():
     del bpy.types.Scene.renamer_props
     bpy.utils.unregister_class(RENAMER_Properties)
+    bpy.utils.unregister_class(RENAMER_JournalBatch)
+    bpy.utils.unregister_class(RENAMER_LintRule)
+    bpy.utils.unregister_class(RENAMER_PipelineStep)
     bpy.utils.unregister_class(RENAMER_Item)
\ No newline at end of file
@@ -0,0 +1,228 @@
+# ─────────── Naming Lint ───────────
+# Scene-wide convention checks over every name RENAMER can rename: objects and
+# their vertex groups, the bones of armatures, the UV maps and shape keys of
+# meshes, materials and actions. Results are cached per datablock; only the
+# datablocks the depsgraph reports as updated (or that a rename job touched) are
+# checked again, so a re-lint costs the size of the change, not of the file.
+import bpy
+from . import planner
+
+
+# Datablock collections checked, in this order: objects first, so that every
+# armature and mesh knows an object to rename its bones / UV maps through
+UNITS = (("objects", "Object"), ("armatures", "Armature"), ("meshes", "Mesh"),
+         ("materials", "Material"), ("actions", "Action"))
+
+
+def _unit_of(id_data):
+    """(collection, datablock) an ID is cached under; shape key blocks belong to their mesh."""
+    if isinstance(id_data, bpy.types.Key):
+        id_data = id_data.user
+    for collection, type_name in UNITS:
+        if isinstance(id_data, getattr(bpy.types, type_name)):
+            return collection, id_data
+    return None, None
+
+
+def _bone_names(obj):
+    """(name, (use_deform, head x)) for every bone of an armature object (edit bones while in edit mode)."""
+    if obj.mode == 'EDIT':
+        bones, attr = obj.data.edit_bones, "head"
+    else:
+        bones, attr = obj.data.bones, "head_local"
+    heads = [0.0] * (len(bones) * 3)
+    bones.foreach_get(attr, heads)
+    deform = [False] * len(bones)
+    bones.foreach_get("use_deform", deform)
+    return ((name, (deform[i], heads[i * 3])) for i, name in enumerate(bones.keys()))
+
+
+class Linter:
+    """
+    {pointer: (collection, name, violations)} for every checked datablock, plus
+    the pointers marked dirty since the last run. Violations are tuples of
+    (source_type, owner, name, message, fix); owner is the object bones, vertex
+    groups, UV maps and shape keys are renamed through, "" for datablocks.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, rules_key=None, checks=()):
+        self.rules_key = rules_key
+        self.checks = checks
+        self.cache = {}
+        self.dirty = {}   # {pointer: (collection, name when marked)}
+        self.counts = {}  # {collection: length at the last run}; a change means adds or removes
+        self.owners = {}  # {armature / mesh pointer: name of an object using it}
+        self.users = None  # {data pointer: first object using it}, built at most once per run
+        self.flagged = set()  # Pointers with at least one violation
+        self.total = 0
+        self.results = None
+        self.checked = 0
+
+    def active(self):
+        return self.rules_key is not None
+
+    def mark(self, id_data):
+        collection, id_data = _unit_of(id_data)
+        if collection is not None:
+            self.dirty[id_data.as_pointer()] = (collection, id_data.name)
+
+    def note_updates(self, depsgraph):
+        """Mark the datablocks of a depsgraph_update_post as dirty."""
+        if not self.active() or depsgraph is None:
+            return
+        for update in depsgraph.updates:
+            self.mark(update.id.original)
+
+    def touch(self, entries):
+        """
+        Mark the datablocks behind renamed journal entries [(namespace_key, old, new)]
+        as dirty: not every rename made through RNA reaches the depsgraph.
+        """
+        if not self.active():
+            return
+        for ns_key, _, new in entries:
+            source_type = ns_key[0]
+            if source_type in ("objects", "materials", "actions"):
+                id_data = getattr(bpy.data, source_type).get(new)
+            elif source_type == "vertex_groups":
+                id_data = bpy.data.objects.get(ns_key[1])
+            elif source_type in ("bones", "uv_maps", "shape_keys"):
+                collection = {"bones": "armatures", "uv_maps": "meshes", "shape_keys": "shape_keys"}[source_type]
+                id_data = getattr(bpy.data, collection).get(ns_key[1])
+            else:
+                continue
+            if id_data is not None:
+                self.mark(id_data)
+
+    def lint(self, rules):
+        """
+        Check what changed and return the number of violations. Only dirty
+        datablocks are checked again; a collection whose length changed is swept
+        for added and removed ones. New rules start over. Raises like
+        compile_lint_rules.
+        """
+        key = repr(rules)
+        if key != self.rules_key:
+            self.reset(key, planner.compile_lint_rules(rules))
+        self.checked = 0
+        self.users = None
+        for collection, _ in UNITS:
+            datablocks = getattr(bpy.data, collection)
+            if self.counts.get(collection) != len(datablocks):
+                self._sweep(collection, datablocks)
+            for pointer in [p for p, (c, _) in self.dirty.items() if c == collection]:
+                _, name = self.dirty.pop(pointer)
+                id_data = datablocks.get(name)
+                if id_data is not None and id_data.as_pointer() == pointer:
+                    self._check(collection, id_data)
+        self.users = None
+        return self.total
+
+    def violations(self):
+        """Every violation, sorted by source type, owner and name."""
+        if self.results is None:
+            found = [v for pointer in self.flagged for v in self.cache[pointer][2]]
+            found.sort(key=lambda v: v[:4])
+            self.results = found
+        return self.results
+
+    def _sweep(self, collection, datablocks):
+        present = set()
+        for id_data in datablocks:
+            pointer = id_data.as_pointer()
+            present.add(pointer)
+            cached = self.cache.get(pointer)
+            dirty = self.dirty.pop(pointer, None)
+            # A reused pointer shows up as a cached entry under another name
+            if dirty or cached is None or cached[1] != id_data.name:
+                self._check(collection, id_data)
+        for pointer in [p for p, cached in self.cache.items() if cached[0] == collection and p not in present]:
+            removed = self.cache.pop(pointer)
+            self._forget(pointer, removed)
+            if collection == "objects":
+                self._release(removed[1])
+        self.counts[collection] = len(datablocks)
+
+    def _release(self, obj_name):
+        # Data whose owner is gone is checked again under another user
+        for pointer, owner in list(self.owners.items()):
+            if owner == obj_name:
+                del self.owners[pointer]
+                cached = self.cache.get(pointer)
+                if cached is not None:
+                    self.dirty[pointer] = (cached[0], cached[1])
+
+    def _owner(self, data):
+        """Name of an object using data, or None for orphan data."""
+        pointer = data.as_pointer()
+        owner = self.owners.get(pointer)
+        obj = bpy.data.objects.get(owner) if owner else None
+        if obj is not None and obj.data == data:
+            return owner
+        if self.users is None:
+            # One pass over the objects serves every lookup of this run
+            self.users = {}
+            for obj in bpy.data.objects:
+                if obj.data is not None:
+                    self.users.setdefault(obj.data.as_pointer(), obj.name)
+        owner = self.users.get(pointer)
+        if owner is None:
+            self.owners.pop(pointer, None)
+        else:
+            self.owners[pointer] = owner
+        return owner
+
+    def _check(self, collection, id_data):
+        self.checked += 1
+        self.results = None
+        pointer = id_data.as_pointer()
+        previous = self.cache.get(pointer)
+        found = []
+        if not id_data.library:  # Linked datablocks cannot be renamed
+            getattr(self, "_check_" + collection)(id_data, previous, found)
+        if previous is not None:
+            self._forget(pointer, previous)
+        self.cache[pointer] = (collection, id_data.name, found)
+        if found:
+            self.flagged.add(pointer)
+            self.total += len(found)
+
+    def _forget(self, pointer, cached):
+        self.results = None
+        self.total -= len(cached[2])
+        self.flagged.discard(pointer)
+
+    def _check_objects(self, obj, previous, found):
+        planner.lint_names(self.checks, "objects", "", ((obj.name, None),), found)
+        if obj.type in {'MESH', 'LATTICE'}:
+            planner.lint_names(self.checks, "vertex_groups", obj.name, ((vg.name, None) for vg in obj.vertex_groups), found)
+        if obj.type in {'MESH', 'ARMATURE'} and obj.data is not None:
+            # A renamed owner re-checks its data, whose violations carry the owner's name
+            data = obj.data.as_pointer()
+            owner = self.owners.get(data)
+            if owner is None or (previous is not None and owner == previous[1] != obj.name):
+                self.owners[data] = obj.name
+                self.mark(obj.data)
+
+    def _check_armatures(self, arm, previous, found):
+        owner = self._owner(arm)
+        if owner is not None:
+            planner.lint_names(self.checks, "bones", owner, _bone_names(bpy.data.objects[owner]), found)
+
+    def _check_meshes(self, mesh, previous, found):
+        owner = self._owner(mesh)
+        if owner is None:
+            return
+        planner.lint_names(self.checks, "uv_maps", owner, ((uv.name, None) for uv in mesh.uv_layers), found)
+        if mesh.shape_keys:
+            planner.lint_names(self.checks, "shape_keys", owner,
+                               ((key.name, None) for key in mesh.shape_keys.key_blocks), found)
+
+    def _check_materials(self, mat, previous, found):
+        planner.lint_names(self.checks, "materials", "", ((mat.name, None),), found)
+
+    def _check_actions(self, action, previous, found):
+        planner.lint_names(self.checks, "actions", "", ((action.name, None),), found)
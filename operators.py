@@ -1,152 +1,631 @@
+import json
+import os
+import re
+import sys
+import time
 import bpy
-from .utils import mirror_name, apply_case, generate_sequence
+from bpy.app.handlers import persistent
+from . import linter, ordering, planner, profiling, references, rename_maps
+from .data import LINT_CHECKS, STEP_OPS
+from .planner import Row, OWNER_SEP, plan_renames, find_conflicts, truncate_name
+from .utils import compile_pattern
+from .profiling import timed
 
 
 # ─────────── Populate Table ───────────
+# bpy.data collections the whole-file mode can list (datablock_type lowercased)
+FILE_SOURCES = ("objects", "materials", "actions", "meshes", "images", "node_groups", "collections")
+
+
+def file_name_filter(text):
+    """Match function for the whole-file filter: glob if it has wildcards, else a substring, ignoring case."""
+    if not text:
+        return None
+    mode = "GLOB" if any(c in text for c in "*?") else "LITERAL"
+    return compile_pattern(text, mode, False).search
+
+
+@timed("populate_file_items")
+def populate_file_items(props):
+    """One page of a bpy.data collection. Names are read lazily and only the page becomes RNA rows."""
+    source = props.datablock_type.lower()
+    match = file_name_filter(props.file_filter)
+
+    def read_page(page):
+        # Linked datablocks cannot be renamed
+        names = (d.name for d in getattr(bpy.data, source) if not d.library)
+        return planner.paginate(names, page, props.file_page_size, match)
+
+    page, more = read_page(props.file_page)
+    if not page and props.file_page > 0:
+        # A filter or delete left the page empty: show the first page instead. The
+        # refresh its update schedules finds the table already current.
+        props.file_page = 0
+        page, more = read_page(0)
+    _reconcile_items(props, [("", name, source) for name in page])
+    props.file_has_more = more
+    props.has_valid_items = bool(page)
+
+
+@timed("populate_items")
 def populate_items(props, context):
+    if props.scope == "FILE":
+        populate_file_items(props)
+        return
+
     sel_objs = context.selected_objects
     if not sel_objs:
         props.has_valid_items = False
         return
 
     ptype = props.property_type
-    added = False
-
-    # Preserve previous checkbox states
-    prev_state = {
-        (i.obj_name, i.current_name): {
-            "selected": i.selected,
-            "mirror": i.mirror,
-            "new_name": i.new_name
-        }
-        for i in props.items
-    }
-
-    def add_item(obj, name, source):
-        key = (obj.name, name)
-        if any(i.obj_name == obj.name and i.current_name == name for i in props.items):
+
+    # Objects → one row per selected object
+    if ptype == "OBJECTS":
+        _reconcile_items(props, [(obj.name, obj.name, "objects") for obj in sel_objs])
+        props.has_valid_items = True
+        return
+
+    # Other property types → one row per distinct name, with a name → [owners] index.
+    # Each owner is listed once per namespace (objects can share a mesh or armature),
+    # and execute / delete fan the row out to every owner.
+    owners = {}
+    covered = set()
+
+    def add_item(obj, name, source, namespace):
+        if (source, namespace, name) in covered:
             return
-        item = props.items.add()
-        item.current_name = name
-        item.new_name = name
-        item.obj_name = obj.name
-        item.source_type = source
-        if key in prev_state:
-            state = prev_state[key]
-            item.selected = state["selected"]
-            item.mirror = state["mirror"]
-            item.new_name = state["new_name"]  # preserve manually edited names
-        else:
-            item.selected = True
-            item.mirror = False
+        covered.add((source, namespace, name))
+        owners.setdefault((name, source), []).append(obj.name)
 
-    # Clear collection before repopulating
-    props.items.clear()
+    mode = bpy.context.mode
+    for obj in sel_objs:
+        if obj.type == "MESH":
+            mesh = obj.data
+            if ptype == "VERTEX_GROUPS":
+                for vg in obj.vertex_groups: add_item(obj, vg.name, "vertex_groups", obj.as_pointer())
+            elif ptype == "SHAPE_KEYS" and mesh.shape_keys:
+                key = mesh.shape_keys.as_pointer()
+                for sk in mesh.shape_keys.key_blocks: add_item(obj, sk.name, "shape_keys", key)
+            elif ptype == "UV_MAPS":
+                for uv in mesh.uv_layers: add_item(obj, uv.name, "uv_maps", mesh.as_pointer())
+            elif ptype == "MATERIALS":
+                # Slots are cleared per object on delete, so every user is an owner
+                for slot in obj.material_slots:
+                    if slot.material: add_item(obj, slot.material.name, "materials", obj.as_pointer())
 
-    # Multi-selection → just show object names
-    if len(sel_objs) > 1 or ptype == "OBJECTS":
-        for obj in sel_objs:
-            add_item(obj, obj.name, "objects")
-            added = True
-        props.has_valid_items = True
+        elif obj.type == "ARMATURE" and ptype == "BONES":
+            arm = obj.data
+            # Detect selected bones depending on mode
+            selected_bones = []
+            if mode == 'POSE':
+                selected_bones = [b.name for b in obj.pose.bones if b.bone.select]
+            elif mode == 'EDIT_ARMATURE':
+                selected_bones = [b.name for b in arm.edit_bones if b.select]
+            # If nothing selected → show all
+            for bone_name in selected_bones or (b.name for b in arm.bones):
+                add_item(obj, bone_name, "bones", arm.as_pointer())
+
+        if ptype == "ACTIONS" and obj.animation_data and obj.animation_data.action:
+            add_item(obj, obj.animation_data.action.name, "actions", None)
+
+    rows = [(OWNER_SEP.join(objs), name, source) for (name, source), objs in owners.items()]
+    _reconcile_items(props, rows)
+    props.has_valid_items = bool(rows)
+
+
+def _reconcile_items(props, rows):
+    """
+    Bring the row store in line with rows without rebuilding it. Only removed
+    rows are dropped and only new rows are added; unchanged rows keep their
+    checkbox, mirror and new_name state (grouped rows also take their new owner
+    list). The visible window is then re-mirrored.
+    """
+    store = row_store(props)
+    removed, added = store.reconcile(rows)
+    store.search_index()  # Built with the table, so the first keystroke only queries it
+    if added:
+        _search_state["selection"] = None  # New rows start selected
+    if removed or added:
+        props.items_version += 1
+    sync_window(props)
+    profiling.count("rows removed", removed)
+    profiling.count("rows added", added)
+
+
+# ─────────── Row Store ───────────
+# The working table lives in a planner.RowStore per scene, not in RNA: transforms,
+# validation, execute and delete read and write the store directly. props.items
+# only mirrors the window of rows the panel shows (window_start, window_size),
+# so neither the table nor its per-row RNA overhead ends up in the .blend. Rows
+# edited outside the window are kept in props.row_edits as one packed string.
+_stores = {}
+_window_state = {"syncing": False}
+_edits_state = {"scheduled": False}
+
+
+def row_store(props):
+    key = props.as_pointer()
+    store = _stores.get(key)
+    if store is None:
+        # After an undo or a file load only RNA is left: the mirrored window and the
+        # saved edits seed the store in table order, and the next populate
+        # reconciles the rest around them
+        seeds = {(i.current_name, i.source_type): (i.index, Row(i.obj_name, i.current_name, i.source_type,
+                                                               i.new_name, i.selected, i.mirror))
+                 for i in props.items}
+        for idx, row in planner.unpack_edits(props.row_edits):
+            seeds.setdefault(row.key, (idx, row))
+        store = _stores[key] = planner.RowStore(row for _, row in sorted(seeds.values(), key=lambda seed: seed[0]))
+    return store
+
+
+def save_edits(props):
+    """Write the store's edited rows into props.row_edits (what undo steps and saved files keep)."""
+    _edits_state["scheduled"] = False
+    payload = planner.pack_edits(row_store(props).rows)
+    if props.row_edits != payload:
+        props.row_edits = payload
+
+
+def schedule_edit_save():
+    """save_edits() once after a burst of live updates (search as you type)."""
+    if _edits_state["scheduled"]:
         return
+    _edits_state["scheduled"] = True
+    bpy.app.timers.register(_run_edit_save, first_interval=0.0)
 
-    # Single object → other property types
-    obj = sel_objs[0]
-    if obj.type == "MESH":
-        if ptype == "VERTEX_GROUPS":
-            for vg in obj.vertex_groups: add_item(obj, vg.name, "vertex_groups"); added=True
-        elif ptype == "SHAPE_KEYS" and obj.data.shape_keys:
-            for sk in obj.data.shape_keys.key_blocks: add_item(obj, sk.name, "shape_keys"); added=True
-        elif ptype == "UV_MAPS":
-            for uv in obj.data.uv_layers: add_item(obj, uv.name, "uv_maps"); added=True
-        elif ptype == "MATERIALS":
-            for slot in obj.material_slots:
-                if slot.material: add_item(obj, slot.material.name, "materials"); added=True
-    
-    elif obj.type == "ARMATURE" and ptype == "BONES":
-        arm = obj
-        # Detect selected bones depending on mode
-        selected_bones = []
-        mode = bpy.context.mode
-        if mode == 'POSE':
-            selected_bones = [b.name for b in arm.pose.bones if b.bone.select]
-        elif mode == 'EDIT_ARMATURE':
-            selected_bones = [b.name for b in arm.data.edit_bones if b.select]
-
-        if selected_bones:
-            # Only add selected ones
-            for bone_name in selected_bones:
-                add_item(arm, bone_name, "bones")
-                added = True
+
+def _run_edit_save():
+    scene = bpy.context.scene
+    if scene and _edits_state["scheduled"]:
+        save_edits(scene.renamer_props)
+    _edits_state["scheduled"] = False
+    return None
+
+
+def _mirror_row(item, idx, row, store):
+    """Write the fields of one store row that differ from its RNA item. Returns how many were written."""
+    writes = 0
+    for attr, value in (("index", idx), ("obj_name", row.obj_name), ("current_name", row.current_name),
+                        ("source_type", row.source_type), ("new_name", row.new_name),
+                        ("selected", row.selected), ("mirror", row.mirror),
+                        ("conflict", store.conflicts.get(idx, "")), ("partner", store.partners.get(idx, -1))):
+        if getattr(item, attr) != value:
+            setattr(item, attr, value)
+            writes += 1
+    return writes
+
+
+def sync_window(props, changed=None):
+    """
+    Mirror the visible window of the row store into props.items. With changed
+    (store indices) only those rows are looked at; otherwise the whole window is,
+    after clamping it to the store. Only values that differ are written.
+    """
+    store = row_store(props)
+    rows = store.rows
+    items = props.items
+    writes = 0
+    _window_state["syncing"] = True  # Item updates must not echo back into the store
+    try:
+        if changed is None:
+            size = props.window_size
+            start = min(props.window_start, (len(rows) - 1) // size * size) if rows else 0
+            if props.window_start != start:
+                props.window_start = start
+            count = min(size, len(rows) - start)
+            while len(items) > count:
+                items.remove(len(items) - 1)
+            while len(items) < count:
+                items.add()
+            for pos in range(count):
+                writes += _mirror_row(items[pos], start + pos, rows[start + pos], store)
+            if props.row_count != len(rows):
+                props.row_count = len(rows)
+            if writes:
+                props.items_version += 1
+            save_edits(props)
         else:
-            # If nothing selected → show all
-            for bone in arm.data.bones:
-                add_item(arm, bone.name, "bones")
-                added = True
+            start = props.window_start
+            for idx in changed:
+                pos = idx - start
+                if 0 <= pos < len(items):
+                    writes += _mirror_row(items[pos], idx, rows[idx], store)
+    finally:
+        _window_state["syncing"] = False
+    profiling.count("rna writes", writes)
 
-    if ptype == "ACTIONS" and obj.animation_data and obj.animation_data.action:
-        add_item(obj, obj.animation_data.action.name, "actions"); added=True
 
-    props.has_valid_items = added
+def item_edited(props, item):
+    """A row edited in the panel: copy it into the store and re-validate."""
+    if _window_state["syncing"]:
+        return
+    store = row_store(props)
+    if 0 <= item.index < len(store.rows):
+        row = store.rows[item.index]
+        renamed = row.new_name != item.new_name
+        row.new_name = item.new_name
+        if row.selected != item.selected:
+            row.selected = item.selected
+            _search_state["selection"] = None
+        if renamed and props.mirror_sync:
+            sync_window(props, planner.sync_partners(store.rows, [item.index], store.partners))
+        save_edits(props)
+    schedule_validation()
+
+
+# ─────────── RNA Adapters ───────────
+def read_rows(props):
+    """The store's rows, live: transforms edit them in place and report what changed."""
+    return row_store(props).rows
+
+def write_names(props, rows, changed):
+    """Mirror the changed rows that are in the visible window and re-validate."""
+    if changed and props.mirror_sync:
+        changed = changed + planner.sync_partners(rows, changed, row_store(props).partners)
+    if changed:
+        sync_window(props, changed)
+        save_edits(props)
+        schedule_validation()
+
+def write_selection(props, rows, live=False):
+    """Mirror the window's checkboxes; live callers (search as you type) save the edits once per burst."""
+    start = props.window_start
+    props.items.foreach_set("selected", [r.selected for r in rows[start:start + len(props.items)]])
+    profiling.count("rna writes (bulk)")
+    _search_state["selection"] = None
+    if live:
+        schedule_edit_save()
+    else:
+        save_edits(props)
+    schedule_validation()  # foreach_set does not fire the property update
+
+
+# ─────────── Chunked Execution ───────────
+# Large executes and deletes run as modal operators: each timer tick works on the
+# job for a time budget, the panel shows progress and Esc cancels. The operator
+# finishes once, so Blender records a single undo step for the whole run. The job
+# holds RNA references and store indices, so undo and mode switches are held back
+# while it runs; an undo that still gets through (the Edit menu) ends it unfinished.
+_job_state = {"job": None, "stale": False}
+
+# (event type, modifier attributes) swallowed while a job runs: undo, redo and mode switches
+_BLOCKED_EVENTS = {
+    'Z': ("ctrl", "oskey"),
+    'Y': ("ctrl", "oskey"),
+    'TAB': None,
+}
+
+
+def job_running():
+    return _job_state["job"] is not None
+
+
+class ChunkedRun:
+    """
+    Mixin for operators backed by a job (total, progress, done, run(context, budget)).
+    Subclasses define job_label, make_job(context), finish(context, job) and
+    cancel_job(context, job).
+    """
+    job_label = "Working"
+
+    @classmethod
+    def poll(cls, context):
+        return not job_running()
+
+    def execute(self, context):
+        job = self.make_job(context)
+        job.run(context)
+        return self.finish(context, job)
+
+    def invoke(self, context, event):
+        props = context.scene.renamer_props
+        job = self.make_job(context)
+        if job.total < props.chunk_threshold:
+            job.run(context)
+            return self.finish(context, job)
+
+        self._job = job
+        _job_state["job"] = job
+        _job_state["stale"] = False
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, job.total)
+        self._set_progress(context, 0.0, f"{self.job_label} 0 / {job.total}")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = self._job
+        if _job_state["stale"]:
+            # The undo system replaced the data the job points into: touch nothing
+            self._end(context)
+            self.report({'WARNING'}, f"{self.job_label} stopped by undo after {job.progress} of {job.total}.")
+            return {'CANCELLED'}
+        if event.type == 'ESC':
+            self._end(context)
+            return self.cancel_job(context, job)
+        if event.type != 'TIMER':
+            if event.type in _BLOCKED_EVENTS:
+                modifiers = _BLOCKED_EVENTS[event.type]
+                if modifiers is None or any(getattr(event, attr) for attr in modifiers):
+                    return {'RUNNING_MODAL'}
+            return {'PASS_THROUGH'}
+
+        budget = context.scene.renamer_props.chunk_budget_ms / 1000.0
+        if not job.run(context, budget):
+            context.window_manager.progress_update(job.progress)
+            self._set_progress(context, job.progress / job.total, f"{self.job_label} {job.progress} / {job.total}  (Esc to cancel)")
+            return {'RUNNING_MODAL'}
+        self._end(context)
+        return self.finish(context, job)
+
+    def _end(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        _job_state["job"] = None
+        _job_state["stale"] = False
+        self._set_progress(context, 0.0, "")
+        # Selection changes were held back while the job ran
+        schedule_refresh()
+
+    def _set_progress(self, context, factor, label):
+        props = context.scene.renamer_props
+        props.job_progress = factor
+        props.job_label = label
+        for area in context.screen.areas if context.screen else ():
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
 
 # ─────────── Operators ───────────
 # ─────────── Manage Delete
-class RENAMER_OT_DeleteItem(bpy.types.Operator):
+# Each deleter removes every requested name from one owner and returns the names removed
+def _delete_vertex_groups(context, obj, names):
+    removed = set()
+    for vg in [vg for vg in obj.vertex_groups if vg.name in names]:
+        removed.add(vg.name)
+        obj.vertex_groups.remove(vg)
+    return removed
+
+def _delete_shape_keys(context, obj, names):
+    removed = set()
+    if obj.type != "MESH" or not obj.data.shape_keys: return removed
+    key = obj.data.shape_keys
+    # The basis is kept: removing it would rebase every other key
+    for kb in [kb for kb in key.key_blocks if kb.name in names and kb != key.reference_key]:
+        removed.add(kb.name)
+        obj.shape_key_remove(kb)
+    return removed
+
+def _delete_uv_maps(context, obj, names):
+    removed = set()
+    if obj.type != "MESH": return removed
+    for uv in [uv for uv in obj.data.uv_layers if uv.name in names]:
+        removed.add(uv.name)
+        obj.data.uv_layers.remove(uv)
+    return removed
+
+def _clear_materials(context, obj, names):
+    removed = set()
+    for slot in obj.material_slots:
+        if slot.material and slot.material.name in names:
+            removed.add(slot.material.name)
+            slot.material = None
+    return removed
+
+def _delete_bones(context, obj, names):
+    """Remove all requested bones of one armature in a single edit-mode session."""
+    removed = set()
+    if obj.type != "ARMATURE": return removed
+    view_layer = context.view_layer
+    prev_active = view_layer.objects.active
+    prev_mode = obj.mode
+    view_layer.objects.active = obj
+    if prev_mode != 'EDIT':
+        bpy.ops.object.mode_set(mode='EDIT')
+    try:
+        edit_bones = obj.data.edit_bones
+        for bone in [b for b in edit_bones if b.name in names]:
+            removed.add(bone.name)
+            edit_bones.remove(bone)
+    finally:
+        if prev_mode != 'EDIT':
+            bpy.ops.object.mode_set(mode=prev_mode)
+        view_layer.objects.active = prev_active
+    return removed
+
+_DELETERS = {
+    "vertex_groups": _delete_vertex_groups,
+    "shape_keys": _delete_shape_keys,
+    "uv_maps": _delete_uv_maps,
+    "materials": _clear_materials,
+    "bones": _delete_bones,
+}
+
+# Source types whose rows are whole datablocks, removed together via bpy.data.batch_remove.
+# Rows without an owner (whole-file mode) are always removed that way.
+_ID_COLLECTIONS = {"objects", "actions"}
+
+
+# Names handed to one deleter / batch_remove call; keeps chunked deletes responsive
+_DELETE_SLICE = 512
+
+
+class DeleteJob:
+    """
+    Deletion of the selected rows, grouped per (source type, owner) and cut into
+    slices that run() works through until its time budget is spent.
+    Deleted datablocks cannot be restored in place, so there is no rollback.
+    """
+
+    def __init__(self, props, index=-1):
+        # Group rows by source type and owner: {(source_type, obj_name): {name: [row indices]}}
+        # Grouped rows fan out to each owner; whole datablocks are removed once
+        groups = {}
+        self.owners_left = {}  # {row index: owners the name is still to be removed from}
+        for idx, row in enumerate(read_rows(props)):
+            if not row.selected:
+                continue
+            if index >= 0 and idx != index:
+                continue
+            stype = row.source_type
+            owners = ("",) if stype in _ID_COLLECTIONS or not row.obj_name else row.owners
+            if owners[0]:
+                self.owners_left[idx] = list(owners)
+            for owner in owners:
+                rows = groups.setdefault((stype, owner), {})
+                rows.setdefault(row.current_name, []).append(idx)
+
+        self.units = []
+        for (stype, obj_name), rows in groups.items():
+            names = list(rows)
+            for start in range(0, len(names), _DELETE_SLICE):
+                self.units.append((stype, obj_name, {name: rows[name] for name in names[start:start + _DELETE_SLICE]}))
+        self.total = sum(len(rows) for _, _, rows in self.units)
+        self.progress = 0
+        self.removed_rows = []
+        self.removed_names = []
+        self.failed = []
+        self._next = 0
+
+    @property
+    def done(self):
+        return self._next >= len(self.units)
+
+    @timed("DeleteJob.run")
+    def run(self, context, budget=None):
+        """Delete slice by slice until done or budget seconds are spent. Returns True when done."""
+        deadline = None if budget is None else time.perf_counter() + budget
+        removed = len(self.removed_names)
+        while not self.done:
+            stype, obj_name, rows = self.units[self._next]
+            self._next += 1
+            self._delete(context, stype, obj_name, rows)
+            self.progress += len(rows)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        profiling.count("deletes applied", len(self.removed_names) - removed)
+        return self.done
+
+    def _delete(self, context, stype, obj_name, rows):
+        if not obj_name:
+            collection = getattr(bpy.data, stype)
+            batch = []
+            for name, idxs in rows.items():
+                datablock = collection.get(name)
+                if datablock:
+                    batch.append((datablock, name, idxs))
+                else:
+                    self.failed.append(f"{name} (not found)")
+            if not batch:
+                return
+            try:
+                bpy.data.batch_remove(ids=[datablock for datablock, _, _ in batch])
+            except Exception as e:
+                self.failed.extend(f"{name} ({e})" for _, name, _ in batch)
+                return
+            for _, name, idxs in batch:
+                self.removed_names.append(name)
+                self.removed_rows.extend(idxs)
+            return
+
+        obj = bpy.data.objects.get(obj_name)
+        deleter = _DELETERS.get(stype)
+        if obj is None or deleter is None:
+            self.failed.extend(f"{name} (owner not found)" for name in rows)
+            return
+        try:
+            removed = deleter(context, obj, set(rows))
+        except Exception as e:
+            self.failed.extend(f"{name} ({e})" for name in rows)
+            return
+        for name, idxs in rows.items():
+            if name not in removed:
+                self.failed.append(f"{name} (not removed)")
+                continue
+            self.removed_names.append(name)
+            # A grouped row goes once the name is gone from every owner
+            for idx in idxs:
+                left = self.owners_left[idx]
+                left.remove(obj_name)
+                if not left:
+                    self.removed_rows.append(idx)
+
+
+class RENAMER_OT_DeleteItem(ChunkedRun, bpy.types.Operator):
     bl_idname = "renamer.delete_item"
     bl_label = "Delete Item"
+    bl_options = {'REGISTER', 'UNDO'}
     index: bpy.props.IntProperty(default=-1)
+    job_label = "Deleting"
+
+    def make_job(self, context):
+        return DeleteJob(context.scene.renamer_props, self.index)
+
+    def cancel_job(self, context, job):
+        # Deletions cannot be undone in place: keep what is gone and record it as one undo step
+        self.report({'WARNING'}, f"Delete cancelled after {job.progress} of {job.total}; undo restores them.")
+        return self.finish(context, job)
+
+    def finish(self, context, job):
+        props = context.scene.renamer_props
+        store = row_store(props)
+        # Grouped rows only partly deleted (failed or cancelled) keep the owners still holding the name
+        regrouped = False
+        for idx, left in job.owners_left.items():
+            row = store.rows[idx]
+            if left and len(left) != len(row.owners):
+                row.obj_name = sys.intern(OWNER_SEP.join(left))
+                regrouped = True
+        # Drop the deleted rows from the table
+        if job.removed_rows or regrouped:
+            store.remove(job.removed_rows)
+
+        if job.removed_names:
+            self.report({'INFO'}, f"Deleted {len(job.removed_names)}: {_summarize(job.removed_names)}")
+        if job.failed:
+            self.report({'WARNING'}, f"Delete failed for {len(job.failed)}: {_summarize(job.failed)}")
+        props.items_version += 1
+        sync_window(props)
+        _namespace_names.clear()
+        validate_items(props)
+        return {'FINISHED'}
+
+
+def _summarize(names, limit=10):
+    shown = ", ".join(names[:limit])
+    return shown if len(names) <= limit else f"{shown}, … (+{len(names) - limit} more)"
+
+# ─────────── Manage Pages (whole-file mode)
+class RENAMER_OT_FilePage(bpy.types.Operator):
+    bl_idname = "renamer.file_page"
+    bl_label = "Change Page"
+    step: bpy.props.IntProperty(default=1)
 
     def execute(self, context):
         props = context.scene.renamer_props
-        sel_objs = context.selected_objects
+        if self.step > 0 and not props.file_has_more:
+            return {'CANCELLED'}
+        props.file_page = max(0, props.file_page + self.step)
+        return {'FINISHED'}
 
-        # Collect indices first to avoid messing up collection while removing
-        remove_indices = []
-        for idx, item in enumerate(props.items):
-            if not item.selected:
-                continue
-            if self.index >= 0 and idx != self.index:
-                continue
-            remove_indices.append(idx)
+class RENAMER_OT_TablePage(bpy.types.Operator):
+    bl_idname = "renamer.table_page"
+    bl_label = "Scroll Table"
+    bl_description = "Show the previous or next block of rows"
+    step: bpy.props.IntProperty(default=1)
 
-        for idx in reversed(remove_indices):
-            item = props.items[idx]
-            obj = bpy.data.objects.get(item.obj_name)
-            stype = item.source_type
-            try:
-                if stype == "objects" and obj:
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                elif stype == "vertex_groups" and obj:
-                    vg = obj.vertex_groups.get(item.current_name)
-                    if vg: obj.vertex_groups.remove(vg)
-                elif stype == "shape_keys" and obj.type == "MESH":
-                    if obj.data.shape_keys:
-                        kb = obj.data.shape_keys.key_blocks.get(item.current_name)
-                        if kb and kb.name != "Basis":
-                            obj.shape_key_remove(kb)
-                elif stype == "uv_maps" and obj.type == "MESH":
-                    uv = obj.data.uv_layers.get(item.current_name)
-                    if uv:
-                        obj.data.uv_layers.remove(uv)
-                elif stype == "materials" and obj:
-                    for slot in obj.material_slots:
-                        if slot.material and slot.material.name == item.current_name:
-                            slot.material = None
-                elif stype == "bones" and obj.type == "ARMATURE":
-                    bpy.context.view_layer.objects.active = obj
-                    prev_mode = bpy.context.mode
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    edit_bone = obj.data.edit_bones.get(item.current_name)
-                    if edit_bone: obj.data.edit_bones.remove(edit_bone)
-                    bpy.ops.object.mode_set(mode=prev_mode)
-                elif stype == "actions":
-                    act = bpy.data.actions.get(item.current_name)
-                    if act: bpy.data.actions.remove(act)
-                props.items.remove(idx)
-            except Exception as e:
-                self.report({'WARNING'}, f"Delete failed for {item.current_name}: {e}")
+    def execute(self, context):
+        props = context.scene.renamer_props
+        start = props.window_start + self.step * props.window_size
+        if start < 0 or start >= props.row_count:
+            return {'CANCELLED'}
+        props.window_start = start
+        props.active_index = 0
+        sync_window(props)
         return {'FINISHED'}
 
 # ─────────── Manage Prefix
@@ -156,13 +635,234 @@ class RENAMER_OT_ApplyPrefix(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        for item in props.items:
-            if item.selected and props.prefix_text:
-                item.new_name = f"{props.prefix_text}{item.current_name}"
+        rows = read_rows(props)
+        write_names(props, rows, planner.apply_prefix(rows, props.prefix_text))
         # Clear the input field after applying
         props.prefix_text = ""
         return {'FINISHED'}
 
+# ─────────── Manage Find / Replace
+def run_find_replace(props, live=False):
+    """
+    Recompute new names for the selected rows in one batch pass. The live preview
+    only rewrites names it wrote itself (see planner.preview_find_replace); an
+    explicit apply overwrites and keeps the result. Returns (matched, error).
+    """
+    rows = read_rows(props)
+    args = (rows, props.find_text, props.replace_text, props.find_mode, props.find_case_sensitive)
+    try:
+        if live:
+            changed, _find_state["preview"] = planner.preview_find_replace(*args, owned=_find_state["preview"])
+        else:
+            changed = planner.apply_find_replace(*args)
+            _find_state["preview"] = {}
+    except re.error as e:
+        props.find_status = f"Invalid pattern: {e}"
+        return 0, str(e)
+    write_names(props, rows, changed)
+    matched = len(_find_state["preview"]) if live else sum(1 for r in rows if r.selected and r.new_name != r.current_name)
+    props.find_status = f"{matched} match(es)" if props.find_text else ""
+    return matched, None
+
+
+# preview: {store row: name the live preview wrote into it}
+_find_state = {"scheduled": False, "preview": {}}
+
+
+def schedule_find_preview(*_args):
+    """Coalesce edits of the find/replace fields into one preview pass."""
+    if _find_state["scheduled"]:
+        return
+    _find_state["scheduled"] = True
+    bpy.app.timers.register(_run_find_preview, first_interval=0.0)
+
+
+def _run_find_preview():
+    _find_state["scheduled"] = False
+    scene = bpy.context.scene
+    if scene:
+        run_find_replace(scene.renamer_props, live=True)
+    return None
+
+
+class RENAMER_OT_FindReplace(bpy.types.Operator):
+    bl_idname = "renamer.find_replace"
+    bl_label = "Find / Replace"
+    bl_description = "Replace matches in the selected items' names (text, regex or glob)"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        if not props.find_text:
+            self.report({'INFO'}, "Nothing to find.")
+            return {'CANCELLED'}
+        matched, error = run_find_replace(props)
+        if error:
+            self.report({'ERROR'}, f"Invalid pattern: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{matched} name(s) matched.")
+        return {'FINISHED'}
+
+# ─────────── Manage Pipeline
+# Pipeline steps are stored as RNA for the panel and converted to planner rules,
+# the same format batch.py reads from rule files (and presets are saved in).
+def step_to_rule(step):
+    op = step.op
+    if op == "strip": rule = {"op": op, "chars": step.text}
+    elif op == "replace": rule = {"op": op, "find": step.text, "replace": step.replace,
+                                  "mode": step.match_mode, "case_sensitive": step.case_sensitive}
+    elif op == "case": rule = {"op": op, "mode": step.case_mode}
+    elif op in {"prefix", "suffix"}: rule = {"op": op, "text": step.text}
+    elif op == "sequence": rule = {"op": op, "base": step.text, "start": step.start,
+                                   "last": step.last, "reverse": step.reverse}
+    else: rule = {"op": op}
+    if not step.enabled:
+        rule["enabled"] = False
+    return rule
+
+def rule_to_step(rule, step):
+    op = rule["op"]
+    step.op = op
+    step.enabled = rule.get("enabled", True)
+    if op == "strip": step.text = rule.get("chars", "")
+    elif op == "replace":
+        step.text = rule.get("find", "")
+        step.replace = rule.get("replace", "")
+        step.match_mode = rule.get("mode", "LITERAL")
+        step.case_sensitive = rule.get("case_sensitive", True)
+    elif op == "case": step.case_mode = rule.get("mode", "UPPER")
+    elif op in {"prefix", "suffix"}: step.text = rule.get("text", "")
+    elif op == "sequence":
+        step.text = rule.get("base", "")
+        step.start = rule.get("start", "1")
+        step.last = rule.get("last", "")
+        step.reverse = rule.get("reverse", False)
+
+def pipeline_rules(props):
+    return [step_to_rule(step) for step in props.pipeline]
+
+
+class RENAMER_OT_ApplyPipeline(bpy.types.Operator):
+    bl_idname = "renamer.apply_pipeline"
+    bl_label = "Apply Pipeline"
+    bl_description = "Run all pipeline steps over the selected items in one pass"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        if not props.pipeline:
+            self.report({'INFO'}, "Pipeline is empty.")
+            return {'CANCELLED'}
+        rows = read_rows(props)
+        try:
+            changed = planner.apply_rules(rows, pipeline_rules(props))
+        except (ValueError, re.error) as e:
+            self.report({'ERROR'}, f"Invalid pipeline: {e}")
+            return {'CANCELLED'}
+        write_names(props, rows, changed)
+        return {'FINISHED'}
+
+class RENAMER_OT_PipelineAdd(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_add"
+    bl_label = "Add Step"
+    op: bpy.props.EnumProperty(name="Step", items=STEP_OPS, default="prefix")
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        step = props.pipeline.add()
+        step.op = self.op
+        props.pipeline_index = len(props.pipeline) - 1
+        return {'FINISHED'}
+
+class RENAMER_OT_PipelineRemove(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_remove"
+    bl_label = "Remove Step"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        if not 0 <= props.pipeline_index < len(props.pipeline):
+            return {'CANCELLED'}
+        props.pipeline.remove(props.pipeline_index)
+        props.pipeline_index = min(props.pipeline_index, len(props.pipeline) - 1)
+        return {'FINISHED'}
+
+class RENAMER_OT_PipelineMove(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_move"
+    bl_label = "Move Step"
+    direction: bpy.props.EnumProperty(items=[("UP", "Up", ""), ("DOWN", "Down", "")], default="UP")
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        src = props.pipeline_index
+        dst = src - 1 if self.direction == "UP" else src + 1
+        if not (0 <= src < len(props.pipeline) and 0 <= dst < len(props.pipeline)):
+            return {'CANCELLED'}
+        props.pipeline.move(src, dst)
+        props.pipeline_index = dst
+        return {'FINISHED'}
+
+
+# ─────────── Manage Pipeline Presets
+def presets_dir():
+    return bpy.utils.user_resource('SCRIPTS', path=os.path.join("presets", "renamer_pipeline"), create=True)
+
+def list_pipeline_presets():
+    folder = presets_dir()
+    if not folder or not os.path.isdir(folder):
+        return []
+    return sorted(f[:-5] for f in os.listdir(folder) if f.endswith(".json"))
+
+def _preset_path(name):
+    return os.path.join(presets_dir(), bpy.path.display_name_to_filepath(name) + ".json")
+
+class RENAMER_OT_PipelinePresetSave(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_preset_save"
+    bl_label = "Save Pipeline Preset"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        name = props.pipeline_preset_name.strip()
+        if not name:
+            self.report({'INFO'}, "Enter a preset name first.")
+            return {'CANCELLED'}
+        with open(_preset_path(name), "w", encoding="utf-8") as fh:
+            json.dump({"rules": pipeline_rules(props)}, fh, indent=2)
+        props.pipeline_preset_name = ""
+        self.report({'INFO'}, f"Saved pipeline preset '{name}'.")
+        return {'FINISHED'}
+
+class RENAMER_OT_PipelinePresetLoad(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_preset_load"
+    bl_label = "Load Pipeline Preset"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        name = props.pipeline_preset
+        path = _preset_path(name)
+        if name == "NONE" or not os.path.isfile(path):
+            self.report({'INFO'}, "No preset selected.")
+            return {'CANCELLED'}
+        try:
+            with open(path, encoding="utf-8") as fh:
+                rules = json.load(fh).get("rules", [])
+            planner.check_rules(rules)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not load preset '{name}': {e}")
+            return {'CANCELLED'}
+        props.pipeline.clear()
+        for rule in rules:
+            rule_to_step(rule, props.pipeline.add())
+        props.pipeline_index = 0
+        return {'FINISHED'}
+
+class RENAMER_OT_PipelinePresetDelete(bpy.types.Operator):
+    bl_idname = "renamer.pipeline_preset_delete"
+    bl_label = "Delete Pipeline Preset"
+
+    def execute(self, context):
+        path = _preset_path(context.scene.renamer_props.pipeline_preset)
+        if os.path.isfile(path):
+            os.remove(path)
+        return {'FINISHED'}
+
 # ─────────── Manage Suffix
 class RENAMER_OT_ApplySuffix(bpy.types.Operator):
     bl_idname = "renamer.apply_suffix"
@@ -170,9 +870,8 @@ class RENAMER_OT_ApplySuffix(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        for item in props.items:
-            if item.selected and props.suffix_text:
-                item.new_name = f"{item.current_name}{props.suffix_text}"
+        rows = read_rows(props)
+        write_names(props, rows, planner.apply_suffix(rows, props.suffix_text))
         # Clear the input field after applying
         props.suffix_text = ""
         return {'FINISHED'}
@@ -189,21 +888,20 @@ class RENAMER_OT_ApplySequence(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        selected_items = [i for i in props.items if i.selected]
+        rows = read_rows(props)
 
-        if not selected_items:
+        if not any(r.selected for r in rows):
             self.report({'INFO'}, "No items selected for sequencing.")
             return {'CANCELLED'}
 
-        if self.direction == "UP":
-            selected_items.reverse()
-
         base = props.seq_base.strip() if props.seq_base else ""
         start = props.seq_start.strip() if props.seq_start else ""
         last = props.seq_last.strip() if props.seq_last else ""
 
-        for idx, item in enumerate(selected_items):
-            item.new_name = generate_sequence(base, start, idx, last)
+        # Spatial and hierarchy orders read positions / parents from the scene
+        with profiling.timer("ordering.sequence_order"):
+            order = ordering.sequence_order(rows, props.seq_order)
+        write_names(props, rows, planner.apply_sequence(rows, base, start, last, self.direction == "UP", order))
 
         # Optionally clear fields after applying
         props.seq_base = ""
@@ -219,14 +917,39 @@ class RENAMER_OT_Mirror(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        item = props.items[self.index]
+        rows = read_rows(props)
+        if not 0 <= self.index < len(rows):
+            return {'CANCELLED'}
 
         # Toggle mirror behavior
         # If mirroring the current new_name gives us the current_name → revert
-        if mirror_name(item.new_name) == item.current_name:
-            item.new_name = item.current_name
-        else:
-            item.new_name = mirror_name(item.current_name)
+        write_names(props, rows, planner.toggle_mirror(rows, self.index))
+        return {'FINISHED'}
+
+class RENAMER_OT_MirrorSelectIssues(bpy.types.Operator):
+    bl_idname = "renamer.mirror_select_issues"
+    bl_label = "Select Mirror Issues"
+    bl_description = "Select rows with a side but no partner, and pairs whose new names do not mirror each other"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        store = row_store(props)
+        rows = store.rows
+        mismatched = planner.mismatched_pairs(rows, store.partners)
+        issues = set(store.unpaired)
+        issues.update(mismatched)
+        issues.update(store.partners[idx] for idx in mismatched)
+        if not issues:
+            self.report({'INFO'}, "Every side has a matching partner.")
+            return {'CANCELLED'}
+        for idx, row in enumerate(rows):
+            row.selected = idx in issues
+        write_selection(props, rows)
+        if store.unpaired:
+            self.report({'WARNING'}, f"Unpaired: {_summarize([rows[idx].current_name for idx in store.unpaired])}")
+        if mismatched:
+            names = [f"{rows[idx].new_name} / {rows[store.partners[idx]].new_name}" for idx in mismatched]
+            self.report({'WARNING'}, f"Mismatched: {_summarize(names)}")
         return {'FINISHED'}
 
 # ─────────── Manage Case Convertion
@@ -237,9 +960,8 @@ class RENAMER_OT_CaseConversion(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        for item in props.items:
-            if item.selected:
-                item.new_name = apply_case(item.current_name, self.mode)
+        rows = read_rows(props)
+        write_names(props, rows, planner.apply_case_rows(rows, self.mode))
         return {'FINISHED'}
 
 # ─────────── Manage Clear
@@ -249,8 +971,8 @@ class RENAMER_OT_Clear(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        for item in props.items:
-            item.new_name = ""
+        rows = read_rows(props)
+        write_names(props, rows, planner.clear_names(rows))
         self.report({'INFO'}, "Cleared all new names.")
         return {'FINISHED'}
 
@@ -261,88 +983,964 @@ class RENAMER_OT_InvertSelection(bpy.types.Operator):
 
     def execute(self, context):
         props = context.scene.renamer_props
-        if not props.items:
+        rows = read_rows(props)
+        if not rows:
             self.report({'INFO'}, "No items to invert.")
             return {'CANCELLED'}
 
-        for item in props.items:
-            item.selected = not item.selected
+        planner.invert_selection(rows)
+        write_selection(props, rows)
+        return {'FINISHED'}
 
+# ─────────── Manage Search
+# The search field selects rows through the store's name index: a keystroke is
+# an index query plus a selection update, not a scan of RNA rows.
+@timed("run_search")
+def run_search(props, action="SET", live=False):
+    """Select (SET), add (ADD) or deselect (REMOVE) the rows matching the search field. Returns the match count."""
+    store = row_store(props)
+    if not props.search_text:
+        props.search_status = ""
+        return 0
+    matches = store.search_index().search(props.search_text, props.search_mode)
+    if action == "SET":
+        known = _search_state["selection"]
+        # While the selection is still the previous match set, only the rows
+        # entering or leaving it change; anything else needs one full pass
+        flips = known[1] ^ matches if known is not None and known[0] is store else store.rows
+        for row in flips:
+            row.selected = row in matches
+    else:
+        for row in matches:
+            row.selected = action == "ADD"
+    write_selection(props, store.rows, live)
+    if action == "SET":
+        _search_state["selection"] = (store, matches)
+    props.search_status = f"{len(matches)} match(es)"
+    return len(matches)
+
+
+# selection: (store, rows) while the store's selection is exactly the last SET match set
+_search_state = {"scheduled": False, "selection": None}
+
+
+def schedule_search(*_args):
+    """Coalesce keystrokes in the search field into one query."""
+    if _search_state["scheduled"]:
+        return
+    _search_state["scheduled"] = True
+    bpy.app.timers.register(_run_search_preview, first_interval=0.0)
+
+
+def _run_search_preview():
+    _search_state["scheduled"] = False
+    scene = bpy.context.scene
+    if scene:
+        run_search(scene.renamer_props, live=True)
+    return None
+
+
+class RENAMER_OT_SearchSelect(bpy.types.Operator):
+    bl_idname = "renamer.search_select"
+    bl_label = "Select Matches"
+    bl_description = "Select only the matching rows, add them to the selection or deselect them"
+    action: bpy.props.EnumProperty(
+        items=[("SET", "Select", ""), ("ADD", "Add", ""), ("REMOVE", "Remove", "")],
+        default="SET"
+    )
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        if not props.search_text:
+            self.report({'INFO'}, "Nothing to search for.")
+            return {'CANCELLED'}
+        run_search(props, self.action)
         return {'FINISHED'}
 
 # ─────────── Manage Execute
-class RENAMER_OT_Execute(bpy.types.Operator):
+def rename_namespace(item, obj):
+    """
+    Return (namespace_key, collection) that holds the datablock an item (or row) renames.
+    Names are unique per namespace, so collisions are resolved per namespace.
+    """
+    stype = item.source_type
+    if stype in FILE_SOURCES:
+        return (stype,), getattr(bpy.data, stype)
+    if obj is None:
+        return None, None
+    if stype == "vertex_groups":
+        return ("vertex_groups", obj.name), obj.vertex_groups
+    if stype == "shape_keys" and obj.type == "MESH" and obj.data.shape_keys:
+        return ("shape_keys", obj.data.shape_keys.name), obj.data.shape_keys.key_blocks
+    if stype == "uv_maps" and obj.type == "MESH":
+        return ("uv_maps", obj.data.name), obj.data.uv_layers
+    if stype == "bones" and obj.type == "ARMATURE":
+        # In edit mode the edit bones are authoritative and overwrite data.bones on exit
+        bones = obj.data.edit_bones if obj.mode == 'EDIT' else obj.data.bones
+        return ("bones", obj.data.name), bones
+    return None, None
+
+
+def namespace_resolver():
+    """
+    Return (namespace_of, collections) for planner.group_moves: namespace_of(row)
+    gives the row's namespace key and records its RNA collection in collections.
+    """
+    collections = {}
+    owners = {}
+
+    def namespace_of(row):
+        if row.obj_name not in owners:
+            owners[row.obj_name] = bpy.data.objects.get(row.obj_name)
+        ns_key, collection = rename_namespace(row, owners[row.obj_name])
+        if ns_key is not None and ns_key not in collections:
+            collections[ns_key] = collection
+        return ns_key
+
+    return namespace_of, collections
+
+
+def namespace_collection(ns_key):
+    """The RNA collection behind a namespace key from rename_namespace(), or None if it is gone."""
+    stype = ns_key[0]
+    if stype in FILE_SOURCES:
+        return getattr(bpy.data, stype)
+    owner = ns_key[1]
+    if stype == "vertex_groups":
+        obj = bpy.data.objects.get(owner)
+        return obj.vertex_groups if obj else None
+    if stype == "shape_keys":
+        key = bpy.data.shape_keys.get(owner)
+        return key.key_blocks if key else None
+    if stype == "uv_maps":
+        mesh = bpy.data.meshes.get(owner)
+        return mesh.uv_layers if mesh else None
+    if stype == "bones":
+        arm = bpy.data.armatures.get(owner)
+        if arm is None:
+            return None
+        return arm.edit_bones if arm.is_editmode else arm.bones
+    return None
+
+
+class RenameJob:
+    """
+    Renames planned namespace by namespace up front and applied step by step by
+    run(). Applied steps are recorded so rollback() can restore the original names.
+
+    groups: {namespace_key: [(key, old, new)]}, collections: {namespace_key: RNA collection}
+    """
+
+    def __init__(self, groups, collections, messages=None):
+        self.messages = list(messages or ())
+        self.origin = {}  # {key: (namespace_key, old)}
+        self.steps = []  # (key, datablock, from_name, to_name, is_final)
+        for ns_key, moves in groups.items():
+            collection = collections.get(ns_key)
+            if collection is None:
+                self.messages.extend(('WARNING', f"Rename failed for {old}: {ns_key[-1]} not found") for _, old, _ in moves)
+                continue
+            moves = [(key, old, truncate_name(new)) for key, old, new in moves]
+            # One name index per namespace; steps then address datablocks directly
+            index = {d.name: d for d in collection}
+            steps, conflicts = plan_renames(moves, index)
+            for key, old, new, reason in conflicts:
+                self.messages.append(('WARNING', f"Rename skipped for {old} → {new}: {reason}"))
+
+            targets = {key: index[old] for key, old, _ in moves if old in index}
+            finals = {key: new for key, _, new in moves}
+            self.origin.update((key, (ns_key, old)) for key, old, _ in moves)
+            self.steps.extend((key, targets[key], src, dst, dst == finals[key]) for key, src, dst in steps)
+
+        self.total = len(self.steps)
+        self.progress = 0
+        self.renamed = {}  # {key: name Blender stored}
+        self.applied = []  # (datablock, previous name) in apply order
+        self.references = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Every rename requested by table rows, grouped rows fanned out to each owner.
+        Keys index the fanned-out rows; job.row_of maps them back to table rows.
+        """
+        rows, row_of = planner.fan_out(rows)
+        namespace_of, collections = namespace_resolver()
+        groups, orphans = planner.group_moves(rows, namespace_of)
+        messages = [('WARNING', f"Rename failed for {rows[idx].current_name}: source not found") for idx in orphans]
+        job = cls(groups, collections, messages)
+        job.row_of = row_of
+        return job
+
+    @classmethod
+    def from_journal(cls, entries, reverse=False):
+        """Replay (or with reverse=True, undo) a journal batch; keys are entry indices."""
+        groups = planner.journal_moves(entries, reverse)
+        return cls(groups, {ns_key: namespace_collection(ns_key) for ns_key in groups})
+
+    def journal_entries(self):
+        """(namespace_key, old, new) for every completed rename, as Blender stored it."""
+        return [(*self.origin[key], name) for key, name in self.renamed.items()]
+
+    @timed("references.build_index")
+    def index_references(self):
+        """Opt-in repair stage: scan the file once, before any step runs, for references to renamed names."""
+        kinds = {ns_key[0] for ns_key, _ in self.origin.values()} & set(references.KINDS)
+        if kinds:
+            self.references = references.build_index(kinds)
+
+    def repair_references(self):
+        """Point indexed references at the new names. Returns how many were rewritten."""
+        return self.references.repair(self.journal_entries()) if self.references else 0
+
+    @property
+    def done(self):
+        return self.progress >= self.total
+
+    @timed("RenameJob.run")
+    def run(self, context=None, budget=None):
+        """Apply steps until done or budget seconds are spent. Returns True when done."""
+        deadline = None if budget is None else time.perf_counter() + budget
+        applied = len(self.applied)
+        steps = self.steps
+        while self.progress < self.total:
+            idx, target, src, dst, final = steps[self.progress]
+            self.progress += 1
+            try:
+                target.name = dst
+            except Exception as e:
+                self.messages.append(('WARNING', f"Rename failed for {src}: {e}"))
+                continue
+            self.applied.append((target, src))
+            if final:
+                self.renamed[idx] = target.name
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        profiling.count("renames applied", len(self.applied) - applied)
+        return self.done
+
+    def rollback(self):
+        """Undo the applied steps, newest first; each one vacated the name the previous step needs."""
+        for target, src in reversed(self.applied):
+            target.name = src
+        self.applied.clear()
+        self.renamed.clear()
+
+
+def apply_renames(rows):
+    """
+    Plan and apply every rename requested by rows, namespace by namespace.
+    Returns (renamed, messages): {row_idx: name Blender stored} for completed
+    renames, and [(level, text)] warnings for skipped or failed ones.
+    """
+    job = RenameJob.from_rows(rows)
+    job.run()
+    return {job.row_of[key]: name for key, name in job.renamed.items()}, job.messages
+
+
+class RENAMER_OT_Execute(ChunkedRun, bpy.types.Operator):
     bl_idname = "renamer.execute"
     bl_label = "Execute Rename"
-    
+    bl_options = {'REGISTER', 'UNDO'}
+    job_label = "Renaming"
+
+    def make_job(self, context):
+        props = context.scene.renamer_props
+        job = RenameJob.from_rows(read_rows(props))
+        if props.repair_references:
+            job.index_references()
+        return job
+
+    def cancel_job(self, context, job):
+        applied = len(job.applied)
+        job.rollback()
+        self.report({'INFO'}, f"Rename cancelled; {applied} applied step(s) rolled back.")
+        return {'CANCELLED'}
+
+    def finish(self, context, job):
+        props = context.scene.renamer_props
+        renamed = job.renamed
+        for level, text in job.messages:
+            self.report({level}, text)
+
+        # {row: names stored for its owners}; a grouped row whose owners ended up
+        # with different names (or were only partly renamed) is split by a reload
+        stored = {}
+        for key, name in renamed.items():
+            stored.setdefault(job.row_of[key], set()).add(name)
+        rows = read_rows(props)
+        grouped = False
+        for idx, names in stored.items():
+            row = rows[idx]
+            grouped = grouped or OWNER_SEP in row.obj_name
+            name = min(names)
+            row.current_name = name
+            row.new_name = name  # Blender may have truncated or suffixed it
+            if row.source_type == "objects" and props.scope != "FILE":
+                row.obj_name = name  # Whole-file rows have no owner
+        row_store(props).renamed(stored)
+        sync_window(props)
+
+        _after_renames(self, job)
+        record_batch(props, job.journal_entries(), f"Execute ({props.property_type.replace('_', ' ').title()})")
+        props.items_version += 1
+        _namespace_names.clear()
+        if grouped:
+            _reload_table(context)
+        else:
+            validate_items(props)
+        self.report({'INFO'}, f"Renamed {len(renamed)} item(s).")
+        return {'FINISHED'}
+
+
+def _after_renames(op, job):
+    """Reference repair, lint invalidation and a table refresh, shared by every rename job's finish."""
+    _linter.touch(job.journal_entries())
+    # Whole-file pages are sorted by name, so renames can move rows between pages
+    schedule_refresh()
+    fixed = job.repair_references()
+    if fixed:
+        op.report({'INFO'}, f"Updated {fixed} reference(s) in actions, drivers, constraints and modifiers.")
+
+
+# ─────────── Rename Journal ───────────
+# Every executed batch is kept in the .blend (props.journal, oldest first) so it
+# can be reverted or re-applied later, independently of Blender's undo history.
+def record_batch(props, entries, label):
+    if not entries:
+        return
+    batch = props.journal.add()
+    batch.label = label
+    batch.time = time.strftime("%Y-%m-%d %H:%M")
+    batch.count = len(entries)
+    batch.payload = planner.pack_journal(entries)
+    while len(props.journal) > props.journal_limit:
+        props.journal.remove(0)
+    props.journal_index = len(props.journal) - 1
+
+
+def _reload_table(context):
+    _refresh_state["fingerprint"] = None
+    _namespace_names.clear()
+    refresh_table(context.scene, context)
+
+
+class RENAMER_OT_JournalReplay(ChunkedRun, bpy.types.Operator):
+    bl_idname = "renamer.journal_replay"
+    bl_label = "Revert / Re-apply Batch"
+    bl_description = "Revert a recorded rename batch, or apply it again"
+    bl_options = {'REGISTER', 'UNDO'}
+    index: bpy.props.IntProperty(default=-1)
+    revert: bpy.props.BoolProperty(default=True)
+
+    @property
+    def job_label(self):
+        return "Reverting" if self.revert else "Re-applying"
+
+    def _batch(self, context):
+        props = context.scene.renamer_props
+        index = self.index if self.index >= 0 else props.journal_index
+        return props.journal[index] if 0 <= index < len(props.journal) else None
+
+    def make_job(self, context):
+        batch = self._batch(context)
+        entries = planner.unpack_journal(batch.payload) if batch else []
+        job = RenameJob.from_journal(entries, reverse=self.revert)
+        if context.scene.renamer_props.repair_references:
+            job.index_references()
+        return job
+
+    def cancel_job(self, context, job):
+        job.rollback()
+        return {'CANCELLED'}
+
+    def finish(self, context, job):
+        for level, text in job.messages:
+            self.report({level}, text)
+        _after_renames(self, job)
+        batch = self._batch(context)
+        if batch and job.renamed:
+            batch.reverted = self.revert
+        _reload_table(context)
+        self.report({'INFO'}, f"{'Reverted' if self.revert else 'Re-applied'} {len(job.renamed)} of {job.total} rename(s).")
+        return {'FINISHED'}
+
+
+class RENAMER_OT_JournalClear(bpy.types.Operator):
+    bl_idname = "renamer.journal_clear"
+    bl_label = "Clear Rename History"
+
     def execute(self, context):
         props = context.scene.renamer_props
-        for item in props.items:
-            if not item.selected or not item.new_name: continue
-            obj = bpy.data.objects.get(item.obj_name)
-            stype = item.source_type
-            try:
-                if stype == "objects" and obj: obj.name = item.new_name
-                elif stype == "vertex_groups" and obj:
-                    vg = obj.vertex_groups.get(item.current_name)
-                    if vg: vg.name = item.new_name
-                elif stype == "shape_keys" and obj.data.shape_keys:
-                    kb = obj.data.shape_keys.key_blocks.get(item.current_name)
-                    if kb: kb.name = item.new_name
-                elif stype == "uv_maps" and obj:
-                    uv = obj.data.uv_layers.get(item.current_name)
-                    if uv: uv.name = item.new_name
-                elif stype == "materials" and obj:
-                    for slot in obj.material_slots:
-                        if slot.material and slot.material.name == item.current_name:
-                            slot.material.name = item.new_name; break
-                elif stype == "bones" and obj and obj.type=="ARMATURE":
-                    bone = obj.data.bones.get(item.current_name)
-                    if bone: bone.name = item.new_name
-                elif stype == "actions":
-                    act = bpy.data.actions.get(item.current_name)
-                    if act: act.name = item.new_name
-                item.current_name = item.new_name
-            except Exception as e: self.report({'WARNING'}, f"Rename failed for {item.current_name}: {e}")
+        props.journal.clear()
+        props.journal_index = 0
+        return {'FINISHED'}
+
+
+# ─────────── Rename Maps ───────────
+# Old → new maps from other tools either fill the table's new names or rename
+# the scene directly. Map entries are streamed from disk and looked up in name
+# sets built once per namespace; only matches become rows.
+def map_default_type(props):
+    return (props.datablock_type if props.scope == "FILE" else props.property_type).lower()
+
+
+def map_rows(entries, context):
+    """
+    Rows for every map entry whose old name exists in its namespace. Owner-bound
+    entries without an owner (e.g. bones of any rig) apply to each selected object.
+    Returns (rows, unmatched old names).
+    """
+    names = {}  # {(source_type, owner): names in that namespace}
+    selected = [obj.name for obj in context.selected_objects]
+    rows = []
+    unmatched = []
+    for source_type, owner, old, new in entries:
+        found = False
+        for name in (owner,) if owner or source_type in rename_maps.ID_TYPES else selected:
+            key = (source_type, name)
+            if key not in names:
+                obj = bpy.data.objects.get(name) if name else None
+                _, collection = rename_namespace(Row(name, old, source_type), obj)
+                names[key] = set(collection.keys()) if collection is not None else set()
+            if old in names[key]:
+                rows.append(Row(name, old, source_type, new))
+                found = True
+        if not found:
+            unmatched.append(old)
+    return rows, unmatched
+
+
+def plan_entries(rows):
+    """Map entries for every rename the table would execute, one per owner."""
+    for row in rows:
+        if not row.selected or not row.new_name or row.new_name == row.current_name:
+            continue
+        owners = ("",) if row.source_type in rename_maps.ID_TYPES else row.owners
+        for owner in owners:
+            yield row.source_type, owner, row.current_name, row.new_name
+
+
+def _report_unmatched(op, unmatched):
+    if unmatched:
+        op.report({'WARNING'}, f"{len(unmatched)} map entr{'y' if len(unmatched) == 1 else 'ies'} not found: {_summarize(unmatched)}")
+
+
+class RENAMER_OT_MapApply(bpy.types.Operator):
+    bl_idname = "renamer.map_apply"
+    bl_label = "Fill From Map"
+    bl_description = "Set new names in the table from a rename map, for review before Execute"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        path = bpy.path.abspath(props.map_path)
+        rows = read_rows(props)
+        try:
+            changed, unmatched = planner.apply_map(rows, rename_maps.read_map(path, map_default_type(props)))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read {path}: {e}")
+            return {'CANCELLED'}
+        write_names(props, rows, changed)
+        _report_unmatched(self, [entry[2] for entry in unmatched])
+        self.report({'INFO'}, f"{len(changed)} row(s) set from the map.")
+        return {'FINISHED'}
+
+
+class RENAMER_OT_MapExecute(ChunkedRun, bpy.types.Operator):
+    bl_idname = "renamer.map_execute"
+    bl_label = "Execute Rename Map"
+    bl_description = "Rename every datablock the map names, without listing them in the table first"
+    bl_options = {'REGISTER', 'UNDO'}
+    job_label = "Renaming"
+
+    def make_job(self, context):
+        props = context.scene.renamer_props
+        path = bpy.path.abspath(props.map_path)
+        self.error = None
+        try:
+            with profiling.timer("map_rows"):
+                rows, self.unmatched = map_rows(rename_maps.read_map(path, map_default_type(props)), context)
+        except (OSError, ValueError) as e:
+            rows, self.unmatched = [], []
+            self.error = f"Could not read {path}: {e}"
+        job = RenameJob.from_rows(rows)
+        if props.repair_references:
+            job.index_references()
+        return job
+
+    def cancel_job(self, context, job):
+        applied = len(job.applied)
+        job.rollback()
+        self.report({'INFO'}, f"Rename cancelled; {applied} applied step(s) rolled back.")
+        return {'CANCELLED'}
+
+    def finish(self, context, job):
+        if self.error:
+            self.report({'ERROR'}, self.error)
+            return {'CANCELLED'}
+        for level, text in job.messages:
+            self.report({level}, text)
+        _report_unmatched(self, self.unmatched)
+        _after_renames(self, job)
+        props = context.scene.renamer_props
+        record_batch(props, job.journal_entries(), f"Rename Map ({os.path.basename(props.map_path)})")
+        _reload_table(context)
+        self.report({'INFO'}, f"Renamed {len(job.renamed)} item(s) from the map.")
+        return {'FINISHED'}
+
+
+class RENAMER_OT_MapExport(bpy.types.Operator):
+    bl_idname = "renamer.map_export"
+    bl_label = "Export Rename Map"
+    bl_description = "Write the table's planned renames as CSV, JSON or JSON Lines"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.csv;*.json;*.jsonl", options={'HIDDEN'})
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "renamer_map.csv"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        try:
+            count = rename_maps.write_map(path, plan_entries(read_rows(context.scene.renamer_props)))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not write {path}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {count} rename(s) to {path}")
+        return {'FINISHED'}
+
+
+# ─────────── Naming Lint ───────────
+# While the lint box is open the scene is checked against props.lint_rules. The
+# linter caches results per datablock; the depsgraph handler and rename jobs mark
+# what changed, and a scheduled run re-checks only that.
+_linter = linter.Linter()
+_lint_state = {"scheduled": False}
+# Violations listed in the panel; Fix All covers the rest
+LINT_SHOWN = 30
+
+
+def lint_rules(props):
+    return [{"check": rule.check, "enabled": rule.enabled, "text": rule.text,
+             "source_type": "" if rule.source_type == "ALL" else rule.source_type}
+            for rule in props.lint_rules]
+
+
+def lint_results():
+    return _linter.violations() if _linter.active() else []
+
+
+@timed("run_lint")
+def run_lint(props):
+    """Re-check what changed since the last run and update the status line. Returns the violation count."""
+    try:
+        total = _linter.lint(lint_rules(props))
+    except (ValueError, re.error) as e:
+        _linter.reset()
+        props.lint_status = f"Invalid rule: {e}"
+        return 0
+    profiling.count("lint checks", _linter.checked)
+    props.lint_status = f"{total} issue(s); re-checked {_linter.checked} datablock(s)"
+    return total
+
+
+def schedule_lint(*_args):
+    """Coalesce rule edits and scene updates into one lint run."""
+    if _lint_state["scheduled"]:
+        return
+    _lint_state["scheduled"] = True
+    bpy.app.timers.register(_run_scheduled_lint, first_interval=0.0)
+
+
+def _run_scheduled_lint():
+    _lint_state["scheduled"] = False
+    scene = bpy.context.scene
+    if scene and scene.renamer_props.show_lint and not job_running():
+        run_lint(scene.renamer_props)
+    return None
+
+
+class RENAMER_OT_Lint(bpy.types.Operator):
+    bl_idname = "renamer.lint"
+    bl_label = "Re-check Scene"
+    bl_description = "Drop the cached lint results and check every datablock again"
+
+    def execute(self, context):
+        _linter.reset()
+        run_lint(context.scene.renamer_props)
+        return {'FINISHED'}
+
+
+class RENAMER_OT_LintFix(ChunkedRun, bpy.types.Operator):
+    bl_idname = "renamer.lint_fix"
+    bl_label = "Fix Naming Issue"
+    bl_description = "Rename to the name the rule suggests (index -1 fixes every listed issue that has a fix)"
+    bl_options = {'REGISTER', 'UNDO'}
+    job_label = "Fixing"
+    index: bpy.props.IntProperty(default=-1)
+
+    def make_job(self, context):
+        found = lint_results()
+        picked = found if self.index < 0 else found[self.index:self.index + 1]
+        # One fix per name per run; a name failing several rules is listed again by the next lint
+        rows = {}
+        for source_type, owner, name, _, fix in picked:
+            if fix and (source_type, owner, name) not in rows:
+                rows[(source_type, owner, name)] = Row(owner or name, name, source_type, fix)
+        job = RenameJob.from_rows(list(rows.values()))
+        if context.scene.renamer_props.repair_references:
+            job.index_references()
+        return job
+
+    def cancel_job(self, context, job):
+        applied = len(job.applied)
+        job.rollback()
+        self.report({'INFO'}, f"Rename cancelled; {applied} applied step(s) rolled back.")
+        return {'CANCELLED'}
+
+    def finish(self, context, job):
+        props = context.scene.renamer_props
+        for level, text in job.messages:
+            self.report({level}, text)
+        _after_renames(self, job)
+        record_batch(props, job.journal_entries(), "Lint Fix")
+        _reload_table(context)
+        run_lint(props)
+        self.report({'INFO'}, f"Fixed {len(job.renamed)} name(s).")
+        return {'FINISHED'}
+
+
+class RENAMER_OT_LintRuleAdd(bpy.types.Operator):
+    bl_idname = "renamer.lint_rule_add"
+    bl_label = "Add Rule"
+    check: bpy.props.EnumProperty(name="Rule", items=LINT_CHECKS, default="tail")
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        rule = props.lint_rules.add()
+        rule.check = self.check
+        if self.check == "side":
+            rule.source_type = "bones"
+        props.lint_rule_index = len(props.lint_rules) - 1
+        return {'FINISHED'}
+
+
+class RENAMER_OT_LintRuleDefaults(bpy.types.Operator):
+    bl_idname = "renamer.lint_rule_defaults"
+    bl_label = "Add Common Rules"
+    bl_description = "No .001 tails anywhere, .L/.R sides on deform bones and a UV prefix on UV maps"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        for check, source_type, text in (("tail", "ALL", ""), ("side", "bones", ""), ("prefix", "uv_maps", "UV")):
+            rule = props.lint_rules.add()
+            rule.check, rule.source_type, rule.text = check, source_type, text
+        props.lint_rule_index = len(props.lint_rules) - 1
+        return {'FINISHED'}
+
+
+class RENAMER_OT_LintRuleRemove(bpy.types.Operator):
+    bl_idname = "renamer.lint_rule_remove"
+    bl_label = "Remove Rule"
+
+    def execute(self, context):
+        props = context.scene.renamer_props
+        if not 0 <= props.lint_rule_index < len(props.lint_rules):
+            return {'CANCELLED'}
+        props.lint_rules.remove(props.lint_rule_index)
+        props.lint_rule_index = min(props.lint_rule_index, len(props.lint_rules) - 1)
+        schedule_lint()
         return {'FINISHED'}
 
 
+# ─────────── Pre-flight Validation ───────────
+# Name sets per namespace, built once and reused while names are being edited.
+# Cleared whenever the table is repopulated or datablocks are renamed/deleted.
+_namespace_names = {}
+_validation_state = {"scheduled": False}
+
+
+@timed("validate_items")
+def validate_items(props):
+    """
+    Mark every row whose new_name would collide in its namespace or be truncated.
+    Linear in the number of rows; only rows whose status changes are written.
+    """
+    rows, row_of = planner.fan_out(read_rows(props))
+    namespace_of, collections = namespace_resolver()
+    groups, _ = planner.group_moves(rows, namespace_of)
+
+    problems = {}
+    for ns_key, moves in groups.items():
+        if ns_key not in _namespace_names:
+            _namespace_names[ns_key] = {d.name for d in collections[ns_key]}
+        # A grouped row shows the first problem among its owners
+        for key, reason in find_conflicts(moves, _namespace_names[ns_key]).items():
+            problems.setdefault(row_of[key], reason)
+
+    # The store keeps every row's problem; only the visible window is written to RNA
+    store = row_store(props)
+    store.conflicts = problems
+    writes = 0
+    start = props.window_start
+    for pos, item in enumerate(props.items):
+        reason = problems.get(start + pos, "")
+        if item.conflict != reason:
+            item.conflict = reason
+            writes += 1
+    profiling.count("rna writes", writes)
+    if props.conflict_count != len(problems):
+        props.conflict_count = len(problems)
+
+    unpaired, mismatched = (len(store.unpaired), len(planner.mismatched_pairs(store.rows, store.partners))) \
+        if props.mirror_sync else (0, 0)
+    if props.mirror_unpaired != unpaired:
+        props.mirror_unpaired = unpaired
+    if props.mirror_mismatched != mismatched:
+        props.mirror_mismatched = mismatched
+    return problems
+
+
+def schedule_validation(*_args):
+    """Re-validate once after a burst of edits instead of once per changed row."""
+    if _validation_state["scheduled"]:
+        return
+    _validation_state["scheduled"] = True
+    bpy.app.timers.register(_run_scheduled_validation, first_interval=0.0)
+
+
+def _run_scheduled_validation():
+    _validation_state["scheduled"] = False
+    scene = bpy.context.scene
+    if scene:
+        validate_items(scene.renamer_props)
+    return None
+
+
 # ─────────── Refresh ON selection / property change ───────────
-def refresh_table(scene):
+# Runtime-only state: never saved into the .blend, reset on file load
+_refresh_state = {"fingerprint": None, "scheduled": False}
+_msgbus_owner = object()
+
+
+def _source_names(obj, ptype):
+    """The names of obj that populate_items reads for ptype, without building rows."""
+    if obj.type == "MESH":
+        mesh = obj.data
+        if ptype == "VERTEX_GROUPS":
+            return tuple(obj.vertex_groups.keys())
+        if ptype == "SHAPE_KEYS":
+            return tuple(mesh.shape_keys.key_blocks.keys()) if mesh.shape_keys else ()
+        if ptype == "UV_MAPS":
+            return tuple(mesh.uv_layers.keys())
+        if ptype == "MATERIALS":
+            return tuple(slot.material.name if slot.material else "" for slot in obj.material_slots)
+    elif obj.type == "ARMATURE" and ptype == "BONES":
+        # Edit bones only reach arm.bones when edit mode is left
+        return tuple((obj.data.edit_bones if obj.mode == 'EDIT' else obj.data.bones).keys())
+    if ptype == "ACTIONS" and obj.animation_data and obj.animation_data.action:
+        return (obj.animation_data.action.name,)
+    return ()
+
+
+def selection_fingerprint(context, props):
+    """
+    Cheap identity of what the table shows: scene, selected objects, mode,
+    property type and the names of the shown source. The names catch renames
+    made elsewhere (Outliner, F2, the data properties), which keep every pointer.
+    """
+    if props.scope == "FILE":
+        source = props.datablock_type.lower()
+        return hash((context.scene.as_pointer(), source, tuple(getattr(bpy.data, source).keys()),
+                     props.file_filter, props.file_page, props.file_page_size))
+    ptype = props.property_type
+    return hash((
+        context.scene.as_pointer(),
+        tuple((obj.as_pointer(), obj.name, _source_names(obj, ptype)) for obj in context.selected_objects),
+        context.mode,
+        ptype,
+    ))
+
+
+@timed("refresh_table")
+def refresh_table(scene, context=None):
+    """Repopulate the table only if the selection fingerprint changed. Returns True if it did."""
+    context = context or bpy.context
     props = scene.renamer_props
-    sel_objs = list(bpy.context.selected_objects)
-    sel_names = [obj.name for obj in sel_objs]
+    # Rows are addressed by index while a job runs; the refresh scheduled at its end catches up
+    if job_running() or selection_fingerprint(context, props) == _refresh_state["fingerprint"]:
+        return False
+
+    # Populate the table
+    profiling.count("table rebuilds")
+    populate_items(props, context)
+    _namespace_names.clear()
+    validate_items(props)
+    _refresh_state["fingerprint"] = selection_fingerprint(context, props)
+    return True
+
+
+def schedule_refresh(*_args):
+    """Coalesce bursts of change notifications into one refresh per refresh_interval."""
+    if _refresh_state["scheduled"]:
+        return
+    scene = bpy.context.scene
+    interval = scene.renamer_props.refresh_interval if scene else 0.0
+    _refresh_state["scheduled"] = True
+    bpy.app.timers.register(_run_scheduled_refresh, first_interval=interval)
+
+
+def _run_scheduled_refresh():
+    _refresh_state["scheduled"] = False
+    scene = bpy.context.scene
+    if scene:
+        refresh_table(scene)
+    return None
+
+
+def _subscribe_msgbus():
+    # Active object and mode changes are published on the message bus
+    for key in ((bpy.types.LayerObjects, "active"), (bpy.types.Object, "mode")):
+        bpy.msgbus.subscribe_rna(key=key, owner=_msgbus_owner, args=(), notify=schedule_refresh)
+
+
+@persistent
+@timed("depsgraph handler")
+def _on_depsgraph_update(scene, depsgraph=None):
+    # Selection changes have no msgbus notification, so the handler stays as a cheap trigger
+    screen = bpy.context.screen
+    if screen and screen.is_animation_playing:
+        return
+    schedule_refresh()
+    _linter.note_updates(depsgraph)
+    if _linter.dirty and scene.renamer_props.show_lint:
+        schedule_lint()
 
-    # Determine if selection or property_type changed
-    selection_changed = sel_names != getattr(props, "last_sel_names", [])
-    property_changed = getattr(props, "last_property_type", "") != props.property_type
 
-    # Only refresh if selection changed or property type changed
-    if selection_changed or property_changed:
-        # Update stored state
-        props.last_sel_names = sel_names
-        props.last_property_type = props.property_type
+@persistent
+def _on_load_post(*_args):
+    _job_state["stale"] = job_running()
+    _job_state["job"] = None
+    scene = bpy.context.scene
+    if scene and scene.renamer_props.job_label:
+        scene.renamer_props.job_label = ""
+    _refresh_state["fingerprint"] = None
+    _namespace_names.clear()
+    _stores.clear()
+    _find_state["preview"] = {}
+    _search_state["selection"] = None
+    _linter.reset()
+    if scene:
+        schedule_lint()
+        profiling.enable(scene.renamer_props.profiling_enabled, scene.renamer_props.profiling_cprofile)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    _subscribe_msgbus()
+    schedule_refresh()
 
-        # Automatically set property_type for multi-selection
-        if len(sel_objs) > 1:
-            props.property_type = 'OBJECTS'
 
-        # Populate the table
-        populate_items(props, bpy.context)
+@persistent
+def _on_undo_redo(*_args):
+    # A running job's references and store indices no longer hold (see ChunkedRun.modal)
+    if job_running():
+        _job_state["stale"] = True
+    # Undo restores the RNA window but not the Python-side store: rebuild it from both
+    _stores.clear()
+    _find_state["preview"] = {}
+    _search_state["selection"] = None
+    _refresh_state["fingerprint"] = None
+    _namespace_names.clear()
+    schedule_refresh()
+    # Undone renames do not reach the depsgraph as updates
+    _linter.reset()
+    schedule_lint()
+
+
+# ─────────── Diagnostics ───────────
+class RENAMER_OT_StatsReset(bpy.types.Operator):
+    bl_idname = "renamer.stats_reset"
+    bl_label = "Reset Stats"
+
+    def execute(self, context):
+        profiling.reset()
+        return {'FINISHED'}
+
+class RENAMER_OT_StatsExport(bpy.types.Operator):
+    bl_idname = "renamer.stats_export"
+    bl_label = "Export Stats"
+    bl_description = "Write timers and counters as JSON, or the cProfile data as a .prof file"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    format: bpy.props.EnumProperty(items=[("JSON", "JSON", ""), ("PROFILE", "cProfile", "")], default="JSON")
+
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "renamer_stats.json" if self.format == "JSON" else "renamer.prof"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        try:
+            if self.format == "JSON":
+                profiling.export_json(path)
+            elif not profiling.export_profile(path):
+                self.report({'WARNING'}, "Enable cProfile first.")
+                return {'CANCELLED'}
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {path}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Wrote {path}")
+        return {'FINISHED'}
 
 
 # ─────────── Register/UnRegister ───────────
 classes = [
-    RENAMER_OT_DeleteItem, RENAMER_OT_ApplyPrefix, RENAMER_OT_ApplySuffix,
-    RENAMER_OT_ApplySequence, RENAMER_OT_Mirror, RENAMER_OT_CaseConversion,
-    RENAMER_OT_Execute, RENAMER_OT_Clear, RENAMER_OT_InvertSelection
+    RENAMER_OT_DeleteItem, RENAMER_OT_ApplyPrefix, RENAMER_OT_FindReplace, RENAMER_OT_ApplySuffix,
+    RENAMER_OT_ApplySequence, RENAMER_OT_Mirror, RENAMER_OT_MirrorSelectIssues, RENAMER_OT_CaseConversion,
+    RENAMER_OT_Execute, RENAMER_OT_Clear, RENAMER_OT_InvertSelection, RENAMER_OT_SearchSelect,
+    RENAMER_OT_ApplyPipeline, RENAMER_OT_PipelineAdd, RENAMER_OT_PipelineRemove, RENAMER_OT_PipelineMove,
+    RENAMER_OT_PipelinePresetSave, RENAMER_OT_PipelinePresetLoad, RENAMER_OT_PipelinePresetDelete,
+    RENAMER_OT_JournalReplay, RENAMER_OT_JournalClear, RENAMER_OT_FilePage,
+    RENAMER_OT_MapApply, RENAMER_OT_MapExecute, RENAMER_OT_MapExport,
+    RENAMER_OT_Lint, RENAMER_OT_LintFix, RENAMER_OT_LintRuleAdd, RENAMER_OT_LintRuleDefaults, RENAMER_OT_LintRuleRemove,
+    RENAMER_OT_TablePage, RENAMER_OT_StatsReset, RENAMER_OT_StatsExport,
 ]
 
 def register():
     for cls in classes: bpy.utils.register_class(cls)
-    bpy.app.handlers.depsgraph_update_post.append(refresh_table)
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    bpy.app.handlers.load_post.append(_on_load_post)
+    bpy.app.handlers.undo_post.append(_on_undo_redo)
+    bpy.app.handlers.redo_post.append(_on_undo_redo)
+    _subscribe_msgbus()
 
 def unregister():
     for cls in reversed(classes): bpy.utils.unregister_class(cls)
-    if refresh_table in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(refresh_table)
\ No newline at end of file
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for timer in (_run_scheduled_refresh, _run_scheduled_validation, _run_find_preview, _run_search_preview,
+                  _run_scheduled_lint, _run_edit_save):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
+    _refresh_state["scheduled"] = False
+    _refresh_state["fingerprint"] = None
+    _validation_state["scheduled"] = False
+    _find_state["scheduled"] = False
+    _search_state["scheduled"] = False
+    _lint_state["scheduled"] = False
+    _edits_state["scheduled"] = False
+    _job_state["job"] = None
+    _namespace_names.clear()
+    _stores.clear()
+    _find_state["preview"] = {}
+    _search_state["selection"] = None
+    _linter.reset()
+    profiling.enable(False)
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+    for handlers in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if _on_undo_redo in handlers:
+            handlers.remove(_on_undo_redo)
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
\ No newline at end of file
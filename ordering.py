@@ -0,0 +1,167 @@
+# ─────────── Spatial / Hierarchy Ordering ───────────
+# Sequence numbering can follow the scene instead of the table: world position
+# along an axis, a nearest-neighbour chain, or parent → child chains. Positions
+# are read in bulk with foreach_get (one call per collection, not one per item),
+# and the nearest chain queries a KD-tree instead of comparing every pair.
+import bpy
+from mathutils import kdtree
+from . import planner
+
+
+def _flat(collection, attr, width):
+    values = [0.0] * (len(collection) * width)
+    collection.foreach_get(attr, values)
+    return values
+
+
+def _object_matrices():
+    """{object name: flat column-major 4x4 world matrix} for every object in the file."""
+    objects = bpy.data.objects
+    flat = _flat(objects, "matrix_world", 16)
+    return {name: flat[i * 16:i * 16 + 16] for i, name in enumerate(objects.keys())}
+
+
+def _bone_heads(obj):
+    """{bone name: armature space head} of one armature (edit bones while in edit mode)."""
+    if obj.mode == 'EDIT':
+        bones, attr = obj.data.edit_bones, "head"
+    else:
+        bones, attr = obj.data.bones, "head_local"
+    flat = _flat(bones, attr, 3)
+    return {name: flat[i * 3:i * 3 + 3] for i, name in enumerate(bones.keys())}
+
+
+def _transform(m, co):
+    x, y, z = co
+    return (m[0] * x + m[4] * y + m[8] * z + m[12],
+            m[1] * x + m[5] * y + m[9] * z + m[13],
+            m[2] * x + m[6] * y + m[10] * z + m[14])
+
+
+def row_positions(rows, indices):
+    """
+    {row index: world position}. Object and bone rows use their own position,
+    other rows (vertex groups, materials, ...) their first owner's; rows with
+    neither (e.g. whole-file materials) are left out.
+    """
+    matrices = _object_matrices()
+    heads = {}
+    positions = {}
+    for idx in indices:
+        row = rows[idx]
+        if row.source_type == "objects":
+            m = matrices.get(row.current_name)
+            if m is not None:
+                positions[idx] = (m[12], m[13], m[14])
+            continue
+        owner = row.owners[0]
+        m = matrices.get(owner)
+        if m is None:
+            continue
+        if row.source_type != "bones":
+            positions[idx] = (m[12], m[13], m[14])
+            continue
+        if owner not in heads:
+            obj = bpy.data.objects[owner]
+            heads[owner] = _bone_heads(obj) if obj.type == 'ARMATURE' else {}
+        head = heads[owner].get(row.current_name)
+        if head is not None:
+            positions[idx] = _transform(m, head)
+    return positions
+
+
+def _parent_names(row):
+    """{name: parent name} for the namespace of a row: all objects, or the bones of its armature."""
+    if row.source_type == "objects":
+        return {obj.name: obj.parent.name for obj in bpy.data.objects if obj.parent}
+    obj = bpy.data.objects.get(row.owners[0])
+    if row.source_type != "bones" or obj is None or obj.type != 'ARMATURE':
+        return {}
+    bones = obj.data.edit_bones if obj.mode == 'EDIT' else obj.data.bones
+    return {bone.name: bone.parent.name for bone in bones if bone.parent}
+
+
+def row_parents(rows, indices):
+    """
+    {row index: index of its closest ancestor among indices}, from one parent
+    index per namespace. Rows whose ancestors are not listed are roots.
+    """
+    parents = {}
+    scope_of = {}
+    index_of = {}
+    for idx in indices:
+        row = rows[idx]
+        scope = "" if row.source_type == "objects" else (row.source_type, row.owners[0])
+        if scope not in parents:
+            parents[scope] = _parent_names(row)
+        scope_of[idx] = scope
+        index_of[(scope, row.current_name)] = idx
+
+    parent_of = {}
+    for idx in indices:
+        scope = scope_of[idx]
+        names = parents[scope]
+        name = names.get(rows[idx].current_name)
+        while name is not None and (scope, name) not in index_of:
+            name = names.get(name)
+        if name is not None:
+            parent_of[idx] = index_of[(scope, name)]
+    return parent_of
+
+
+def _kdtree(points, keys):
+    tree = kdtree.KDTree(len(keys))
+    for i in keys:
+        tree.insert(points[i][1], i)
+    tree.balance()
+    return tree
+
+
+def nearest_chain(points):
+    """
+    Visit order of points [(key, co)]: start at the first one and always step to
+    the nearest point not visited yet. A KD-tree has no removal, so each step asks
+    for a few neighbours (widening only if all are visited), and the tree is
+    rebuilt from the unvisited points once half of it has been visited.
+    """
+    visited = [False] * len(points)
+    visited[0] = True
+    order = [0]
+    pending = list(range(1, len(points)))
+    tree, size = _kdtree(points, pending), len(pending)
+    for remaining in range(len(points) - 1, 0, -1):
+        if size > 64 and remaining * 2 < size:
+            pending = [i for i in pending if not visited[i]]
+            tree, size = _kdtree(points, pending), len(pending)
+        co = points[order[-1]][1]
+        k = 8
+        while True:
+            found = next((i for _, i, _ in tree.find_n(co, k) if not visited[i]), None)
+            if found is not None or k >= size:
+                break
+            k *= 4
+        visited[found] = True
+        order.append(found)
+    return [points[i][0] for i in order]
+
+
+def sequence_order(rows, mode):
+    """
+    Selected row indices in numbering order for a seq_order mode. Rows without
+    a position are numbered last, in table order.
+    """
+    selected = [idx for idx, r in enumerate(rows) if r.selected]
+    if mode == "TABLE" or len(selected) < 2:
+        return selected
+    if mode == "HIERARCHY":
+        return planner.hierarchy_order(selected, row_parents(rows, selected))
+
+    positions = row_positions(rows, selected)
+    placed = [idx for idx in selected if idx in positions]
+    rest = [idx for idx in selected if idx not in positions]
+    if mode == "NEAREST":
+        placed = nearest_chain([(idx, positions[idx]) for idx in placed]) if placed else []
+    else:
+        axis = "XYZ".index(mode)
+        placed.sort(key=lambda idx: positions[idx][axis])  # Stable: ties keep table order
+    return placed + rest
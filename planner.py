@@ -0,0 +1,823 @@
+# Pure Python (no bpy): rows, transforms and rename plans can be built, timed and
+# checked outside Blender. Operators only read RNA into rows and write results back.
+import json
+import re
+import sys
+from itertools import islice
+
+from .utils import mirror_name, mirror_names, apply_case, generate_sequence, compile_pattern, replacer
+
+
+# ─────────── Rows ───────────
+# A grouped row stands for the same name on several owners (e.g. one vertex group
+# on every selected LOD mesh); its obj_name lists the owners joined by OWNER_SEP.
+OWNER_SEP = "\x1f"
+
+
+class Row:
+    """One table row, detached from RNA."""
+    __slots__ = ("obj_name", "current_name", "new_name", "source_type", "selected", "mirror")
+
+    def __init__(self, obj_name, current_name, source_type, new_name=None, selected=True, mirror=False):
+        self.obj_name = obj_name
+        self.current_name = current_name
+        self.new_name = current_name if new_name is None else new_name
+        self.source_type = source_type
+        self.selected = selected
+        self.mirror = mirror
+
+    @property
+    def key(self):
+        # Not the owners: a grouped row stays the same row as objects join or leave it
+        return (self.current_name, self.source_type)
+
+    @property
+    def owners(self):
+        return self.obj_name.split(OWNER_SEP)
+
+    def __repr__(self):
+        return f"Row({self.obj_name!r}, {self.current_name!r} -> {self.new_name!r}, {self.source_type!r})"
+
+
+def diff_rows(old_keys, new_keys):
+    """
+    Compare the table's row keys with freshly collected ones.
+    Returns (removed, inserts): indices into old_keys to drop (ascending) and
+    [(position, key)] to insert, in order, after the removal. Rows present in
+    both lists are neither removed nor inserted.
+    """
+    wanted = set(new_keys)
+    kept = set()
+    removed = []
+    for idx, key in enumerate(old_keys):
+        if key not in wanted or key in kept:
+            removed.append(idx)
+        else:
+            kept.add(key)
+    inserts = [(pos, key) for pos, key in enumerate(new_keys) if key not in kept]
+    return removed, inserts
+
+
+def fan_out(rows):
+    """
+    Expand grouped rows into one row per owner.
+    Returns (rows, row_of) where row_of[i] is the index of the row rows[i] came from.
+    """
+    flat = []
+    row_of = []
+    for idx, row in enumerate(rows):
+        if OWNER_SEP not in row.obj_name:
+            flat.append(row)
+            row_of.append(idx)
+            continue
+        for owner in row.owners:
+            flat.append(Row(owner, row.current_name, row.source_type, row.new_name, row.selected, row.mirror))
+            row_of.append(idx)
+    return flat, row_of
+
+
+def paginate(names, page, size, match=None):
+    """
+    One page of a (lazy) name sequence, filtered by match(name) while reading.
+    Returns (names on the page, whether another page follows); nothing past the
+    first name of the next page is read.
+    """
+    if match is not None:
+        names = filter(match, names)
+    window = list(islice(names, page * size, (page + 1) * size + 1))
+    return window[:size], len(window) > size
+
+
+class RowStore:
+    """
+    The working table on the Python side: rows in table order and the pre-flight
+    problem of each row ({row index: reason}). Owner and source type strings are
+    interned, so thousands of rows share one copy of each. partners and unpaired
+    index the mirror pairs (see pair_rows) and are rebuilt whenever rows change;
+    the search index is built with the table and then kept up to date.
+    """
+    __slots__ = ("rows", "conflicts", "partners", "unpaired", "search")
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.conflicts = {}
+        self.search = None
+        self.pair()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def reconcile(self, rows):
+        """
+        Bring the rows in line with freshly collected (obj_name, name, source_type)
+        tuples, matched by name and source type. Kept rows carry their edits over
+        and take the new owner list; returns (rows removed, rows added).
+        """
+        owners = {(name, source): obj_name for obj_name, name, source in rows}
+        removed, inserts = diff_rows([row.key for row in self.rows], list(owners))
+        if removed or inserts:
+            dropped = set(removed)
+            kept = (row for idx, row in enumerate(self.rows) if idx not in dropped)
+            added = dict(inserts)
+            new_rows = []
+            for pos in range(len(self.rows) - len(removed) + len(inserts)):
+                key = added.get(pos)
+                if key is None:
+                    new_rows.append(next(kept))
+                else:
+                    name, source = key
+                    new_rows.append(Row(sys.intern(owners[key]), name, sys.intern(source)))
+            if self.search is not None:
+                for idx in removed:
+                    self.search.discard(self.rows[idx])
+                for pos, _ in inserts:
+                    self.search.add(new_rows[pos])
+            self.rows = new_rows
+            self.conflicts = {}  # Indices moved; the caller re-validates
+
+        regrouped = False
+        for row in self.rows:
+            obj_name = owners[row.key]
+            if row.obj_name != obj_name:
+                row.obj_name = sys.intern(obj_name)
+                regrouped = True
+        if removed or inserts or regrouped:
+            self.pair()  # Pairs are per owner namespace
+        return len(removed), len(inserts)
+
+    def remove(self, indices):
+        dropped = set(indices)
+        if self.search is not None:
+            for idx in dropped:
+                self.search.discard(self.rows[idx])
+        self.rows = [row for idx, row in enumerate(self.rows) if idx not in dropped]
+        self.conflicts = {}
+        self.pair()
+
+    def renamed(self, indices):
+        """Rows whose current_name changed in place (after an execute)."""
+        if self.search is not None:
+            for idx in indices:
+                self.search.update(self.rows[idx])
+        self.pair()  # Pairs follow the new names
+
+    def pair(self):
+        self.partners, self.unpaired = pair_rows(self.rows)
+
+    def search_index(self):
+        if self.search is None:
+            self.search = NameIndex(self.rows)
+        return self.search
+
+
+# ─────────── Search ───────────
+def _trigrams(name):
+    return {name[i:i + 3] for i in range(len(name) - 2)}
+
+
+class NameIndex:
+    """
+    Case-insensitive search over rows' current names. Trigram postings narrow a
+    text or glob query (character postings for shorter ones and for fuzzy
+    queries) to a few candidates, which are then checked exactly. Rows are
+    indexed by identity and updated one at a time, never rebuilt.
+    """
+
+    def __init__(self, rows=()):
+        self.names = {}     # {row: indexed name}
+        self.trigrams = {}  # {trigram: {rows}}
+        self.chars = {}     # {character: {rows}}
+        for row in rows:
+            self.add(row)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, row):
+        name = row.current_name.lower()
+        self.names[row] = name
+        for gram in _trigrams(name):
+            self.trigrams.setdefault(gram, set()).add(row)
+        for char in set(name):
+            self.chars.setdefault(char, set()).add(row)
+
+    def discard(self, row):
+        name = self.names.pop(row, None)
+        if name is None:
+            return
+        for postings, keys in ((self.trigrams, _trigrams(name)), (self.chars, set(name))):
+            for key in keys:
+                rows = postings[key]
+                rows.discard(row)
+                if not rows:
+                    del postings[key]
+
+    def update(self, row):
+        if self.names.get(row) != row.current_name.lower():
+            self.discard(row)
+            self.add(row)
+
+    def _candidates(self, postings, keys):
+        """Rows listed under every key: the smallest posting set, narrowed by the others."""
+        if not keys:
+            return set(self.names)
+        sets = [postings.get(key) for key in keys]
+        if None in sets:
+            return set()
+        sets.sort(key=len)
+        rows = set(sets[0])
+        for other in sets[1:]:
+            rows &= other
+            if not rows:
+                break
+        return rows
+
+    def search(self, text, mode="TEXT"):
+        """
+        Rows whose name matches text, ignoring case. TEXT: contains it; GLOB:
+        whole-name match with * and ?; FUZZY: contains its characters in order.
+        """
+        text = text.lower()
+        if not text:
+            return set()
+        if mode == "FUZZY":
+            candidates = self._candidates(self.chars, set(text))
+            match = re.compile(".*?".join(map(re.escape, text)), re.S).search
+        else:
+            if mode == "GLOB":
+                literal = max(re.split(r"[*?]+", text), key=len)
+                match = compile_pattern(text, "GLOB", True).match
+            else:
+                literal = text
+                match = lambda name: text in name
+            keys = _trigrams(literal) if len(literal) >= 3 else set(literal)
+            candidates = self._candidates(self.trigrams if len(literal) >= 3 else self.chars, keys)
+        names = self.names
+        return {row for row in candidates if match(names[row])}
+
+
+# ─────────── Transforms ───────────
+# Each transform updates new_name on rows and returns the indices it changed,
+# so adapters only write back what actually differs.
+def _assign(rows, names):
+    changed = []
+    for idx, name in names:
+        row = rows[idx]
+        if row.new_name != name:
+            row.new_name = name
+            changed.append(idx)
+    return changed
+
+def apply_prefix(rows, prefix):
+    if not prefix: return []
+    return _assign(rows, ((idx, f"{prefix}{r.current_name}") for idx, r in enumerate(rows) if r.selected))
+
+def apply_suffix(rows, suffix):
+    if not suffix: return []
+    return _assign(rows, ((idx, f"{r.current_name}{suffix}") for idx, r in enumerate(rows) if r.selected))
+
+def apply_case_rows(rows, mode):
+    return _assign(rows, ((idx, apply_case(r.current_name, mode)) for idx, r in enumerate(rows) if r.selected))
+
+def apply_sequence(rows, base, start, last, reverse=False, order=None):
+    """Number the selected rows in table order, or in order (selected row indices, e.g. sorted by position)."""
+    selected = list(order) if order is not None else [idx for idx, r in enumerate(rows) if r.selected]
+    if reverse:
+        selected.reverse()
+    return _assign(rows, ((idx, generate_sequence(base, start, n, last)) for n, idx in enumerate(selected)))
+
+def hierarchy_order(indices, parent_of):
+    """
+    Parent-before-children order of indices, depth first, so every chain is
+    numbered through before the next one starts. parent_of maps an index to its
+    parent's index (absent for roots); roots and siblings keep their given order.
+    """
+    children = {}
+    roots = []
+    for idx in indices:
+        parent = parent_of.get(idx)
+        if parent is None:
+            roots.append(idx)
+        else:
+            children.setdefault(parent, []).append(idx)
+    order = []
+    stack = roots[::-1]
+    while stack:
+        idx = stack.pop()
+        order.append(idx)
+        stack.extend(reversed(children.get(idx, ())))
+    return order
+
+def toggle_mirror(rows, idx):
+    """Mirror one row; if it already shows the mirrored name, revert it."""
+    row = rows[idx]
+    if mirror_name(row.new_name) == row.current_name:
+        return _assign(rows, [(idx, row.current_name)])
+    return _assign(rows, [(idx, mirror_name(row.current_name))])
+
+def apply_find_replace(rows, pattern, replacement, mode="LITERAL", case_sensitive=True):
+    """Find/replace on the selected rows' current names, in one pass with one compiled pattern."""
+    if not pattern: return []
+    compiled = compile_pattern(pattern, mode, case_sensitive)
+    repl = replacer(replacement, mode)
+    return _assign(rows, ((idx, compiled.sub(repl, r.current_name)) for idx, r in enumerate(rows) if r.selected))
+
+def preview_find_replace(rows, pattern, replacement, mode="LITERAL", case_sensitive=True, owned=None):
+    """
+    Live variant of apply_find_replace. owned ({row: name}) is what the previous
+    preview wrote; rows edited by hand since, or before the preview, keep their
+    new name. Rows the pattern no longer matches (all of them for an empty
+    pattern) get their current name back. Returns (changed, owned for the next call).
+    """
+    owned = owned or {}
+    compiled = compile_pattern(pattern, mode, case_sensitive) if pattern else None
+    repl = replacer(replacement, mode)
+    names = []
+    written = {}
+    for idx, row in enumerate(rows):
+        previous = owned.get(row)
+        if row.new_name != (row.current_name if previous is None else previous):
+            continue
+        name = compiled.sub(repl, row.current_name) if compiled is not None and row.selected else row.current_name
+        if name != row.current_name:
+            written[row] = name
+        names.append((idx, name))
+    return _assign(rows, names), written
+
+def apply_map(rows, entries):
+    """
+    Set new names from rename map entries (source_type, owner, old, new). Rows are
+    indexed by name once, so each entry is one hash lookup; an entry without an
+    owner applies to every owner. Returns (changed, unmatched entries).
+    """
+    index = {}
+    for idx, row in enumerate(rows):
+        for owner in dict.fromkeys((*row.owners, "")):
+            index.setdefault((row.source_type, owner, row.current_name), []).append(idx)
+    names = []
+    unmatched = []
+    for entry in entries:
+        idxs = index.get(entry[:3])
+        if idxs is None:
+            unmatched.append(entry)
+        else:
+            names.extend((idx, entry[3]) for idx in idxs)
+    return _assign(rows, names), unmatched
+
+def clear_names(rows):
+    return _assign(rows, ((idx, "") for idx in range(len(rows))))
+
+def invert_selection(rows):
+    for row in rows:
+        row.selected = not row.selected
+    return list(range(len(rows)))
+
+
+# ─────────── Mirror Pairs ───────────
+# Left/right rows (.L ↔ .R, _Left ↔ _Right, ...) are found through a hash index
+# of the table's names: one mirror_name() lookup per row, never a pairwise scan.
+def _pair_key(row, name):
+    # Object rows carry their own name as owner; they all share one namespace
+    return ("" if row.source_type == "objects" else row.obj_name, row.source_type, name)
+
+def pair_rows(rows):
+    """
+    Returns (partners, unpaired): {row index: partner row index} for rows whose
+    mirrored name is another row in the same namespace, and the indices of rows
+    that have a side but no partner.
+    """
+    index = {_pair_key(row, row.current_name): idx for idx, row in enumerate(rows)}
+    partners = {}
+    unpaired = []
+    for idx, (row, name) in enumerate(zip(rows, mirror_names(row.current_name for row in rows))):
+        if name == row.current_name:
+            continue
+        partner = index.get(_pair_key(row, name))
+        if partner is None:
+            unpaired.append(idx)
+        else:
+            partners[idx] = partner
+    return partners, unpaired
+
+def sync_partners(rows, changed, partners):
+    """
+    Give the partner of each changed row the mirror of its new name. Partners
+    changed in the same pass keep their own result, and names without a side
+    (e.g. a plain sequence) are not copied. Returns the partner indices changed.
+    """
+    touched = set(changed)
+    names = []
+    for idx in changed:
+        partner = partners.get(idx)
+        if partner is None or partner in touched:
+            continue
+        name = mirror_name(rows[idx].new_name)
+        if name != rows[idx].new_name:
+            names.append((partner, name))
+    return _assign(rows, names)
+
+def mismatched_pairs(rows, partners):
+    """Lower index of each pair whose new names are not mirror images of each other."""
+    return [idx for idx, partner in partners.items()
+            if idx < partner and mirror_name(rows[idx].new_name) != rows[partner].new_name]
+
+
+# ─────────── Rules / Pipelines ───────────
+# Declarative steps, e.g. {"op": "prefix", "text": "SM_"}. A list of rules is a
+# pipeline: it compiles into one function and every row is evaluated once.
+# Each builder returns step(name, n, count) -> name, where n is the row's
+# position among the selected rows and count is how many are selected.
+def _step_strip(rule):
+    chars = rule.get("chars") or None
+    return lambda name, n, count: name.strip(chars)
+
+def _step_replace(rule):
+    pattern = rule.get("find", "")
+    if not pattern:
+        return None
+    mode = rule.get("mode", "LITERAL")
+    compiled = compile_pattern(pattern, mode, rule.get("case_sensitive", True))
+    repl = replacer(rule.get("replace", ""), mode)
+    return lambda name, n, count: compiled.sub(repl, name)
+
+def _step_case(rule):
+    mode = rule.get("mode", "NONE")
+    return lambda name, n, count: apply_case(name, mode)
+
+def _step_prefix(rule):
+    text = rule.get("text", "")
+    return (lambda name, n, count: f"{text}{name}") if text else None
+
+def _step_suffix(rule):
+    text = rule.get("text", "")
+    return (lambda name, n, count: f"{name}{text}") if text else None
+
+def _step_sequence(rule):
+    base, start, last = rule.get("base", ""), rule.get("start", "1"), rule.get("last", "")
+    if rule.get("reverse", False):
+        return lambda name, n, count: generate_sequence(base, start, count - 1 - n, last)
+    return lambda name, n, count: generate_sequence(base, start, n, last)
+
+def _step_mirror(rule):
+    return lambda name, n, count: mirror_name(name)
+
+RULES = {
+    "strip": _step_strip,
+    "replace": _step_replace,
+    "case": _step_case,
+    "prefix": _step_prefix,
+    "suffix": _step_suffix,
+    "sequence": _step_sequence,
+    "mirror": _step_mirror,
+}
+
+def check_rules(rules):
+    for rule in rules:
+        if rule.get("op") not in RULES:
+            raise ValueError(f"Unknown rule op {rule.get('op')!r}; expected one of {', '.join(RULES)}")
+
+def compile_rules(rules):
+    """
+    Compile a pipeline into a single function run(name, n, count) -> name.
+    Disabled steps ({"enabled": false}) and steps that would be no-ops are dropped.
+    Raises ValueError for an unknown op and re.error for an invalid pattern.
+    """
+    check_rules(rules)
+    steps = [RULES[rule["op"]](rule) for rule in rules if rule.get("enabled", True)]
+    steps = tuple(step for step in steps if step is not None)
+
+    def run(name, n=0, count=1):
+        for step in steps:
+            name = step(name, n, count)
+        return name
+    return run
+
+def apply_rules(rows, rules):
+    """Run a pipeline over the selected rows: one evaluation and at most one write per row."""
+    run = compile_rules(rules)
+    selected = [idx for idx, r in enumerate(rows) if r.selected]
+    count = len(selected)
+    return _assign(rows, ((idx, run(rows[idx].current_name, n, count)) for n, idx in enumerate(selected)))
+
+
+# ─────────── Naming Lint ───────────
+# Convention checks, e.g. {"check": "prefix", "source_type": "uv_maps", "text": "UV"}.
+# Each builder returns check(name, info) -> (message, fix) or None, where fix is
+# the conforming name (None if the rule cannot suggest one) and info is extra
+# data for the rule: (use_deform, head x) for bones, None for everything else.
+_NUMBER_TAIL = re.compile(r"\.\d{3,}$")
+SIDE_TOLERANCE = 1e-4
+
+def _check_tail(rule):
+    def check(name, info):
+        match = _NUMBER_TAIL.search(name)
+        if match and match.start():
+            return f"ends in {match.group()}", name[:match.start()]
+    return check
+
+def _check_prefix(rule):
+    text = rule.get("text", "")
+    if not text:
+        return None
+    return lambda name, info: None if name.startswith(text) else (f"missing prefix {text}", f"{text}{name}")
+
+def _check_suffix(rule):
+    text = rule.get("text", "")
+    if not text:
+        return None
+    return lambda name, info: None if name.endswith(text) else (f"missing suffix {text}", f"{name}{text}")
+
+def _check_side(rule):
+    # +X is the character's left, as Blender's symmetrize assumes
+    def check(name, info):
+        if info is None:
+            return None
+        deform, x = info
+        if deform and abs(x) > SIDE_TOLERANCE and mirror_name(name) == name:
+            return "deform bone without a side", f"{name}{'.L' if x > 0 else '.R'}"
+    return check
+
+def _check_pattern(rule):
+    text = rule.get("text", "")
+    if not text:
+        return None
+    pattern = re.compile(text)
+    return lambda name, info: None if pattern.fullmatch(name) else (f"does not match {text}", None)
+
+LINT_CHECKS = {
+    "tail": _check_tail,
+    "prefix": _check_prefix,
+    "suffix": _check_suffix,
+    "side": _check_side,
+    "pattern": _check_pattern,
+}
+
+def compile_lint_rules(rules):
+    """
+    [(source_type or None for every type, check)] for the enabled rules. Side
+    checks only apply to bones. Raises ValueError for an unknown check and
+    re.error for an invalid pattern.
+    """
+    compiled = []
+    for rule in rules:
+        kind = rule.get("check")
+        if kind not in LINT_CHECKS:
+            raise ValueError(f"Unknown lint check {kind!r}; expected one of {', '.join(LINT_CHECKS)}")
+        if not rule.get("enabled", True):
+            continue
+        check = LINT_CHECKS[kind](rule)
+        if check is not None:
+            source_type = "bones" if kind == "side" else rule.get("source_type") or None
+            compiled.append((source_type, check))
+    return compiled
+
+def lint_names(checks, source_type, owner, names, out):
+    """Append (source_type, owner, name, message, fix) to out for every check each (name, info) fails."""
+    checks = [check for scope, check in checks if scope is None or scope == source_type]
+    if not checks:
+        return
+    for name, info in names:
+        for check in checks:
+            found = check(name, info)
+            if found is not None:
+                out.append((source_type, owner, name, found[0], found[1]))
+
+
+# ─────────── Rename Planning ───────────
+def group_moves(rows, namespace_of):
+    """
+    Collect the renames requested by rows, grouped per namespace.
+    namespace_of(row) returns a hashable namespace key, or None if the source is gone.
+    Returns ({namespace: [(row_idx, old, new)]}, [row indices without a namespace]).
+    A move repeated in one namespace (owners sharing a datablock) is kept once.
+    """
+    groups = {}
+    orphans = []
+    seen = set()
+    for idx, row in enumerate(rows):
+        if not row.selected or not row.new_name or row.new_name == row.current_name: continue
+        ns_key = namespace_of(row)
+        if ns_key is None:
+            orphans.append(idx)
+            continue
+        move = (ns_key, row.current_name, row.new_name)
+        if move in seen:
+            continue
+        seen.add(move)
+        groups.setdefault(ns_key, []).append((idx, row.current_name, row.new_name))
+    return groups, orphans
+
+
+TEMP_PREFIX = "~RNM"
+MAX_NAME_BYTES = 63  # Blender ID/RNA names are truncated beyond this (UTF-8 bytes)
+
+
+def _temp_name(taken: set, counter: list) -> str:
+    while True:
+        counter[0] += 1
+        name = f"{TEMP_PREFIX}{counter[0]}"
+        if name not in taken:
+            taken.add(name)
+            return name
+
+
+def truncate_name(name: str) -> str:
+    """Return name as Blender will store it: at most MAX_NAME_BYTES, never splitting a character."""
+    raw = name.encode("utf-8")
+    if len(raw) <= MAX_NAME_BYTES:
+        return name
+    return raw[:MAX_NAME_BYTES].decode("utf-8", "ignore")
+
+
+def _resolve_moves(moves, existing):
+    """
+    Keep the moves that can be applied without a collision.
+    Returns (by_old, by_new, conflicts) with by_old/by_new mapping names to (key, old, new).
+    """
+    conflicts = []
+
+    # One move per source name, one source per target name
+    by_old = {}
+    by_new = {}
+    for key, old, new in moves:
+        if not new or old == new:
+            continue
+        if old not in existing:
+            conflicts.append((key, old, new, "not found"))
+        elif old in by_old:
+            conflicts.append((key, old, new, "duplicate source"))
+        elif new in by_new:
+            conflicts.append((key, old, new, "duplicate target"))
+        else:
+            move = (key, old, new)
+            by_old[old] = move
+            by_new[new] = move
+
+    # A target is free if nobody holds it, or its holder is itself moving away.
+    # Dropping a move keeps its old name occupied, which can block its predecessor.
+    blocked = {}
+
+    def is_blocked(move):
+        pending = []
+        while move[1] not in blocked:
+            blocked[move[1]] = None  # in progress; reaching it again means a cycle
+            pending.append(move)
+            nxt = by_old.get(move[2])
+            if nxt is None:
+                result = move[2] in existing
+                break
+            if blocked.get(nxt[1]) is not None:
+                result = blocked[nxt[1]]
+                break
+            if nxt[1] in blocked:
+                result = False  # cycle: solvable through a temporary name
+                break
+            move = nxt
+        else:
+            result = blocked[move[1]]
+        for m in pending:
+            blocked[m[1]] = result
+        return result
+
+    for move in list(by_old.values()):
+        if is_blocked(move):
+            conflicts.append((move[0], move[1], move[2], "name taken"))
+            del by_old[move[1]]
+            del by_new[move[2]]
+
+    return by_old, by_new, conflicts
+
+
+def find_conflicts(moves, existing) -> dict:
+    """
+    Pre-flight check for one namespace without building a plan.
+    Names are compared as Blender will store them (truncated to MAX_NAME_BYTES).
+    Returns {key: reason} for every move that would fail, be suffixed or be truncated.
+    """
+    problems = {}
+    checked = []
+    for key, old, new in moves:
+        stored = truncate_name(new)
+        if stored != new:
+            problems[key] = f"longer than {MAX_NAME_BYTES} bytes"
+        checked.append((key, old, stored))
+
+    for key, old, new, reason in _resolve_moves(checked, existing)[2]:
+        problems[key] = reason
+    return problems
+
+
+def plan_renames(moves, existing):
+    """
+    Order renames inside one namespace so no step collides with a live name.
+
+    moves:    iterable of (key, old, new)
+    existing: every name currently used in the namespace
+
+    Returns (steps, conflicts):
+        steps     - [(key, from_name, to_name)] in apply order. A move that sits
+                    in a cycle (A→B, B→A) is routed through a temporary name, so
+                    every datablock is renamed at most twice.
+        conflicts - [(key, old, new, reason)] for moves that cannot be applied
+                    without Blender auto-suffixing the name.
+    """
+    existing = set(existing)
+    by_old, by_new, conflicts = _resolve_moves(moves, existing)
+
+    # Chains: start from moves whose target is free and walk back to whoever wants
+    # the name just vacated. Whatever is left over forms closed cycles.
+    steps = []
+    done = set()
+
+    def walk_back(old):
+        while True:
+            prev = by_new.get(old)
+            if prev is None or prev[1] in done:
+                return
+            steps.append(prev)
+            done.add(prev[1])
+            old = prev[1]
+
+    for old, move in by_old.items():
+        if move[2] not in by_old and old not in done:
+            steps.append(move)
+            done.add(old)
+            walk_back(old)
+
+    taken = existing | set(by_new)
+    counter = [0]
+    for old, move in by_old.items():
+        if old in done:
+            continue
+        key, _, new = move
+        temp = _temp_name(taken, counter)
+        steps.append((key, old, temp))
+        done.add(old)
+        walk_back(old)
+        steps.append((key, temp, new))
+
+    return steps, conflicts
+
+
+# ─────────── Reference Paths ───────────
+# RNA paths quote names, e.g. pose.bones["arm.L"].location, with \ and " escaped.
+# "bones" also matches pose.bones[...] and edit_bones[...].
+_PATH_NAME_RES = {}
+
+
+def escape_path_name(name):
+    return name.replace("\\", "\\\\").replace('"', '\\"')
+
+def path_names(path, collection):
+    """Every name quoted as collection["..."] in an RNA path."""
+    if f'{collection}["' not in path:
+        return []
+    if collection not in _PATH_NAME_RES:
+        _PATH_NAME_RES[collection] = re.compile(re.escape(collection) + r'\["((?:[^"\\]|\\.)*)"\]')
+    return [re.sub(r"\\(.)", r"\1", name) for name in _PATH_NAME_RES[collection].findall(path)]
+
+def rename_in_path(path, collection, old, new):
+    return path.replace(f'{collection}["{escape_path_name(old)}"]', f'{collection}["{escape_path_name(new)}"]')
+
+
+# ─────────── Saved Edits ───────────
+# Undo steps and saved files only keep the RNA window; rows edited outside it
+# travel in props.row_edits until the store is rebuilt around them.
+def pack_edits(rows) -> str:
+    """
+    The rows whose state a repopulate would not restore (a new name, unselected or
+    marked for mirroring), with their table position, as one compact JSON string.
+    """
+    edited = [(idx, r.obj_name, r.current_name, r.source_type, r.new_name, r.selected, r.mirror)
+              for idx, r in enumerate(rows) if r.new_name != r.current_name or not r.selected or r.mirror]
+    return json.dumps(edited, ensure_ascii=False, separators=(",", ":")) if edited else ""
+
+def unpack_edits(payload):
+    """[(table position, Row)] from pack_edits()."""
+    return [(idx, Row(*fields)) for idx, *fields in json.loads(payload)] if payload else []
+
+
+# ─────────── Journal ───────────
+# One executed batch is a list of (namespace_key, old, new). It is stored as a
+# namespace table plus parallel arrays, so long batches in few namespaces stay small.
+def pack_journal(entries) -> str:
+    namespaces = {}
+    at, old, new = [], [], []
+    for ns_key, src, dst in entries:
+        at.append(namespaces.setdefault(tuple(ns_key), len(namespaces)))
+        old.append(src)
+        new.append(dst)
+    return json.dumps({"ns": list(namespaces), "at": at, "old": old, "new": new},
+                      ensure_ascii=False, separators=(",", ":"))
+
+def unpack_journal(payload):
+    data = json.loads(payload) if payload else {}
+    namespaces = [tuple(ns) for ns in data.get("ns", ())]
+    return [(namespaces[i], src, dst) for i, src, dst in zip(data.get("at", ()), data.get("old", ()), data.get("new", ()))]
+
+def journal_moves(entries, reverse=False):
+    """Group journal entries into {namespace_key: [(key, from, to)]}; reverse=True undoes the batch."""
+    groups = {}
+    for key, (ns_key, old, new) in enumerate(entries):
+        groups.setdefault(ns_key, []).append((key, new, old) if reverse else (key, old, new))
+    return groups
@@ -0,0 +1,131 @@
+# ─────────── Instrumentation ───────────
+# Per-function timers and named counters for RENAMER's hot paths. Everything is a
+# no-op unless enabled: a timed function costs one flag check per call.
+# Pure Python (no bpy), so the benchmarks can read the same numbers.
+import cProfile
+import json
+import logging
+import time
+from contextlib import nullcontext
+from functools import wraps
+
+
+log = logging.getLogger(__package__ or "renamer")
+
+_state = {"enabled": False, "profiler": None, "since": 0.0}
+timers = {}    # {name: [calls, total seconds, max seconds]}
+counters = {}  # {name: count}
+
+
+def enabled():
+    return _state["enabled"]
+
+
+def enable(on=True, profile=False):
+    """Turn instrumentation on or off; profile=True also runs cProfile while enabled."""
+    profiler = _state["profiler"]
+    if profiler is not None:
+        profiler.disable()
+    _state["profiler"] = None
+    _state["enabled"] = on
+    if on:
+        _state["since"] = time.time()
+        if profile:
+            _state["profiler"] = cProfile.Profile()
+            _state["profiler"].enable()
+
+
+def reset():
+    timers.clear()
+    counters.clear()
+    _state["since"] = time.time()
+    if _state["profiler"] is not None:
+        _state["profiler"].disable()
+        _state["profiler"] = cProfile.Profile()
+        _state["profiler"].enable()
+
+
+def _record(name, elapsed):
+    entry = timers.get(name)
+    if entry is None:
+        timers[name] = [1, elapsed, elapsed]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+        if elapsed > entry[2]:
+            entry[2] = elapsed
+
+
+def timed(name):
+    """Decorator: record calls, total and max time under name while enabled."""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state["enabled"]:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_exc):
+        _record(self.name, time.perf_counter() - self.start)
+
+
+_NO_TIMER = nullcontext()
+
+
+def timer(name):
+    """
+    Context manager form of timed(), for methods Blender registers (Panel.draw,
+    UIList.filter_items): their argument count is checked, so they cannot be wrapped.
+    """
+    return _Timer(name) if _state["enabled"] else _NO_TIMER
+
+
+def count(name, n=1):
+    if _state["enabled"] and n:
+        counters[name] = counters.get(name, 0) + n
+
+
+def snapshot():
+    """Timers (slowest total first) and counters as plain data."""
+    rows = [
+        {"name": name, "calls": calls, "total_ms": total * 1000, "avg_ms": total * 1000 / calls, "max_ms": peak * 1000}
+        for name, (calls, total, peak) in timers.items()
+    ]
+    rows.sort(key=lambda row: row["total_ms"], reverse=True)
+    return {
+        "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(_state["since"])),
+        "timers": rows,
+        "counters": dict(sorted(counters.items())),
+    }
+
+
+def export_json(path):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(snapshot(), fh, indent=2)
+    log.info("Wrote RENAMER stats to %s", path)
+
+
+def export_profile(path):
+    """Dump the cProfile data (readable with pstats or snakeviz). Returns False if profiling is off."""
+    profiler = _state["profiler"]
+    if profiler is None:
+        return False
+    profiler.dump_stats(path)
+    log.info("Wrote RENAMER profile to %s", path)
+    return True
@@ -0,0 +1,176 @@
+# ─────────── Reference Repair ───────────
+# Bones and vertex groups are referenced by name from F-curves and action groups
+# in every action, drivers, constraints and modifiers. Blender only fixes some of
+# them on rename (e.g. the active action), so an opt-in stage scans the file once
+# before a batch, indexes those references by name, and afterwards rewrites only
+# the ones that still use an old name.
+import bpy
+from . import planner
+
+
+KINDS = ("bones", "vertex_groups")
+
+# Modifier properties that hold a vertex group name
+_MODIFIER_VGROUP_ATTRS = ("vertex_group", "vertex_group_a", "vertex_group_b", "mask_vertex_group")
+
+# ID collections whose animation data may carry drivers
+_ANIMATED = ("objects", "armatures", "meshes", "shape_keys", "materials", "node_groups",
+             "scenes", "worlds", "lights", "cameras", "curves")
+
+
+class ReferenceIndex:
+    """
+    {(kind, scope, name): [(rna, attr, is_path)]}: scope is the armature data name
+    for bones, the object name for vertex groups, or None for references that are
+    not tied to one owner (e.g. an action no armature uses).
+    """
+
+    def __init__(self):
+        self.refs = {}
+
+    def __len__(self):
+        return sum(len(refs) for refs in self.refs.values())
+
+    def add(self, kind, scope, name, rna, attr, is_path=False):
+        self.refs.setdefault((kind, scope, name), []).append((rna, attr, is_path))
+
+    def add_path(self, kind, scope, rna, attr):
+        for name in planner.path_names(getattr(rna, attr), kind):
+            self.add(kind, scope, name, rna, attr, True)
+
+    def repair(self, entries):
+        """Rewrite references for journal entries [(namespace_key, old, new)]. Returns how many changed."""
+        fixed = 0
+        for ns_key, old, new in entries:
+            kind = ns_key[0]
+            if kind not in KINDS or old == new:
+                continue
+            for key in ((kind, ns_key[1], old), (kind, None, old)):
+                for rna, attr, is_path in self.refs.get(key, ()):
+                    value = getattr(rna, attr)
+                    # Skip references Blender already updated (or that changed since the scan)
+                    updated = planner.rename_in_path(value, kind, old, new) if is_path else (new if value == old else value)
+                    if updated != value:
+                        setattr(rna, attr, updated)
+                        fixed += 1
+        return fixed
+
+
+def _scope(id_data, kind):
+    """The namespace owner an ID stands for: its armature's name for bones, the mesh object for vertex groups."""
+    if id_data is None:
+        return None
+    if kind == "bones":
+        if isinstance(id_data, bpy.types.Armature):
+            return id_data.name
+        if isinstance(id_data, bpy.types.Object) and id_data.type == 'ARMATURE':
+            return id_data.data.name
+        return None
+    if isinstance(id_data, bpy.types.Object) and id_data.type in {'MESH', 'LATTICE'}:
+        return id_data.name
+    return None
+
+
+def _action_channels(action):
+    """(fcurves, groups) of an action, for legacy and layered (Blender 4.4+) actions."""
+    layers = getattr(action, "layers", None)
+    if layers:
+        for layer in layers:
+            for strip in layer.strips:
+                for bag in strip.channelbags:
+                    yield bag.fcurves, bag.groups
+    else:
+        yield action.fcurves, action.groups
+
+
+def _index_actions(index):
+    # Actions used by armature objects only affect those armatures' bones
+    users = {}
+    for obj in bpy.data.objects:
+        anim = obj.animation_data
+        if obj.type != 'ARMATURE' or not anim:
+            continue
+        actions = [anim.action] + [strip.action for track in anim.nla_tracks for strip in track.strips]
+        for action in actions:
+            if action:
+                users.setdefault(action.as_pointer(), set()).add(obj.data.name)
+
+    for action in bpy.data.actions:
+        if action.library:
+            continue
+        scopes = users.get(action.as_pointer()) or (None,)
+        for fcurves, groups in _action_channels(action):
+            for fcurve in fcurves:
+                for scope in scopes:
+                    index.add_path("bones", scope, fcurve, "data_path")
+            for group in groups:
+                for scope in scopes:
+                    index.add("bones", scope, group.name, group, "name")
+
+
+def _index_drivers(index, kinds):
+    for collection in _ANIMATED:
+        for id_data in getattr(bpy.data, collection, ()):
+            anim = getattr(id_data, "animation_data", None)
+            if not anim or id_data.library:
+                continue
+            for kind in kinds:
+                scope = _scope(id_data, kind)
+                for fcurve in anim.drivers:
+                    if scope is not None:
+                        index.add_path(kind, scope, fcurve, "data_path")
+                    for var in fcurve.driver.variables:
+                        for target in var.targets:
+                            target_scope = _scope(target.id, kind)
+                            if target_scope is None:
+                                continue
+                            if kind == "bones" and target.bone_target:
+                                index.add(kind, target_scope, target.bone_target, target, "bone_target")
+                            if target.data_path:
+                                index.add_path(kind, target_scope, target, "data_path")
+
+
+def _add_subtarget(index, kinds, target, rna, attr):
+    name = getattr(rna, attr, "")
+    if not target or not name:
+        return
+    for kind in kinds:
+        scope = _scope(target, kind)
+        if scope is not None:
+            index.add(kind, scope, name, rna, attr)
+
+
+def _index_objects(index, kinds):
+    for obj in bpy.data.objects:
+        if obj.library:
+            continue
+        constraints = list(obj.constraints)
+        if obj.type == 'ARMATURE' and obj.pose:
+            for pose_bone in obj.pose.bones:
+                constraints.extend(pose_bone.constraints)
+        for con in constraints:
+            _add_subtarget(index, kinds, getattr(con, "target", None), con, "subtarget")
+            _add_subtarget(index, kinds, getattr(con, "pole_target", None), con, "pole_subtarget")
+            # Armature constraints keep a list of (target, subtarget)
+            for target in getattr(con, "targets", ()):
+                _add_subtarget(index, kinds, target.target, target, "subtarget")
+
+        for mod in obj.modifiers:
+            if "vertex_groups" in kinds:
+                for attr in _MODIFIER_VGROUP_ATTRS:
+                    name = getattr(mod, attr, "")
+                    if name:
+                        index.add("vertex_groups", obj.name, name, mod, attr)
+            if mod.type == 'HOOK':
+                _add_subtarget(index, kinds, mod.object, mod, "subtarget")
+
+
+def build_index(kinds=KINDS):
+    """One scan of the file for every reference of the given kinds."""
+    kinds = [kind for kind in KINDS if kind in kinds]
+    index = ReferenceIndex()
+    if "bones" in kinds:
+        _index_actions(index)
+    _index_drivers(index, kinds)
+    _index_objects(index, kinds)
+    return index
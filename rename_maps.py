@@ -0,0 +1,111 @@
+# ─────────── Rename Maps ───────────
+# old → new name mappings exchanged with other tools (retargeting, vendor naming
+# conventions) as CSV, JSON or JSON Lines. Entries are read from disk one at a
+# time as (source_type, owner, old, new) and matched against hashed name indices
+# by the caller, so a map of any size is one pass and never goes through RNA.
+# Pure Python (no bpy).
+import csv
+import json
+import os
+
+
+FIELDS = ("source_type", "owner", "old", "new")
+# Whole datablocks: one namespace per type, so their entries have no owner
+ID_TYPES = ("objects", "materials", "actions", "meshes", "images", "node_groups", "collections")
+SOURCE_TYPES = ID_TYPES + ("bones", "vertex_groups", "shape_keys", "uv_maps")
+FORMATS = (".csv", ".json", ".jsonl")
+
+
+def _format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Unsupported map format '{ext or path}'; use {', '.join(FORMATS)}")
+    return ext
+
+
+def _csv_records(fh):
+    """
+    Rows as dicts. With a header the columns are named by it; without one, two
+    columns are (old, new) and four are (source_type, owner, old, new).
+    """
+    reader = csv.reader(fh)
+    first = next(reader, None)
+    if first is None:
+        return
+    header = [cell.strip().lower() for cell in first]
+    if "old" in header and "new" in header:
+        columns = header
+    elif len(first) in (2, 4):
+        columns = FIELDS[-len(first):]
+        yield dict(zip(columns, first))
+    else:
+        raise ValueError("CSV maps need a header or 2 (old, new) / 4 (source_type, owner, old, new) columns")
+    for row in reader:
+        if row:
+            yield dict(zip(columns, row))
+
+
+def _json_records(data):
+    """A list of entries, {"renames": [...]} (what write_map produces) or a plain {old: new} object."""
+    if isinstance(data, dict):
+        if "renames" not in data:
+            return ({"old": old, "new": new} for old, new in data.items())
+        data = data["renames"]
+    return (record if isinstance(record, dict) else dict(zip(FIELDS[-len(record):], record)) for record in data)
+
+
+def _entry(record, default_type, number):
+    try:
+        old, new = record["old"], record["new"]
+    except (KeyError, TypeError):
+        raise ValueError(f"Entry {number}: needs 'old' and 'new'") from None
+    source_type = (record.get("source_type") or default_type).strip().lower()
+    if source_type not in SOURCE_TYPES:
+        raise ValueError(f"Entry {number}: unknown source type '{source_type}'")
+    owner = "" if source_type in ID_TYPES else (record.get("owner") or "").strip()
+    return source_type, owner, str(old), str(new)
+
+
+def read_map(path, default_type=""):
+    """
+    Yield (source_type, owner, old, new) for every entry of a map file, in file
+    order. Entries without a source type get default_type; entries without an
+    owner apply to every owner. Raises ValueError on a malformed entry.
+    """
+    ext = _format(path)
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        if ext == ".csv":
+            records = _csv_records(fh)
+        elif ext == ".jsonl":
+            records = (json.loads(line) for line in fh if line.strip())
+        else:
+            records = _json_records(json.load(fh))
+        for number, record in enumerate(records, 1):
+            yield _entry(record, default_type, number)
+
+
+def write_map(path, entries):
+    """Write (source_type, owner, old, new) entries one at a time, in the format of the extension. Returns the count."""
+    ext = _format(path)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        if ext == ".csv":
+            writer = csv.writer(fh)
+            writer.writerow(FIELDS)
+            for entry in entries:
+                writer.writerow(entry)
+                count += 1
+            return count
+
+        if ext == ".json":
+            fh.write('{"renames": [')
+        for entry in entries:
+            line = json.dumps(dict(zip(FIELDS, entry)), ensure_ascii=False)
+            if ext == ".json":
+                fh.write(("\n  " if not count else ",\n  ") + line)
+            else:
+                fh.write(line + "\n")
+            count += 1
+        if ext == ".json":
+            fh.write("\n]}\n")
+    return count
@@ -1,5 +1,8 @@
 import bpy
-from bpy.types import Panel
+from bpy.types import Menu, Panel, UIList
+from . import profiling
+from .operators import LINT_SHOWN, lint_results
+from .planner import OWNER_SEP
 
 
 # ─────────── External Links ───────────
@@ -7,6 +10,243 @@ GITHUB_URL = "https://github.com/q4rafiul/RENAMER"
 GUMROAD_URL = "https://q4rafiul.gumroad.com"
 
 
+# ─────────── Table List ───────────
+# Filter/sort results per list, reused until the table or the filter settings change
+_filter_cache = {}
+
+
+class RENAMER_UL_Items(UIList):
+    bl_idname = "RENAMER_UL_items"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        if self.layout_type in {'DEFAULT', 'COMPACT'}:
+            row = layout.row(align=True)
+            row.alert = bool(item.conflict)
+            row.prop(item, "selected", text="")
+            row.label(text=item.current_name, icon="ERROR" if item.conflict else "NONE")
+            if item.partner >= 0:
+                row.label(text="", icon="LINKED" if data.mirror_sync else "MOD_MIRROR")
+            owners = item.obj_name.count(OWNER_SEP) + 1
+            if owners > 1:
+                row.label(text=f"×{owners}")
+            row.prop(item, "new_name", text="")
+            # Operators address the row store, not the mirrored window
+            row.operator("renamer.mirror", text="", icon="ARROW_LEFTRIGHT").index = item.index
+            row.operator("renamer.delete_item", text="", icon="X").index = item.index
+        else:
+            layout.label(text=item.current_name)
+
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon="ARROW_LEFTRIGHT")
+        row.separator()
+        row.prop(self, "use_filter_sort_alpha", text="", icon="SORTALPHA")
+        row.prop(self, "use_filter_sort_reverse", text="", icon="SORT_DESC" if self.use_filter_sort_reverse else "SORT_ASC")
+        props = context.scene.renamer_props
+        # Filtering and sorting run on props.items, i.e. the window only
+        if props.row_count > len(props.items):
+            layout.label(text="Filter and sort cover the rows shown; Search covers the whole table", icon="INFO")
+
+    def filter_items(self, context, data, propname):
+        with profiling.timer("list.filter_items"):
+            return self._filter_items(data, propname)
+
+    def _filter_items(self, data, propname):
+        items = getattr(data, propname)
+        signature = (data.items_version, len(items), self.filter_name, self.use_filter_sort_alpha)
+        cached = _filter_cache.get(self.list_id)
+        if cached and cached[0] == signature:
+            return cached[1], cached[2]
+
+        helper = bpy.types.UI_UL_list
+        flt_flags = []
+        flt_neworder = []
+        if self.filter_name:
+            flt_flags = helper.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "current_name")
+        if not flt_flags:
+            flt_flags = [self.bitflag_filter_item] * len(items)
+        if self.use_filter_sort_alpha:
+            flt_neworder = helper.sort_items_by_name(items, "current_name")
+
+        _filter_cache[self.list_id] = (signature, flt_flags, flt_neworder)
+        return flt_flags, flt_neworder
+
+
+# ─────────── Pipeline Steps List ───────────
+class RENAMER_UL_PipelineSteps(UIList):
+    bl_idname = "RENAMER_UL_pipeline_steps"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "op", text="")
+        if item.op in {"prefix", "suffix", "strip"}:
+            row.prop(item, "text", text="")
+        elif item.op == "replace":
+            row.prop(item, "text", text="")
+            row.prop(item, "replace", text="")
+        elif item.op == "case":
+            row.prop(item, "case_mode", text="")
+        elif item.op == "sequence":
+            row.prop(item, "text", text="")
+            row.prop(item, "start", text="")
+
+
+def draw_pipeline(layout, props):
+    row = layout.row()
+    row.template_list("RENAMER_UL_pipeline_steps", "", props, "pipeline", props, "pipeline_index", rows=4)
+    col = row.column(align=True)
+    col.menu("RENAMER_MT_pipeline_add", text="", icon="ADD")
+    col.operator("renamer.pipeline_remove", text="", icon="REMOVE")
+    col.separator()
+    col.operator("renamer.pipeline_move", text="", icon="TRIA_UP").direction = "UP"
+    col.operator("renamer.pipeline_move", text="", icon="TRIA_DOWN").direction = "DOWN"
+
+    # Details of the active step
+    if 0 <= props.pipeline_index < len(props.pipeline):
+        step = props.pipeline[props.pipeline_index]
+        col = layout.column(align=True)
+        if step.op == "replace":
+            col.prop(step, "text", text="Find")
+            col.prop(step, "replace", text="Replace")
+            row = col.row(align=True)
+            row.prop(step, "match_mode", expand=True)
+            col.prop(step, "case_sensitive", toggle=True)
+        elif step.op == "sequence":
+            col.prop(step, "text", text="Base")
+            col.prop(step, "start", text="Start")
+            col.prop(step, "last", text="Last")
+            col.prop(step, "reverse", toggle=True)
+        elif step.op == "strip":
+            col.prop(step, "text", text="Characters")
+
+    layout.operator("renamer.apply_pipeline", text="Apply Pipeline", icon="PLAY")
+
+    row = layout.row(align=True)
+    row.prop(props, "pipeline_preset", text="")
+    row.operator("renamer.pipeline_preset_load", text="", icon="IMPORT")
+    row.operator("renamer.pipeline_preset_delete", text="", icon="TRASH")
+    row = layout.row(align=True)
+    row.prop(props, "pipeline_preset_name", text="")
+    row.operator("renamer.pipeline_preset_save", text="", icon="FILE_TICK")
+
+
+# ─────────── Rename History List ───────────
+class RENAMER_UL_Journal(UIList):
+    bl_idname = "RENAMER_UL_journal"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.active = not item.reverted
+        row.label(text=item.label, icon="LOOP_BACK" if item.reverted else "CHECKMARK")
+        row.label(text=f"{item.count} · {item.time}")
+
+
+def draw_journal(layout, props):
+    layout.template_list("RENAMER_UL_journal", "", props, "journal", props, "journal_index", rows=3)
+    row = layout.row(align=True)
+    op = row.operator("renamer.journal_replay", text="Revert", icon="LOOP_BACK")
+    op.index, op.revert = -1, True
+    op = row.operator("renamer.journal_replay", text="Re-apply", icon="LOOP_FORWARDS")
+    op.index, op.revert = -1, False
+    row.operator("renamer.journal_clear", text="", icon="TRASH")
+    layout.prop(props, "journal_limit")
+
+
+# ─────────── Naming Lint ───────────
+class RENAMER_UL_LintRules(UIList):
+    bl_idname = "RENAMER_UL_lint_rules"
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "check", text="")
+        if item.check != "side":
+            row.prop(item, "source_type", text="")
+        if item.check in {"prefix", "suffix", "pattern"}:
+            row.prop(item, "text", text="")
+
+
+def draw_lint(layout, props):
+    row = layout.row()
+    row.template_list("RENAMER_UL_lint_rules", "", props, "lint_rules", props, "lint_rule_index", rows=3)
+    col = row.column(align=True)
+    col.menu("RENAMER_MT_lint_rule_add", text="", icon="ADD")
+    col.operator("renamer.lint_rule_remove", text="", icon="REMOVE")
+    col.separator()
+    col.operator("renamer.lint", text="", icon="FILE_REFRESH")
+    if not props.lint_rules:
+        layout.operator("renamer.lint_rule_defaults", icon="PRESET")
+        return
+    if props.lint_status:
+        layout.label(text=props.lint_status, icon="ERROR" if props.lint_status.startswith("Invalid") else "INFO")
+
+    found = lint_results()
+    col = layout.column(align=True)
+    for index, (source_type, owner, name, message, fix) in enumerate(found[:LINT_SHOWN]):
+        row = col.row(align=True)
+        row.label(text=f"{owner} › {name}" if owner else name)
+        row.label(text=message)
+        sub = row.row(align=True)
+        sub.enabled = fix is not None
+        sub.operator("renamer.lint_fix", text="", icon="CHECKMARK").index = index
+    if len(found) > LINT_SHOWN:
+        col.label(text=f"… and {len(found) - LINT_SHOWN} more")
+    if found:
+        layout.operator("renamer.lint_fix", text="Fix All", icon="CHECKMARK").index = -1
+
+
+class RENAMER_MT_LintRuleAdd(Menu):
+    bl_idname = "RENAMER_MT_lint_rule_add"
+    bl_label = "Add Rule"
+
+    def draw(self, context):
+        self.layout.operator_enum("renamer.lint_rule_add", "check")
+
+
+class RENAMER_MT_PipelineAdd(Menu):
+    bl_idname = "RENAMER_MT_pipeline_add"
+    bl_label = "Add Step"
+
+    def draw(self, context):
+        self.layout.operator_enum("renamer.pipeline_add", "op")
+
+
+# ─────────── Diagnostics ───────────
+def draw_diagnostics(layout, props):
+    row = layout.row(align=True)
+    row.prop(props, "profiling_enabled", toggle=True)
+    row.prop(props, "profiling_cprofile", toggle=True)
+    if not props.profiling_enabled:
+        return
+
+    stats = profiling.snapshot()
+    col = layout.column(align=True)
+    header = col.row()
+    for text in ("Function", "Calls", "Total ms", "Max ms"):
+        header.label(text=text)
+    for timer in stats["timers"][:12]:
+        row = col.row()
+        row.label(text=timer["name"])
+        row.label(text=str(timer["calls"]))
+        row.label(text=f"{timer['total_ms']:.1f}")
+        row.label(text=f"{timer['max_ms']:.2f}")
+
+    col = layout.column(align=True)
+    for name, value in stats["counters"].items():
+        row = col.row()
+        row.label(text=name)
+        row.label(text=str(value))
+
+    row = layout.row(align=True)
+    row.operator("renamer.stats_reset", text="Reset", icon="FILE_REFRESH")
+    row.operator("renamer.stats_export", text="JSON", icon="EXPORT").format = "JSON"
+    sub = row.row(align=True)
+    sub.enabled = props.profiling_cprofile
+    sub.operator("renamer.stats_export", text="cProfile", icon="EXPORT").format = "PROFILE"
+
+
 # ─────────── Draw UI ───────────
 class RENAMER_PT_Panel(Panel):
     bl_label = "RENΔMER"
@@ -16,6 +256,10 @@ class RENAMER_PT_Panel(Panel):
     bl_category = "RENAMER"
 
     def draw(self, context):
+        with profiling.timer("panel.draw"):
+            self._draw(context)
+
+    def _draw(self, context):
         layout = self.layout
         props = context.scene.renamer_props
         sel_objs = context.selected_objects
@@ -32,13 +276,27 @@ class RENAMER_PT_Panel(Panel):
 
         layout.separator()
         # ─────────── Object Info
-        if len(sel_objs) == 1:
+        layout.row().prop(props, "scope", expand=True)
+        if props.scope == "FILE":
+            layout.prop(props, "datablock_type", text="Type")
+            row = layout.row(align=True)
+            row.prop(props, "file_filter", text="", icon="VIEWZOOM")
+            row.prop(props, "file_page_size", text="")
+            row = layout.row(align=True)
+            sub = row.row(align=True)
+            sub.enabled = props.file_page > 0
+            sub.operator("renamer.file_page", text="", icon="TRIA_LEFT").step = -1
+            row.label(text=f"Page {props.file_page + 1}")
+            sub = row.row(align=True)
+            sub.enabled = props.file_has_more
+            sub.operator("renamer.file_page", text="", icon="TRIA_RIGHT").step = 1
+        elif len(sel_objs) == 1:
             obj = sel_objs[0]
             layout.prop(props, "property_type", text="Property")
             layout.label(text=f"Selected: {obj.name} ({obj.type.title()})")
         else:
             layout.prop(props, "property_type", text="Property")
-            layout.label(text=f"{len(sel_objs)} objects selected — showing names")
+            layout.label(text=f"{len(sel_objs)} objects selected — shared names are grouped")
 
         layout.separator()
         # ─────────── Extras Section
@@ -82,6 +340,8 @@ class RENAMER_PT_Panel(Panel):
                 col.prop(props, "seq_start", text="Start")
                 col.separator()
                 col.prop(props, "seq_last", text="Last")
+                col.separator()
+                col.prop(props, "seq_order", text="Order")
 
                 col.separator()
                 row = col.row(align=True)
@@ -89,6 +349,55 @@ class RENAMER_PT_Panel(Panel):
                 row.separator()
                 row.operator("renamer.apply_sequence", text="Apply ↑").direction = "UP"
 
+            # ─────────── Find / Replace
+            replace_box = box.box()
+            row = replace_box.row(align=True)
+            row.prop(props, "show_replace", text="", icon="TRIA_DOWN" if props.show_replace else "TRIA_RIGHT", emboss=False)
+            row.label(text="Find / Replace")
+            if props.show_replace:
+                col = replace_box.column(align=True)
+                col.prop(props, "find_text", text="Find")
+                col.prop(props, "replace_text", text="Replace")
+                col.separator()
+                row = col.row(align=True)
+                row.prop(props, "find_mode", expand=True)
+                row = col.row(align=True)
+                row.prop(props, "find_case_sensitive", text="Match Case", toggle=True)
+                row.prop(props, "find_live", text="Live", toggle=True)
+                col.separator()
+                col.operator("renamer.find_replace", text="Apply Replace")
+                if props.find_status:
+                    col.label(text=props.find_status, icon="ERROR" if props.find_status.startswith("Invalid") else "INFO")
+
+            # ─────────── Pipeline
+            pipe_box = box.box()
+            row = pipe_box.row(align=True)
+            row.prop(props, "show_pipeline", text="", icon="TRIA_DOWN" if props.show_pipeline else "TRIA_RIGHT", emboss=False)
+            row.label(text="Pipeline")
+            if props.show_pipeline:
+                draw_pipeline(pipe_box, props)
+
+            # ─────────── Rename Map
+            map_box = box.box()
+            row = map_box.row(align=True)
+            row.prop(props, "show_maps", text="", icon="TRIA_DOWN" if props.show_maps else "TRIA_RIGHT", emboss=False)
+            row.label(text="Rename Map")
+            if props.show_maps:
+                col = map_box.column(align=True)
+                col.prop(props, "map_path", text="")
+                row = col.row(align=True)
+                row.operator("renamer.map_apply", text="Fill Table", icon="IMPORT")
+                row.operator("renamer.map_execute", text="Rename Now", icon="CHECKMARK")
+                col.operator("renamer.map_export", text="Export Plan", icon="EXPORT")
+
+            # ─────────── Naming Lint
+            lint_box = box.box()
+            row = lint_box.row(align=True)
+            row.prop(props, "show_lint", text="", icon="TRIA_DOWN" if props.show_lint else "TRIA_RIGHT", emboss=False)
+            row.label(text="Naming Lint")
+            if props.show_lint:
+                draw_lint(lint_box, props)
+
             # ─────────── Case Convertion
             row = layout.row(align=True)
             row.operator("renamer.case_conversion", text="UPPER").mode = "UPPER"
@@ -97,35 +406,88 @@ class RENAMER_PT_Panel(Panel):
             row.separator()
             row.operator("renamer.case_conversion", text="Title").mode = "TITLE"
 
+        # ─────────── Rename History
+        if props.journal:
+            journal_box = layout.box()
+            row = journal_box.row(align=True)
+            row.prop(props, "show_journal", text="", icon="TRIA_DOWN" if props.show_journal else "TRIA_RIGHT", emboss=False)
+            row.label(text=f"History ({len(props.journal)})")
+            if props.show_journal:
+                draw_journal(journal_box, props)
+
         # ─────────── Invert Selection
         inv_box = box.box()
         inv_box.operator("renamer.invert_selection", text="Invert Selection", icon="ARROW_LEFTRIGHT")
 
+        # ─────────── Search
+        row = layout.row(align=True)
+        row.prop(props, "search_text", text="", icon="VIEWZOOM")
+        row.prop(props, "search_mode", text="")
+        row.operator("renamer.search_select", text="", icon="ADD").action = "ADD"
+        row.operator("renamer.search_select", text="", icon="REMOVE").action = "REMOVE"
+        if props.search_status:
+            layout.label(text=props.search_status, icon="INFO")
+
         layout.separator()
         # ─────────── Table
-        if props.has_valid_items and len(props.items) > 0:
+        if props.has_valid_items and props.row_count > 0:
+            if props.row_count > props.window_size:
+                first = props.window_start
+                last = min(first + props.window_size, props.row_count)
+                row = layout.row(align=True)
+                sub = row.row(align=True)
+                sub.enabled = first > 0
+                sub.operator("renamer.table_page", text="", icon="TRIA_LEFT").step = -1
+                row.label(text=f"Rows {first + 1}–{last} of {props.row_count}")
+                sub = row.row(align=True)
+                sub.enabled = last < props.row_count
+                sub.operator("renamer.table_page", text="", icon="TRIA_RIGHT").step = 1
+                row.prop(props, "window_size", text="")
             header = layout.row()
             header.label(text="Current Name")
             header.label(text="New Name")
-            for idx, item in enumerate(props.items):
-                row = layout.row(align=True)
-                row.prop(item, "selected", text="")
-                row.label(text=item.current_name)
-                row.prop(item, "new_name", text="")
-                row.operator("renamer.mirror", text="", icon="ARROW_LEFTRIGHT").index = idx
-                row.operator("renamer.delete_item", text="", icon="X").index = idx
+            # Only the visible window of rows is drawn
+            layout.template_list("RENAMER_UL_items", "", props, "items", props, "active_index", rows=10)
         else:
             layout.label(text="No properties for this type")
 
+        if props.conflict_count:
+            warn = layout.row()
+            warn.alert = True
+            warn.label(text=f"{props.conflict_count} name(s) will collide or be truncated", icon="ERROR")
+        if props.mirror_unpaired or props.mirror_mismatched:
+            row = layout.row(align=True)
+            row.label(text=f"{props.mirror_unpaired} unpaired side(s), {props.mirror_mismatched} mismatched pair(s)", icon="MOD_MIRROR")
+            row.operator("renamer.mirror_select_issues", text="", icon="RESTRICT_SELECT_OFF")
+
         layout.separator()
+        # ─────────── Progress of a running execute / delete
+        if props.job_label:
+            col = layout.column(align=True)
+            col.label(text=props.job_label, icon="TIME")
+            row = col.row()
+            row.enabled = False
+            row.prop(props, "job_progress", text="", slider=True)
+
         # ─────────── Bottom Buttons
         row = layout.row(align=True)
+        row.prop(props, "mirror_sync", toggle=True)
+        row.prop(props, "repair_references", toggle=True)
+        row = layout.row(align=True)
         row.operator("renamer.execute", text="Execute", icon="CHECKMARK")
         row.separator()
         row.operator("renamer.clear", text="Clear", icon="TRASH")
         col = layout.column(align=True)
         col.operator("renamer.delete_item", text="Delete Selected", icon="X").index = -1
 
+        # ─────────── Diagnostics
+        diag_box = layout.box()
+        row = diag_box.row(align=True)
+        row.prop(props, "show_diagnostics", text="", icon="TRIA_DOWN" if props.show_diagnostics else "TRIA_RIGHT", emboss=False)
+        row.label(text="Diagnostics")
+        if props.show_diagnostics:
+            draw_diagnostics(diag_box, props)
+
         layout.separator()
         # ─────────── Support Section ───────────
         layout.separator()
@@ -135,8 +497,12 @@ class RENAMER_PT_Panel(Panel):
 
 
 # ─────────── Register/UnRegister ───────────
+classes = [RENAMER_UL_Items, RENAMER_UL_PipelineSteps, RENAMER_UL_Journal, RENAMER_UL_LintRules,
+           RENAMER_MT_PipelineAdd, RENAMER_MT_LintRuleAdd, RENAMER_PT_Panel]
+
 def register():
-    bpy.utils.register_class(RENAMER_PT_Panel)
+    for cls in classes: bpy.utils.register_class(cls)
 
 def unregister():
-    bpy.utils.unregister_class(RENAMER_PT_Panel)
\ No newline at end of file
+    for cls in reversed(classes): bpy.utils.unregister_class(cls)
+    _filter_cache.clear()
\ No newline at end of file
@@ -1,7 +1,57 @@
 import re
+from functools import lru_cache
 
 
 # ─────────── Manage Mirror ───────────
+# Long-word tokens, swapped only when bounded by start/end or a non-letter/digit
+_MIRROR_LONG_PAIRS = [
+    ("Left", "Right"),
+    ("left", "right"),
+    ("LEFT", "RIGHT"),
+    ("Lt", "Rt"),
+    ("lt", "rt"),
+    ("LT", "RT"),
+    ("Lf", "Rf"),
+    ("lf", "rf"),
+    ("LF", "RF"),
+]
+
+# Short letter variants, swapped only after a '.' or '_' separator
+_MIRROR_SHORT_PAIRS = [
+    ("L", "R"),
+    ("l", "r"),
+]
+
+_MIRROR_CACHE_SIZE = 8192
+
+
+def _build_mirror_table(pairs):
+    table = {}
+    for l, r in pairs:
+        table[l] = r
+        table[r] = l
+    return table
+
+
+_MIRROR_LONG_TABLE = _build_mirror_table(_MIRROR_LONG_PAIRS)
+_MIRROR_SHORT_TABLE = _build_mirror_table(_MIRROR_SHORT_PAIRS)
+_MIRROR_TABLE = {**_MIRROR_LONG_TABLE, **_MIRROR_SHORT_TABLE}
+
+# One alternation for every token: separators are lookarounds, so they are never
+# consumed and neighbouring tokens can share a separator.
+_MIRROR_RE = re.compile(
+    r"(?<![A-Za-z0-9])(?:"
+    + "|".join(re.escape(t) for t in sorted(_MIRROR_LONG_TABLE, key=len, reverse=True))
+    + r")(?![A-Za-z0-9])"
+    + r"|(?<=[._])[" + "".join(_MIRROR_SHORT_TABLE) + r"]\b"
+)
+
+
+def _swap_token(match):
+    return _MIRROR_TABLE[match.group(0)]
+
+
+@lru_cache(maxsize=_MIRROR_CACHE_SIZE)
 def mirror_name(name: str) -> str:
     """
     Mirrors left/right identifiers used in Blender naming conventions.
@@ -13,49 +63,58 @@ def mirror_name(name: str) -> str:
         - .Left / _Left <-> .Right / _Right
         - Lt <-> Rt, Lf <-> Rf
     """
-    # Long-word tokens to protect first
-    long_pairs = [
-        ("Left", "Right"),
-        ("left", "right"),
-        ("LEFT", "RIGHT"),
-        ("Lt", "Rt"),
-        ("lt", "rt"),
-        ("LT", "RT"),
-        ("Lf", "Rf"),
-        ("lf", "rf"),
-        ("LF", "RF"),
-    ]
-
-    # Separator boundaries (start, end, or non-letter/digit)
-    sep_before = r"(^|[^A-Za-z0-9])"
-    sep_after = r"([^A-Za-z0-9]|$)"
-
-    # Phase 1: protect left tokens with placeholders
-    for idx, (l, r) in enumerate(long_pairs):
-        placeholder = f"__TMP_{idx}__"
-        name = re.sub(sep_before + re.escape(l) + sep_after,
-                      lambda m: m.group(1) + placeholder + m.group(2),
-                      name)
-        # swap right to left
-        name = re.sub(sep_before + re.escape(r) + sep_after,
-                      lambda m: m.group(1) + l + m.group(2),
-                      name)
-        # restore placeholder → right
-        name = name.replace(placeholder, r)
-
-    # Phase 2: suffix and short letter variants
-    suffix_patterns = [
-        (r"([._])L(\b|$)", r"\1__TMP_R__\2"),
-        (r"([._])R(\b|$)", r"\1L\2"),
-        (r"__TMP_R__", "R"),
-
-        (r"([._])l(\b|$)", r"\1__TMP_r__\2"),
-        (r"([._])r(\b|$)", r"\1l\2"),
-        (r"__TMP_r__", "r"),
-    ]
-    for pat, rep in suffix_patterns:
-        name = re.sub(pat, rep, name)
-    return name
+    return _MIRROR_RE.sub(_swap_token, name)
+
+
+def mirror_names(names) -> list:
+    """
+    Batch version of mirror_name for whole tables.
+    Results are memoized (bounded), so repeated names are swapped only once.
+    """
+    return [mirror_name(name) for name in names]
+
+
+# ─────────── Manage Find / Replace ───────────
+_PATTERN_CACHE_SIZE = 32
+
+
+def _glob_to_regex(pattern: str) -> str:
+    # Wildcards become groups, so the replacement can reuse them as \1, \2, ...
+    parts = []
+    for ch in pattern:
+        if ch == "*": parts.append("(.*)")
+        elif ch == "?": parts.append("(.)")
+        else: parts.append(re.escape(ch))
+    return "^" + "".join(parts) + r"\Z"
+
+
+@lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, mode: str = "LITERAL", case_sensitive: bool = True):
+    r"""
+    Compile a find pattern once; recently used patterns stay cached.
+    Modes:
+      - LITERAL: plain substring
+      - REGEX: Python regular expression, replacement may use \1 / \g<name>
+      - GLOB: whole-name match with * and ?, each wildcard is a capture group
+    Raises re.error for an invalid regex.
+    """
+    mode = mode.upper()
+    if mode == "REGEX": source = pattern
+    elif mode == "GLOB": source = _glob_to_regex(pattern)
+    else: source = re.escape(pattern)
+    return re.compile(source, 0 if case_sensitive else re.IGNORECASE)
+
+
+def replacer(replacement: str, mode: str = "LITERAL"):
+    """Replacement for Pattern.sub: taken verbatim in LITERAL mode, group references otherwise."""
+    if mode.upper() == "LITERAL":
+        return lambda match: replacement
+    return replacement
+
+
+def find_replace(name: str, pattern: str, replacement: str, mode: str = "LITERAL", case_sensitive: bool = True) -> str:
+    if not pattern: return name
+    return compile_pattern(pattern, mode, case_sensitive).sub(replacer(replacement, mode), name)
 
 
 # ─────────── Manage Case ───────────